@@ -0,0 +1,32 @@
+"""add_exceptions_dataset_model_created_index
+
+Revision ID: 726f4fdc7231
+Revises: 5a5d45c79acc
+Create Date: 2026-10-17 09:12:41.502113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '726f4fdc7231'
+down_revision: Union[str, None] = '5a5d45c79acc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves SQLiteExceptionsRepo.list: filter by dataset (and model), newest first
+    op.create_index(
+        'ix_exceptions_dataset_model_created',
+        'exceptions',
+        ['dataset_id', 'model', sa.text('created_at DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_exceptions_dataset_model_created', table_name='exceptions')
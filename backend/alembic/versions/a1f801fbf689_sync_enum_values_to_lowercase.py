@@ -7,7 +7,8 @@ Create Date: 2025-10-19 12:50:02.345272
 """
 from __future__ import annotations
 
-from typing import Iterable, Sequence, Union
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
@@ -51,6 +52,50 @@ LOG_LEVEL_OLD = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
 LOG_LEVEL_NEW = ("debug", "info", "warning", "error", "critical")
 
 
+def _case_function(values: Iterable[str]) -> str:
+    """SQL function that maps stored values onto the casing of ``values``.
+
+    upgrade() targets lowercase labels; downgrade() targets the original
+    uppercase ones, so it must not reuse LOWER().
+    """
+    return "LOWER" if all(value == value.lower() for value in values) else "UPPER"
+
+
+def _already_converted(
+    dialect: str,
+    table: str,
+    column: str,
+    enum_name: str,
+    new_values: Iterable[str],
+) -> bool:
+    """Return True when the column already matches the target enum.
+
+    Makes retries after a partial run (or runs against an already converted
+    database) cost one SELECT per column instead of a table rewrite.
+    """
+    bind = op.get_bind()
+    if dialect == "postgresql":
+        # Rows alone can't tell: an empty table still needs its type swapped.
+        labels = bind.execute(
+            sa.text(
+                "SELECT e.enumlabel FROM pg_enum e "
+                "JOIN pg_type t ON t.oid = e.enumtypid WHERE t.typname = :name"
+            ),
+            {"name": enum_name},
+        ).scalars().all()
+        return set(labels) == set(new_values)
+
+    # SQLite stores the enum as plain VARCHAR; only the data needs converting.
+    case_fn = _case_function(new_values)
+    mismatch = bind.execute(
+        sa.text(
+            f"SELECT 1 FROM {table} "
+            f"WHERE {column} IS NOT NULL AND {column} != {case_fn}({column}) LIMIT 1"
+        )
+    ).first()
+    return mismatch is None
+
+
 def _convert_enum_to_lowercase_sqlite(
     table: str,
     column: str,
@@ -59,24 +104,17 @@ def _convert_enum_to_lowercase_sqlite(
     new_values: Iterable[str],
     nullable: bool,
 ) -> None:
-    """Rebuild column constraint for SQLite by hopping through plain String."""
-    with op.batch_alter_table(table) as batch_op:
-        batch_op.alter_column(
-            column,
-            existing_type=sa.Enum(*old_values, name=enum_name),
-            type_=sa.String(),
-            existing_nullable=nullable,
-            nullable=nullable,
-        )
-
-    op.execute(sa.text(f"UPDATE {table} SET {column} = LOWER({column}) WHERE {column} IS NOT NULL"))
+    """Rewrite values in place, then rebuild the column constraint in a single table copy."""
+    case_fn = _case_function(new_values)
+    op.execute(sa.text(f"UPDATE {table} SET {column} = {case_fn}({column}) WHERE {column} IS NOT NULL"))
 
-    new_enum = sa.Enum(*new_values, name=enum_name)
-    with op.batch_alter_table(table) as batch_op:
+    # The UPDATE runs before the rebuild so the INSERT ... SELECT into the new
+    # table already carries the normalised values (one copy instead of two).
+    with op.batch_alter_table(table, recreate="always") as batch_op:
         batch_op.alter_column(
             column,
-            existing_type=sa.String(),
-            type_=new_enum,
+            existing_type=sa.Enum(*old_values, name=enum_name),
+            type_=sa.Enum(*new_values, name=enum_name),
             existing_nullable=nullable,
             nullable=nullable,
         )
@@ -96,11 +134,12 @@ def _convert_enum_to_lowercase_postgres(
     temp_enum = sa.Enum(*new_values, name=temp_enum_name)
     temp_enum.create(bind, checkfirst=True)
 
-    # Cast existing values to text, normalise casing, then to the temp enum.
-    op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE TEXT")
-    op.execute(f"UPDATE {table} SET {column} = LOWER({column}) WHERE {column} IS NOT NULL")
+    # Normalise casing and cast to the temp enum in one ALTER, so the table is
+    # rewritten once. Nullability is preserved across ALTER COLUMN TYPE.
+    case_fn = _case_function(new_values)
     op.execute(
-        f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {temp_enum_name} USING {column}::{temp_enum_name}"
+        f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {temp_enum_name} "
+        f"USING ({case_fn}({column}::text)::{temp_enum_name})"
     )
 
     # Drop the old enum and rename the temp one so the column keeps the original type name.
@@ -108,13 +147,9 @@ def _convert_enum_to_lowercase_postgres(
     old_enum.drop(bind, checkfirst=True)
     op.execute(f"ALTER TYPE {temp_enum_name} RENAME TO {enum_name}")
 
-    if not nullable:
-        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET NOT NULL")
-    else:
-        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP NOT NULL")
-
 
 def _convert_enum_to_lowercase(
+    dialect: str,
     table: str,
     column: str,
     enum_name: str,
@@ -122,7 +157,9 @@ def _convert_enum_to_lowercase(
     new_values: Iterable[str],
     nullable: bool = False,
 ) -> None:
-    dialect = op.get_bind().dialect.name
+    if _already_converted(dialect, table, column, enum_name, new_values):
+        return
+
     if dialect == "postgresql":
         _convert_enum_to_lowercase_postgres(table, column, enum_name, old_values, new_values, nullable)
     else:
@@ -130,77 +167,110 @@ def _convert_enum_to_lowercase(
         _convert_enum_to_lowercase_sqlite(table, column, enum_name, old_values, new_values, nullable)
 
 
+@contextmanager
+def _enum_migration_transaction(dialect: str) -> Iterator[None]:
+    """Run every column conversion as one atomic unit.
+
+    On SQLite each batch rebuild is a full table copy; relaxing ``synchronous``
+    for the duration lets the rebuilds share a single fsync at commit time.
+    On PostgreSQL the savepoint keeps the temp-enum/ALTER/RENAME burst atomic.
+    """
+    bind = op.get_bind()
+    is_sqlite = dialect == "sqlite"
+    if is_sqlite:
+        previous_synchronous = bind.exec_driver_sql("PRAGMA synchronous").scalar()
+        bind.exec_driver_sql("PRAGMA synchronous=OFF")
+    try:
+        with bind.begin_nested():
+            yield
+    finally:
+        if is_sqlite:
+            bind.exec_driver_sql(f"PRAGMA synchronous={int(previous_synchronous)}")
+
+
 def upgrade() -> None:
-    _convert_enum_to_lowercase(
-        table="mappings",
-        column="status",
-        enum_name="mappingstatus",
-        old_values=MAPPING_STATUS_OLD,
-        new_values=MAPPING_STATUS_NEW,
-        nullable=False,
-    )
+    dialect = op.get_bind().dialect.name
+    with _enum_migration_transaction(dialect):
+        _convert_enum_to_lowercase(
+            dialect,
+            table="mappings",
+            column="status",
+            enum_name="mappingstatus",
+            old_values=MAPPING_STATUS_OLD,
+            new_values=MAPPING_STATUS_NEW,
+            nullable=False,
+        )
 
-    _convert_enum_to_lowercase(
-        table="relationships",
-        column="match_on",
-        enum_name="matchstrategy",
-        old_values=MATCH_STRATEGY_OLD,
-        new_values=MATCH_STRATEGY_NEW,
-        nullable=False,
-    )
+        _convert_enum_to_lowercase(
+            dialect,
+            table="relationships",
+            column="match_on",
+            enum_name="matchstrategy",
+            old_values=MATCH_STRATEGY_OLD,
+            new_values=MATCH_STRATEGY_NEW,
+            nullable=False,
+        )
 
-    _convert_enum_to_lowercase(
-        table="runs",
-        column="status",
-        enum_name="runstatus",
-        old_values=RUN_STATUS_OLD,
-        new_values=RUN_STATUS_NEW,
-        nullable=False,
-    )
+        _convert_enum_to_lowercase(
+            dialect,
+            table="runs",
+            column="status",
+            enum_name="runstatus",
+            old_values=RUN_STATUS_OLD,
+            new_values=RUN_STATUS_NEW,
+            nullable=False,
+        )
 
-    _convert_enum_to_lowercase(
-        table="run_logs",
-        column="level",
-        enum_name="loglevel",
-        old_values=LOG_LEVEL_OLD,
-        new_values=LOG_LEVEL_NEW,
-        nullable=False,
-    )
+        _convert_enum_to_lowercase(
+            dialect,
+            table="run_logs",
+            column="level",
+            enum_name="loglevel",
+            old_values=LOG_LEVEL_OLD,
+            new_values=LOG_LEVEL_NEW,
+            nullable=False,
+        )
 
 
 def downgrade() -> None:
-    _convert_enum_to_lowercase(
-        table="run_logs",
-        column="level",
-        enum_name="loglevel",
-        old_values=LOG_LEVEL_NEW,
-        new_values=LOG_LEVEL_OLD,
-        nullable=False,
-    )
+    dialect = op.get_bind().dialect.name
+    with _enum_migration_transaction(dialect):
+        _convert_enum_to_lowercase(
+            dialect,
+            table="run_logs",
+            column="level",
+            enum_name="loglevel",
+            old_values=LOG_LEVEL_NEW,
+            new_values=LOG_LEVEL_OLD,
+            nullable=False,
+        )
 
-    _convert_enum_to_lowercase(
-        table="runs",
-        column="status",
-        enum_name="runstatus",
-        old_values=RUN_STATUS_NEW,
-        new_values=RUN_STATUS_OLD,
-        nullable=False,
-    )
+        _convert_enum_to_lowercase(
+            dialect,
+            table="runs",
+            column="status",
+            enum_name="runstatus",
+            old_values=RUN_STATUS_NEW,
+            new_values=RUN_STATUS_OLD,
+            nullable=False,
+        )
 
-    _convert_enum_to_lowercase(
-        table="relationships",
-        column="match_on",
-        enum_name="matchstrategy",
-        old_values=MATCH_STRATEGY_NEW,
-        new_values=MATCH_STRATEGY_OLD,
-        nullable=False,
-    )
+        _convert_enum_to_lowercase(
+            dialect,
+            table="relationships",
+            column="match_on",
+            enum_name="matchstrategy",
+            old_values=MATCH_STRATEGY_NEW,
+            new_values=MATCH_STRATEGY_OLD,
+            nullable=False,
+        )
 
-    _convert_enum_to_lowercase(
-        table="mappings",
-        column="status",
-        enum_name="mappingstatus",
-        old_values=MAPPING_STATUS_NEW,
-        new_values=MAPPING_STATUS_OLD,
-        nullable=False,
-    )
+        _convert_enum_to_lowercase(
+            dialect,
+            table="mappings",
+            column="status",
+            enum_name="mappingstatus",
+            old_values=MAPPING_STATUS_NEW,
+            new_values=MAPPING_STATUS_OLD,
+            nullable=False,
+        )
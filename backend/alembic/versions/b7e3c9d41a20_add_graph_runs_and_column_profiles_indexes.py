@@ -0,0 +1,42 @@
+"""add_graph_runs_and_column_profiles_indexes
+
+Revision ID: b7e3c9d41a20
+Revises: 726f4fdc7231
+Create Date: 2026-10-17 14:03:27.318540
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3c9d41a20'
+down_revision: Union[str, None] = '726f4fdc7231'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves GraphService.list_run_rows: filter by graph, newest first.
+    # Supersedes the single-column graph_id index.
+    op.create_index(
+        'ix_graph_runs_graph_started',
+        'graph_runs',
+        ['graph_id', sa.text('started_at DESC')],
+        unique=False,
+    )
+    op.drop_index('ix_graph_runs_graph_id', table_name='graph_runs')
+
+    # Profiles are always fetched per sheet (selectinload, column-name joins)
+    op.create_index(op.f('ix_column_profiles_sheet_id'), 'column_profiles', ['sheet_id'], unique=False)
+
+    # Refresh planner statistics so the new indexes are picked up
+    op.execute('ANALYZE')
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_column_profiles_sheet_id'), table_name='column_profiles')
+    op.create_index('ix_graph_runs_graph_id', 'graph_runs', ['graph_id'], unique=False)
+    op.drop_index('ix_graph_runs_graph_started', table_name='graph_runs')
@@ -0,0 +1,27 @@
+"""add_transform_mapping_order_index
+
+Revision ID: c41f8a2e9d57
+Revises: b7e3c9d41a20
+Create Date: 2026-10-17 16:21:08.904112
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41f8a2e9d57'
+down_revision: Union[str, None] = 'b7e3c9d41a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Transform chains are loaded and appended to per mapping, in order
+    op.create_index('ix_transform_mapping_order', 'transforms', ['mapping_id', 'order'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transform_mapping_order', table_name='transforms')
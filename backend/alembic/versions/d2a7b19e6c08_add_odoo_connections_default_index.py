@@ -0,0 +1,38 @@
+"""add_odoo_connections_default_index
+
+Revision ID: d2a7b19e6c08
+Revises: c41f8a2e9d57
+Create Date: 2026-10-17 17:02:45.117306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a7b19e6c08'
+down_revision: Union[str, None] = 'c41f8a2e9d57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep only the newest default before enforcing uniqueness
+    op.execute(
+        "UPDATE odoo_connections SET is_default = false "
+        "WHERE is_default AND id <> (SELECT MAX(id) FROM odoo_connections WHERE is_default)"
+    )
+    op.create_index(
+        'ux_odoo_connections_default',
+        'odoo_connections',
+        ['is_default'],
+        unique=True,
+        postgresql_where=sa.text('is_default'),
+        sqlite_where=sa.text('is_default'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ux_odoo_connections_default', table_name='odoo_connections')
@@ -0,0 +1,34 @@
+"""add_odoo_connections_active_index
+
+Revision ID: e5c3f08a7b12
+Revises: d2a7b19e6c08
+Create Date: 2026-10-17 18:11:52.640378
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5c3f08a7b12'
+down_revision: Union[str, None] = 'd2a7b19e6c08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Connection listings page through active rows in id order
+    op.create_index(
+        'ix_odoo_connections_active',
+        'odoo_connections',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+        sqlite_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_odoo_connections_active', table_name='odoo_connections')
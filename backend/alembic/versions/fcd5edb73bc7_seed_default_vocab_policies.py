@@ -18,6 +18,24 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+# Statements are built once at import and reused for every parameter set
+POLICY_UPSERT = sa.text("""
+    INSERT INTO vocab_policies (model, company_id, default_policy, requires_approval, created_at, updated_at, company_overrides)
+    VALUES (:model, :company_id, :policy, :requires_approval, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, '{}')
+    ON CONFLICT (model, company_id) DO UPDATE
+    SET default_policy = EXCLUDED.default_policy,
+        requires_approval = EXCLUDED.requires_approval,
+        updated_at = CURRENT_TIMESTAMP
+""").bindparams(sa.bindparam('requires_approval', type_=sa.Boolean()))
+
+ALIAS_UPSERT = sa.text("""
+    INSERT INTO vocab_aliases (model, field, alias, canonical_value, company_id, created_at)
+    VALUES (:model, :field, :alias, :canonical, :company_id, CURRENT_TIMESTAMP)
+    ON CONFLICT (model, field, alias, company_id) DO UPDATE
+    SET canonical_value = EXCLUDED.canonical_value
+""")
+
+
 def upgrade() -> None:
     # Seed default vocab policies based on ONTOLOGY.md
     conn = op.get_bind()
@@ -41,21 +59,16 @@ def upgrade() -> None:
         ('res.partner.category', None, 'create_if_missing', False, 'Low risk, m2m friendly'),
     ]
 
-    # Insert policies
-    for model, company_id, policy, requires_approval, description in default_policies:
-        conn.execute(sa.text("""
-            INSERT INTO vocab_policies (model, company_id, default_policy, requires_approval, created_at, updated_at, company_overrides)
-            VALUES (:model, :company_id, :policy, :requires_approval, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, '{}')
-            ON CONFLICT (model, company_id) DO UPDATE
-            SET default_policy = EXCLUDED.default_policy,
-                requires_approval = EXCLUDED.requires_approval,
-                updated_at = CURRENT_TIMESTAMP
-        """), {
+    # Insert policies (single executemany round-trip)
+    conn.execute(POLICY_UPSERT, [
+        {
             'model': model,
             'company_id': company_id,
             'policy': policy,
             'requires_approval': requires_approval
-        })
+        }
+        for model, company_id, policy, requires_approval, _description in default_policies
+    ])
 
     # Seed common aliases
     common_aliases = [
@@ -72,21 +85,17 @@ def upgrade() -> None:
         ('utm.source', 'name', 'li', 'linkedin', None),
     ]
 
-    # Insert aliases
-    for model, field, alias, canonical, company_id in common_aliases:
-        conn.execute(sa.text("""
-            INSERT INTO vocab_aliases (model, field, alias, canonical_value, company_id, created_at)
-            VALUES (:model, :field, :alias, :canonical, :company_id, CURRENT_TIMESTAMP)
-            ON CONFLICT (model, field, alias, company_id) DO UPDATE
-            SET canonical_value = EXCLUDED.canonical_value
-        """), {
+    # Insert aliases (single executemany round-trip)
+    conn.execute(ALIAS_UPSERT, [
+        {
             'model': model,
             'field': field,
             'alias': alias,
             'canonical': canonical,
             'company_id': company_id
-        })
-
+        }
+        for model, field, alias, canonical, company_id in common_aliases
+    ])
 
 def downgrade() -> None:
     # Remove seeded policies and aliases
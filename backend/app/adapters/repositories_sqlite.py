@@ -4,12 +4,79 @@ SQLite implementations of repository interfaces.
 Lean stack implementation using SQLAlchemy + SQLite.
 Easy migration path to Postgres (same SQLAlchemy API).
 """
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from pathlib import Path
+from sqlalchemy import Text, cast, delete, func, select
 from sqlalchemy.orm import Session
 import polars as pl
 from app.ports.repositories import ExceptionsRepo, DatasetsRepo
-from app.models import Exception, Dataset
+from app.models import Exception as ExceptionRecord, Dataset
+
+# Rows removed per DELETE when clearing exceptions
+CLEAR_BATCH_SIZE = 5000
+
+
+def _load_csv(
+    file_path: Path, sheet_name: Optional[str], columns: Optional[Tuple[str, ...]]
+) -> pl.DataFrame:
+    # Lazy scan so a column projection is pushed down into the reader
+    lazy = pl.scan_csv(file_path)
+    if columns is not None:
+        lazy = lazy.select(columns)
+    return lazy.collect()
+
+
+def _load_parquet(
+    file_path: Path, sheet_name: Optional[str], columns: Optional[Tuple[str, ...]]
+) -> pl.DataFrame:
+    lazy = pl.scan_parquet(file_path)
+    if columns is not None:
+        lazy = lazy.select(columns)
+    return lazy.collect()
+
+
+def _load_excel(
+    file_path: Path, sheet_name: Optional[str], columns: Optional[Tuple[str, ...]]
+) -> pl.DataFrame:
+    # calamine (fastexcel) parses natively into Arrow buffers, avoiding
+    # openpyxl's per-cell Python objects and any pandas round-trip.
+    if sheet_name:
+        df = pl.read_excel(file_path, sheet_name=sheet_name, engine="calamine")
+    else:
+        # Read first sheet (sheet_id=0 would return every sheet as a dict)
+        df = pl.read_excel(file_path, sheet_id=1, engine="calamine")
+    return df.select(columns) if columns is not None else df
+
+
+# File-type dispatch on the lower-cased suffix
+_LOADERS: Dict[str, Callable[[Path, Optional[str], Optional[Tuple[str, ...]]], pl.DataFrame]] = {
+    ".csv": _load_csv,
+    ".xlsx": _load_excel,
+    ".xls": _load_excel,
+    ".parquet": _load_parquet,
+}
+
+
+@lru_cache(maxsize=32)
+def _read_frame(
+    path: str,
+    mtime_ns: int,
+    sheet_name: Optional[str],
+    columns: Optional[Tuple[str, ...]] = None,
+) -> pl.DataFrame:
+    """
+    Parse a dataset file into a DataFrame.
+
+    ``mtime_ns`` is unused in the body; it is part of the cache key so a
+    rewritten file is re-parsed instead of served stale.
+    """
+    file_path = Path(path)
+
+    loader = _LOADERS.get(file_path.suffix.lower())
+    if loader is None:
+        raise ValueError(f"Unsupported file format: {file_path.suffix}")
+    return loader(file_path, sheet_name, columns)
 
 
 class SQLiteExceptionsRepo(ExceptionsRepo):
@@ -28,7 +95,7 @@ class SQLiteExceptionsRepo(ExceptionsRepo):
         offending: Dict[str, Any],
     ) -> int:
         """Add a new exception record."""
-        exception = Exception(
+        exception = ExceptionRecord(
             dataset_id=dataset_id,
             model=model,
             row_ptr=row_ptr,
@@ -41,49 +108,118 @@ class SQLiteExceptionsRepo(ExceptionsRepo):
         return exception.id
 
     def list(
-        self, dataset_id: int, model: Optional[str] = None
+        self,
+        dataset_id: int,
+        model: Optional[str] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """List exceptions for a dataset."""
-        query = self.db.query(Exception).filter(Exception.dataset_id == dataset_id)
+        return self._list(ExceptionRecord.offending, dataset_id, model, skip, limit)
+
+    def list_raw(
+        self,
+        dataset_id: int,
+        model: Optional[str] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List exceptions for a dataset with ``offending`` left as raw JSON text.
+
+        For callers that re-serialise straight into a response body: the
+        stored JSON is passed through untouched instead of being parsed into
+        dicts and dumped again.
+        """
+        return self._list(
+            cast(ExceptionRecord.offending, Text).label("offending"), dataset_id, model, skip, limit
+        )
+
+    def _list(
+        self,
+        offending,
+        dataset_id: int,
+        model: Optional[str],
+        skip: int,
+        limit: Optional[int],
+    ) -> List[Dict[str, Any]]:
+        """Shared listing query; ``offending`` selects the column as JSON or raw text."""
+        # Core select: rows come straight off the cursor as mappings,
+        # skipping ORM hydration and identity-map bookkeeping.
+        stmt = select(
+            ExceptionRecord.id,
+            ExceptionRecord.dataset_id,
+            ExceptionRecord.model,
+            ExceptionRecord.row_ptr,
+            ExceptionRecord.error_code,
+            ExceptionRecord.hint,
+            offending,
+            ExceptionRecord.created_at,
+        ).where(ExceptionRecord.dataset_id == dataset_id)
 
         if model:
-            query = query.filter(Exception.model == model)
-
-        exceptions = query.order_by(Exception.created_at.desc()).all()
-
-        return [
-            {
-                "id": exc.id,
-                "dataset_id": exc.dataset_id,
-                "model": exc.model,
-                "row_ptr": exc.row_ptr,
-                "error_code": exc.error_code,
-                "hint": exc.hint,
-                "offending": exc.offending,
-                "created_at": exc.created_at.isoformat(),
-            }
-            for exc in exceptions
-        ]
-
-    def clear(self, dataset_id: int, model: Optional[str] = None) -> int:
-        """Clear exceptions for a dataset."""
-        query = self.db.query(Exception).filter(Exception.dataset_id == dataset_id)
+            stmt = stmt.where(ExceptionRecord.model == model)
+
+        rows = self.db.execute(self._page(stmt, skip, limit)).mappings()
+
+        exceptions = []
+        for row in rows:
+            exc = dict(row)
+            exc["created_at"] = exc["created_at"].isoformat()
+            exceptions.append(exc)
+        return exceptions
+
+    @staticmethod
+    def _page(stmt, skip: int, limit: Optional[int]):
+        """Order newest first (id breaks created_at ties) and apply the page window."""
+        stmt = stmt.order_by(
+            ExceptionRecord.created_at.desc(), ExceptionRecord.id.desc()
+        ).offset(skip)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return stmt
+
+    def clear(
+        self,
+        dataset_id: int,
+        model: Optional[str] = None,
+        batch_size: int = CLEAR_BATCH_SIZE,
+    ) -> int:
+        """
+        Clear exceptions for a dataset.
 
+        Deletes in batches of ``batch_size`` ids and commits after each one,
+        so a large clear never holds the database write lock for long.
+        """
+        ids = select(ExceptionRecord.id).where(ExceptionRecord.dataset_id == dataset_id)
         if model:
-            query = query.filter(Exception.model == model)
+            ids = ids.where(ExceptionRecord.model == model)
+        stmt = delete(ExceptionRecord).where(
+            ExceptionRecord.id.in_(ids.limit(batch_size).scalar_subquery())
+        )
 
-        count = query.delete()
-        self.db.flush()
-        return count
+        # Bulk DELETE; nothing is loaded into the session to be expired first
+        deleted = 0
+        while True:
+            result = self.db.execute(stmt, execution_options={"synchronize_session": False})
+            self.db.commit()
+            deleted += result.rowcount
+            if result.rowcount < batch_size:
+                return deleted
 
     def count(self, dataset_id: int, model: Optional[str] = None) -> int:
         """Count exceptions for a dataset."""
-        query = self.db.query(Exception).filter(Exception.dataset_id == dataset_id)
+        # Flat SELECT COUNT(*) ... WHERE, rather than Query.count()'s subquery wrap
+        stmt = (
+            select(func.count())
+            .select_from(ExceptionRecord)
+            .where(ExceptionRecord.dataset_id == dataset_id)
+        )
 
         if model:
-            query = query.filter(Exception.model == model)
+            stmt = stmt.where(ExceptionRecord.model == model)
 
-        return query.count()
+        return self.db.execute(stmt).scalar_one()
 
 
 class SQLiteDatasetsRepo(DatasetsRepo):
@@ -93,14 +229,19 @@ class SQLiteDatasetsRepo(DatasetsRepo):
         self.db = db
 
     def get_dataframe(
-        self, dataset_id: int, sheet_name: Optional[str] = None
+        self,
+        dataset_id: int,
+        sheet_name: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
     ) -> pl.DataFrame:
         """
         Get DataFrame for a dataset.
 
         Prefers cleaned data if available, falls back to raw data.
+        When ``columns`` is given only those columns are parsed.
         """
-        dataset = self.db.query(Dataset).filter(Dataset.id == dataset_id).first()
+        # Session.get() is served from the identity map on repeat lookups
+        dataset = self.db.get(Dataset, dataset_id)
         if not dataset:
             raise ValueError(f"Dataset {dataset_id} not found")
 
@@ -112,35 +253,15 @@ class SQLiteDatasetsRepo(DatasetsRepo):
         else:
             raise ValueError(f"Dataset {dataset_id} has no data file available")
 
-        # Load data based on file type
-        if file_path.suffix.lower() in [".csv"] or ".csv" in file_path.name:
-            return pl.read_csv(file_path)
-        elif file_path.suffix.lower() in [".xlsx", ".xls"] or any(
-            ext in file_path.name for ext in [".xlsx", ".xls"]
-        ):
-            # For Excel, read specific sheet if provided
-            if sheet_name:
-                try:
-                    return pl.read_excel(file_path, sheet_name=sheet_name)
-                except Exception:
-                    # Fallback to pandas
-                    import pandas as pd
-
-                    pandas_df = pd.read_excel(file_path, sheet_name=sheet_name)
-                    return pl.from_pandas(pandas_df)
-            else:
-                # Read first sheet
-                try:
-                    sheets = pl.read_excel(file_path, sheet_id=0)
-                    return sheets
-                except Exception:
-                    # Fallback to pandas
-                    import pandas as pd
-
-                    pandas_df = pd.read_excel(file_path)
-                    return pl.from_pandas(pandas_df)
-        else:
-            raise ValueError(f"Unsupported file format: {file_path.suffix}")
+        # Cached per file version: the mtime key invalidates automatically
+        # when the cleaned file is rewritten. Clone is a cheap Arc copy that
+        # keeps callers from mutating the cached frame in place.
+        return _read_frame(
+            str(file_path),
+            file_path.stat().st_mtime_ns,
+            sheet_name,
+            tuple(columns) if columns is not None else None,
+        ).clone()
 
     def put_artifact(self, dataset_id: int, name: str, path: str) -> None:
         """Store artifact metadata for a dataset."""
@@ -1,22 +1,43 @@
 """
 Inline task runner implementation.
 
-Lean stack implementation using direct execution or threading.
+Lean stack implementation using direct execution or a background event loop.
 Easy migration path to Celery for distributed execution.
 """
+import asyncio
+import functools
+import threading
 import uuid
+from dataclasses import dataclass
 from typing import Any, Callable, Optional, Dict
-from concurrent.futures import ThreadPoolExecutor, Future
+from concurrent.futures import ThreadPoolExecutor, Future, wait
 from app.ports.tasks import TaskRunner, TaskStatus
 
 
+@dataclass(slots=True)
+class _Task:
+    """
+    Per-task bookkeeping (slotted: no per-instance __dict__).
+
+    Inline tasks record status/result/error directly; threaded tasks derive
+    them from ``future``.
+    """
+
+    status: TaskStatus
+    result: Any = None
+    error: Optional[str] = None
+    future: Optional[Future] = None
+
+
 class InlineTaskRunner(TaskRunner):
     """
     Inline/threaded task execution.
 
     Modes:
     - inline: Execute immediately in current thread (default)
-    - thread: Execute in background thread pool
+    - thread: Execute on a background event loop. Coroutine functions are
+      awaited natively on the loop thread; blocking callables are handed to
+      the loop's executor via run_in_executor.
     """
 
     def __init__(self, mode: str = "inline", max_workers: int = 4):
@@ -25,13 +46,26 @@ class InlineTaskRunner(TaskRunner):
 
         Args:
             mode: Execution mode ("inline" or "thread")
-            max_workers: Max thread pool workers (only for thread mode)
+            max_workers: Max executor threads for blocking callables (only for thread mode)
         """
         self.mode = mode
-        self.executor = (
-            ThreadPoolExecutor(max_workers=max_workers) if mode == "thread" else None
-        )
-        self._tasks: Dict[str, Dict[str, Any]] = {}
+        self._tasks: Dict[str, _Task] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+
+        if mode == "thread":
+            self._loop = asyncio.new_event_loop()
+            self._loop.set_default_executor(ThreadPoolExecutor(max_workers=max_workers))
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever, name="inline-task-loop", daemon=True
+            )
+            self._loop_thread.start()
+
+    async def _run(self, func: Callable, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        """Await coroutine functions on the loop; offload blocking callables."""
+        if asyncio.iscoroutinefunction(func):
+            return await func(*args, **kwargs)
+        return await self._loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
 
     def submit(
         self,
@@ -47,39 +81,17 @@ class InlineTaskRunner(TaskRunner):
             # Execute immediately
             try:
                 result = func(*args, **kwargs)
-                self._tasks[task_id] = {
-                    "status": TaskStatus.COMPLETED,
-                    "result": result,
-                    "error": None,
-                }
+                self._tasks[task_id] = _Task(status=TaskStatus.COMPLETED, result=result)
             except Exception as e:
-                self._tasks[task_id] = {
-                    "status": TaskStatus.FAILED,
-                    "result": None,
-                    "error": str(e),
-                }
+                self._tasks[task_id] = _Task(status=TaskStatus.FAILED, error=str(e))
         else:
-            # Execute in thread pool
-            self._tasks[task_id] = {
-                "status": TaskStatus.RUNNING,
-                "result": None,
-                "error": None,
-                "future": None,
-            }
-
-            def _wrapper():
-                try:
-                    result = func(*args, **kwargs)
-                    self._tasks[task_id]["status"] = TaskStatus.COMPLETED
-                    self._tasks[task_id]["result"] = result
-                    return result
-                except Exception as e:
-                    self._tasks[task_id]["status"] = TaskStatus.FAILED
-                    self._tasks[task_id]["error"] = str(e)
-                    raise
-
-            future = self.executor.submit(_wrapper)
-            self._tasks[task_id]["future"] = future
+            # Execute on the background event loop. Completion state lives in
+            # the future alone (set atomically when it resolves), so the loop
+            # thread never writes into _tasks.
+            future = asyncio.run_coroutine_threadsafe(
+                self._run(func, args, kwargs), self._loop
+            )
+            self._tasks[task_id] = _Task(status=TaskStatus.RUNNING, future=future)
 
         return task_id
 
@@ -88,7 +100,16 @@ class InlineTaskRunner(TaskRunner):
         if task_id not in self._tasks:
             raise ValueError(f"Task {task_id} not found")
 
-        return self._tasks[task_id]["status"]
+        task = self._tasks[task_id]
+        future = task.future
+        if future is None:
+            return task.status
+
+        if not future.done():
+            return TaskStatus.RUNNING
+        if future.cancelled() or future.exception() is not None:
+            return TaskStatus.FAILED
+        return TaskStatus.COMPLETED
 
     def result(self, task_id: str, timeout: Optional[float] = None) -> Any:
         """Get task result (blocking)."""
@@ -97,24 +118,31 @@ class InlineTaskRunner(TaskRunner):
 
         task = self._tasks[task_id]
 
-        if task["status"] == TaskStatus.FAILED:
-            raise RuntimeError(f"Task failed: {task['error']}")
-
-        if task["status"] == TaskStatus.COMPLETED:
-            return task["result"]
-
-        # Wait for completion (thread mode only)
-        if self.mode == "thread" and "future" in task:
-            future: Future = task["future"]
+        # Thread mode: wait on the future
+        if task.future is not None:
             try:
-                return future.result(timeout=timeout)
+                return task.future.result(timeout=timeout)
             except Exception as e:
                 raise RuntimeError(f"Task failed: {e}")
 
-        # For inline mode, should already be completed
-        return task["result"]
+        # Inline mode: already completed
+        if task.status == TaskStatus.FAILED:
+            raise RuntimeError(f"Task failed: {task.error}")
+
+        return task.result
 
     def shutdown(self):
-        """Shutdown executor (cleanup)."""
-        if self.executor:
-            self.executor.shutdown(wait=True)
+        """Wait for in-flight tasks, then stop the event loop (cleanup)."""
+        if self._loop is None:
+            return
+
+        pending = [task.future for task in self._tasks.values() if task.future is not None]
+        wait(pending)
+
+        asyncio.run_coroutine_threadsafe(
+            self._loop.shutdown_default_executor(), self._loop
+        ).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
+        self._loop = None
@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import StreamingResponse
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.core.field_detector import FieldTypeDetector
@@ -11,13 +12,22 @@ router = APIRouter()
 
 
 @router.get("/mappings/{mapping_id}/suggest-field-type", response_model=FieldTypeSuggestion)
-async def suggest_field_type(
+def suggest_field_type(
     mapping_id: int,
     column_profile_id: int,
     db: Session = Depends(get_db)
 ):
     """Suggest Odoo field type for a column based on its profile."""
-    profile = db.query(ColumnProfile).filter(ColumnProfile.id == column_profile_id).first()
+    # Read-only projection: Core row, no ORM hydration or identity-map entry
+    profile = db.execute(
+        select(
+            ColumnProfile.dtype_guess,
+            ColumnProfile.patterns,
+            ColumnProfile.null_pct,
+            ColumnProfile.distinct_pct,
+            ColumnProfile.sample_values,
+        ).where(ColumnProfile.id == column_profile_id)
+    ).first()
     if not profile:
         raise HTTPException(status_code=404, detail="Column profile not found")
 
@@ -29,7 +39,10 @@ async def suggest_field_type(
         sample_values=profile.sample_values or []
     )
 
-    return suggestion
+    return Response(
+        content=FieldTypeSuggestion(**suggestion).model_dump_json(),
+        media_type="application/json",
+    )
 
 
 @router.post("/datasets/{dataset_id}/addon/generate")
@@ -40,10 +53,13 @@ async def generate_addon(
     """Generate Odoo addon module from custom field mappings."""
     try:
         generator = OdooAddonGenerator(db)
-        zip_buffer = generator.generate_addon(dataset_id)
+        # DB query + zip assembly are blocking; keep them off the event loop
+        zip_buffer = await asyncio.to_thread(generator.generate_addon, dataset_id)
 
-        return StreamingResponse(
-            zip_buffer,
+        # Send the finished archive as one body (iterating a BytesIO in a
+        # StreamingResponse would split binary data on newline bytes)
+        return Response(
+            content=zip_buffer.getvalue(),
             media_type="application/zip",
             headers={
                 "Content-Disposition": f"attachment; filename=custom_fields_migration.zip"
@@ -54,7 +70,7 @@ async def generate_addon(
 
 
 @router.get("/datasets/{dataset_id}/addon/instructions")
-async def get_installation_instructions(
+def get_installation_instructions(
     dataset_id: int,
     db: Session = Depends(get_db)
 ):
@@ -1,15 +1,19 @@
 """
 AI Assistant API endpoints - Bridge between web chat and MCP tools
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+from functools import lru_cache
 import httpx
 import json
+import orjson
+import re
 import subprocess
 import asyncio
 from app.core.database import get_db
+from app.core.http_cache import cached_json_response
 
 router = APIRouter()
 
@@ -25,6 +29,114 @@ class ChatResponse(BaseModel):
     suggestions: Optional[list] = None
 
 
+# Keyword -> tag table for intent routing. Keywords are matched as plain
+# substrings of the lowercased message, so "show" also yields "how".
+_INTENT_KEYWORDS = {
+    "dataset": "dataset",
+    "list": "query",
+    "what": "query",
+    "show": "query",
+    "template": "template",
+    "map": "mapping",
+    "mapping": "mapping",
+    "error": "error",
+    "fail": "error",
+    "problem": "error",
+    "field": "field",
+    "res.partner": "partner",
+    "transform": "transform",
+    "help": "help",
+    "how": "help",
+}
+
+# Intents in priority order, each with the tags it requires.
+_INTENT_RULES = [
+    ("list_datasets", {"dataset", "query"}),
+    ("templates", {"template"}),
+    ("mapping", {"mapping"}),
+    ("errors", {"error"}),
+    ("partner_fields", {"field", "partner"}),
+    ("transforms", {"transform"}),
+    ("help", {"help"}),
+]
+
+# Single-pass scanner over all keywords. The lookahead lets overlapping
+# keywords ("show"/"how") each register a hit.
+_INTENT_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(k) for k in sorted(_INTENT_KEYWORDS, key=len, reverse=True)) + "))"
+)
+
+
+def classify_intent(message: str) -> Optional[str]:
+    """Return the highest-priority intent whose keywords all appear in a lowercased message."""
+    hits = {_INTENT_KEYWORDS[m.group(1)] for m in _INTENT_PATTERN.finditer(message)}
+    return next((intent for intent, required in _INTENT_RULES if required <= hits), None)
+
+
+# Static reply texts, built once rather than concatenated on every chat turn
+_MAPPING_STEPS_TEXT = (
+    "\n\nTo map fields:\n"
+    "1. Click on a column header\n"
+    "2. Select the target Odoo field\n"
+    "3. Apply any necessary transforms"
+)
+
+_IMPORT_FAILED_TEXT = (
+    "Your last import failed. Common issues:\n"
+    "• Missing required fields - Make sure all required fields are mapped\n"
+    "• Invalid data formats - Apply appropriate transforms\n"
+    "• Duplicate records - Check for unique constraints\n"
+)
+
+_PARTNER_FIELDS_TEXT = (
+    "Key fields for res.partner (Contacts):\n"
+    "• **name** (required) - Contact/company name\n"
+    "• **email** - Email address\n"
+    "• **phone** - Phone number\n"
+    "• **street**, **city**, **zip** - Address fields\n"
+    "• **is_company** - Set to true for companies\n"
+    "• **customer_rank** - Set >0 for customers\n"
+    "• **supplier_rank** - Set >0 for vendors"
+)
+
+_TRANSFORMS_TEXT = (
+    "Available data transforms:\n"
+    "• **trim** - Remove extra whitespace\n"
+    "• **phone_normalize** - Format phone numbers\n"
+    "• **email_normalize** - Clean email addresses\n"
+    "• **currency_to_float** - Convert $1,234.56 to 1234.56\n"
+    "• **split_name** - Split 'John Doe' into first/last\n"
+    "• **titlecase** - Capitalize names properly"
+)
+
+_HELP_TEXT = (
+    "I can help you with:\n\n"
+    "📊 **Datasets** - 'Show my datasets', 'What data do I have?'\n"
+    "🗂️ **Templates** - 'What templates are available?'\n"
+    "🔄 **Mapping** - 'How do I map fields?', 'Help with mapping'\n"
+    "📝 **Odoo Models** - 'What fields does res.partner have?'\n"
+    "🔧 **Transforms** - 'What transforms are available?'\n"
+    "❌ **Errors** - 'Why did my import fail?'\n\n"
+    "Just ask me anything about your data migration!"
+)
+
+_DEFAULT_TEXT = (
+    "I'm here to help with your data migration. You can ask me about:\n"
+    "• Your datasets and their structure\n"
+    "• Available import templates\n"
+    "• Field mapping suggestions\n"
+    "• Odoo model documentation\n"
+    "• Troubleshooting import errors\n\n"
+    "What would you like to know?"
+)
+
+_DEFAULT_SUGGESTIONS = (
+    "Try: 'Show my datasets'",
+    "Try: 'What templates are available?'",
+    "Try: 'How do I map customer data?'"
+)
+
+
 @router.post("/assistant/chat", response_model=ChatResponse)
 async def chat_with_assistant(request: ChatRequest, db: Session = Depends(get_db)):
     """
@@ -36,6 +148,7 @@ async def chat_with_assistant(request: ChatRequest, db: Session = Depends(get_db
 
     message = request.message.lower()
     context = request.context or {}
+    intent = classify_intent(message)
 
     # Route to appropriate MCP tool based on message content
     response_text = ""
@@ -44,7 +157,7 @@ async def chat_with_assistant(request: ChatRequest, db: Session = Depends(get_db
 
     try:
         # Analyze intent
-        if "dataset" in message and ("list" in message or "what" in message or "show" in message):
+        if intent == "list_datasets":
             # Call list_datasets tool
             datasets = await call_mcp_tool("list_datasets")
             tools_used.append("list_datasets")
@@ -52,26 +165,32 @@ async def chat_with_assistant(request: ChatRequest, db: Session = Depends(get_db
             if datasets and "datasets" in datasets:
                 dataset_list = datasets["datasets"]
                 if dataset_list:
-                    response_text = f"You have {len(dataset_list)} dataset(s):\n"
-                    for ds in dataset_list:
-                        response_text += f"• {ds['name']} (ID: {ds['id']}) - {len(ds.get('sheets', []))} sheets\n"
+                    parts = [f"You have {len(dataset_list)} dataset(s):\n"]
+                    parts.extend(
+                        f"• {ds['name']} (ID: {ds['id']}) - {len(ds.get('sheets', []))} sheets\n"
+                        for ds in dataset_list
+                    )
+                    response_text = "".join(parts)
                 else:
                     response_text = "You haven't uploaded any datasets yet. Click 'Upload New File' to get started."
             else:
                 response_text = "I couldn't retrieve your datasets. Make sure the backend is running."
 
-        elif "template" in message:
+        elif intent == "templates":
             # Call list_templates tool
             templates = await call_mcp_tool("list_templates")
             tools_used.append("list_templates")
 
             if templates:
-                response_text = "Available import templates:\n"
-                for template in templates[:5]:  # Show top 5
-                    response_text += f"• **{template['name']}** - {template['description']} ({template['modelCount']} models)\n"
+                parts = ["Available import templates:\n"]
+                parts.extend(
+                    f"• **{template['name']}** - {template['description']} ({template['modelCount']} models)\n"
+                    for template in templates[:5]  # Show top 5
+                )
+                response_text = "".join(parts)
                 suggestions.append("Click on a template in the QuickStart section to begin")
 
-        elif "map" in message or "mapping" in message:
+        elif intent == "mapping":
             # Provide mapping guidance
             dataset_id = context.get("datasetId")
 
@@ -85,88 +204,61 @@ async def chat_with_assistant(request: ChatRequest, db: Session = Depends(get_db
                 else:
                     response_text = "No mappings configured yet. "
 
-                response_text += "\n\nTo map fields:\n"
-                response_text += "1. Click on a column header\n"
-                response_text += "2. Select the target Odoo field\n"
-                response_text += "3. Apply any necessary transforms"
+                response_text += _MAPPING_STEPS_TEXT
 
                 suggestions.append("Use 'Generate Mappings' for automatic suggestions")
 
-        elif "error" in message or "fail" in message or "problem" in message:
-            # Analyze errors
-            import_history = await call_mcp_tool("get_import_history", {"limit": 1})
-            tools_used.append("get_import_history")
+        elif intent == "errors":
+            # Analyze errors - fetch history and the current dataset's mappings together
+            dataset_id = context.get("datasetId")
+            specs = [("get_import_history", {"limit": 1})]
+            if dataset_id:
+                specs.append(("get_current_mappings", {"dataset_id": dataset_id}))
+            import_history, *rest = await call_tools(*specs)
+            tools_used.extend(name for name, _ in specs)
+            mappings = rest[0] if rest else None
 
             if import_history and "runs" in import_history and import_history["runs"]:
                 last_run = import_history["runs"][0]
                 if last_run.get("status") == "failed":
-                    response_text = f"Your last import failed. Common issues:\n"
-                    response_text += "• Missing required fields - Make sure all required fields are mapped\n"
-                    response_text += "• Invalid data formats - Apply appropriate transforms\n"
-                    response_text += "• Duplicate records - Check for unique constraints\n"
+                    parts = [_IMPORT_FAILED_TEXT]
+
+                    if mappings and mappings.get("total") == 0:
+                        parts.append("• This dataset has no field mappings yet - generate them before importing\n")
 
                     if last_run.get("error_message"):
-                        response_text += f"\nSpecific error: {last_run['error_message'][:200]}"
+                        parts.append(f"\nSpecific error: {last_run['error_message'][:200]}")
+
+                    response_text = "".join(parts)
                 else:
                     response_text = "Your last import was successful!"
             else:
                 response_text = "No import history found. Make sure to map your fields and run an import."
 
-        elif "field" in message and "res.partner" in message:
+        elif intent == "partner_fields":
             # Get Odoo field info
             fields = await call_mcp_tool("get_odoo_field_info", {"model": "res.partner"})
             tools_used.append("get_odoo_field_info")
 
-            response_text = "Key fields for res.partner (Contacts):\n"
-            response_text += "• **name** (required) - Contact/company name\n"
-            response_text += "• **email** - Email address\n"
-            response_text += "• **phone** - Phone number\n"
-            response_text += "• **street**, **city**, **zip** - Address fields\n"
-            response_text += "• **is_company** - Set to true for companies\n"
-            response_text += "• **customer_rank** - Set >0 for customers\n"
-            response_text += "• **supplier_rank** - Set >0 for vendors"
+            response_text = _PARTNER_FIELDS_TEXT
 
-        elif "transform" in message:
+        elif intent == "transforms":
             # List transforms
             transforms = await call_mcp_tool("get_available_transforms")
             tools_used.append("get_available_transforms")
 
-            response_text = "Available data transforms:\n"
-            response_text += "• **trim** - Remove extra whitespace\n"
-            response_text += "• **phone_normalize** - Format phone numbers\n"
-            response_text += "• **email_normalize** - Clean email addresses\n"
-            response_text += "• **currency_to_float** - Convert $1,234.56 to 1234.56\n"
-            response_text += "• **split_name** - Split 'John Doe' into first/last\n"
-            response_text += "• **titlecase** - Capitalize names properly"
+            response_text = _TRANSFORMS_TEXT
 
             suggestions.append("Click the transform icon next to a field mapping to apply")
 
-        elif "help" in message or "how" in message:
+        elif intent == "help":
             # General help
-            response_text = "I can help you with:\n\n"
-            response_text += "📊 **Datasets** - 'Show my datasets', 'What data do I have?'\n"
-            response_text += "🗂️ **Templates** - 'What templates are available?'\n"
-            response_text += "🔄 **Mapping** - 'How do I map fields?', 'Help with mapping'\n"
-            response_text += "📝 **Odoo Models** - 'What fields does res.partner have?'\n"
-            response_text += "🔧 **Transforms** - 'What transforms are available?'\n"
-            response_text += "❌ **Errors** - 'Why did my import fail?'\n\n"
-            response_text += "Just ask me anything about your data migration!"
+            response_text = _HELP_TEXT
 
         else:
             # Default response with context-aware suggestions
-            response_text = "I'm here to help with your data migration. You can ask me about:\n"
-            response_text += "• Your datasets and their structure\n"
-            response_text += "• Available import templates\n"
-            response_text += "• Field mapping suggestions\n"
-            response_text += "• Odoo model documentation\n"
-            response_text += "• Troubleshooting import errors\n\n"
-            response_text += "What would you like to know?"
-
-            suggestions = [
-                "Try: 'Show my datasets'",
-                "Try: 'What templates are available?'",
-                "Try: 'How do I map customer data?'"
-            ]
+            response_text = _DEFAULT_TEXT
+            suggestions = list(_DEFAULT_SUGGESTIONS)
 
     except Exception as e:
         response_text = f"I encountered an error while processing your request: {str(e)}\n"
@@ -179,57 +271,125 @@ async def chat_with_assistant(request: ChatRequest, db: Session = Depends(get_db
     )
 
 
+MCP_BASE_URL = "http://localhost:8888/api/v1"
+
+# Shared client so MCP hops reuse pooled keep-alive connections instead of
+# opening a new connection per tool call. Created lazily on first use and
+# closed on application shutdown via close_mcp_client().
+_MCP_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_mcp_client() -> httpx.AsyncClient:
+    global _MCP_CLIENT
+    if _MCP_CLIENT is None or _MCP_CLIENT.is_closed:
+        _MCP_CLIENT = httpx.AsyncClient(
+            base_url=MCP_BASE_URL,
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+    return _MCP_CLIENT
+
+
+async def close_mcp_client() -> None:
+    """Close the shared MCP HTTP client, if one was created."""
+    global _MCP_CLIENT
+    if _MCP_CLIENT is not None:
+        await _MCP_CLIENT.aclose()
+        _MCP_CLIENT = None
+
+
 async def call_mcp_tool(tool_name: str, params: Optional[Dict] = None) -> Dict:
     """
     Call an MCP tool via subprocess or HTTP.
 
     This is a simplified version - in production, you'd want to:
     1. Use a proper MCP client library
-    2. Cache connections
-    3. Handle streaming responses
+    2. Handle streaming responses
     """
 
     # For now, directly call the API endpoints that MCP would call
     # This bypasses MCP but gives the same functionality
 
-    BASE_URL = "http://localhost:8888/api/v1"
+    client = _get_mcp_client()
+    try:
+        if tool_name == "list_datasets":
+            response = await client.get("/datasets")
+            return response.json()
 
-    async with httpx.AsyncClient() as client:
-        try:
-            if tool_name == "list_datasets":
-                response = await client.get(f"{BASE_URL}/datasets")
-                return response.json()
+        elif tool_name == "list_templates":
+            response = await client.get("/templates")
+            return response.json()
 
-            elif tool_name == "list_templates":
-                response = await client.get(f"{BASE_URL}/templates")
-                return response.json()
+        elif tool_name == "get_current_mappings" and params and "dataset_id" in params:
+            response = await client.get(f"/datasets/{params['dataset_id']}/mappings")
+            return response.json()
 
-            elif tool_name == "get_current_mappings" and params and "dataset_id" in params:
-                response = await client.get(f"{BASE_URL}/datasets/{params['dataset_id']}/mappings")
-                return response.json()
+        elif tool_name == "get_import_history":
+            limit = params.get("limit", 10) if params else 10
+            response = await client.get("/runs", params={"limit": limit})
+            return response.json()
 
-            elif tool_name == "get_import_history":
-                limit = params.get("limit", 10) if params else 10
-                response = await client.get(f"{BASE_URL}/runs", params={"limit": limit})
-                return response.json()
+        elif tool_name == "get_odoo_field_info" and params and "model" in params:
+            response = await client.get(f"/odoo/models/{params['model']}/fields")
+            return response.json()
 
-            elif tool_name == "get_odoo_field_info" and params and "model" in params:
-                response = await client.get(f"{BASE_URL}/odoo/models/{params['model']}/fields")
-                return response.json()
+        elif tool_name == "get_available_transforms":
+            response = await client.get("/transforms/available")
+            return response.json()
 
-            elif tool_name == "get_available_transforms":
-                response = await client.get(f"{BASE_URL}/transforms/available")
-                return response.json()
+        else:
+            return {"error": f"Unknown tool: {tool_name}"}
 
-            else:
-                return {"error": f"Unknown tool: {tool_name}"}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+async def call_tools(*specs: Tuple[str, Optional[Dict]]) -> List[Dict]:
+    """
+    Call several MCP tools concurrently.
+
+    Each spec is a ``(tool_name, params)`` pair; results are returned in the
+    same order. call_mcp_tool already turns failures into ``{"error": ...}``
+    payloads, so one failing tool does not cancel the others.
+    """
+    return await asyncio.gather(*(call_mcp_tool(name, params) for name, params in specs))
 
-        except Exception as e:
-            return {"error": str(e)}
+
+def _suggestions_body(suggestions: List[Dict[str, str]]) -> bytes:
+    return orjson.dumps({"suggestions": suggestions})
+
+
+# Page suggestions that never vary, serialised once at import time
+_UPLOAD_SUGGESTIONS_BODY = _suggestions_body([
+    {"text": "Supported formats: CSV, Excel", "action": "info"},
+    {"text": "Make sure first row contains headers", "action": "tip"},
+    {"text": "Maximum file size: 100MB", "action": "info"}
+])
+_HOME_SUGGESTIONS_BODY = _suggestions_body([
+    {"text": "Upload your first dataset", "action": "navigate", "target": "/upload"},
+    {"text": "Explore templates", "action": "scroll", "target": "#quickstart"},
+    {"text": "Learn about field mapping", "action": "help", "topic": "mapping"}
+])
+_MAPPINGS_SUGGESTIONS_BODY = _suggestions_body([
+    {"text": "Required fields must be mapped", "action": "tip"},
+    {"text": "Use transforms for data cleaning", "action": "help", "topic": "transforms"},
+    {"text": "Check field types match", "action": "tip"}
+])
+_EMPTY_SUGGESTIONS_BODY = _suggestions_body([])
+
+
+@lru_cache(maxsize=256)
+def _dataset_suggestions_body(dataset_id: int) -> bytes:
+    return _suggestions_body([
+        {"text": "Generate automatic mappings", "action": "button", "target": "generate_mappings"},
+        {"text": "View data quality report", "action": "navigate", "target": f"/datasets/{dataset_id}/quality"},
+        {"text": "Apply transforms to clean data", "action": "help", "topic": "transforms"}
+    ])
 
 
 @router.get("/assistant/suggestions")
 async def get_contextual_suggestions(
+    request: Request,
     page: str,
     dataset_id: Optional[int] = None,
     db: Session = Depends(get_db)
@@ -237,31 +397,15 @@ async def get_contextual_suggestions(
     """
     Get context-aware suggestions based on current page.
     """
-    suggestions = []
-
     if page == "/":
-        suggestions = [
-            {"text": "Upload your first dataset", "action": "navigate", "target": "/upload"},
-            {"text": "Explore templates", "action": "scroll", "target": "#quickstart"},
-            {"text": "Learn about field mapping", "action": "help", "topic": "mapping"}
-        ]
+        body = _HOME_SUGGESTIONS_BODY
     elif page == "/upload":
-        suggestions = [
-            {"text": "Supported formats: CSV, Excel", "action": "info"},
-            {"text": "Make sure first row contains headers", "action": "tip"},
-            {"text": "Maximum file size: 100MB", "action": "info"}
-        ]
+        body = _UPLOAD_SUGGESTIONS_BODY
     elif "/datasets/" in page and dataset_id:
-        suggestions = [
-            {"text": "Generate automatic mappings", "action": "button", "target": "generate_mappings"},
-            {"text": "View data quality report", "action": "navigate", "target": f"/datasets/{dataset_id}/quality"},
-            {"text": "Apply transforms to clean data", "action": "help", "topic": "transforms"}
-        ]
+        body = _dataset_suggestions_body(dataset_id)
     elif "/mappings" in page:
-        suggestions = [
-            {"text": "Required fields must be mapped", "action": "tip"},
-            {"text": "Use transforms for data cleaning", "action": "help", "topic": "transforms"},
-            {"text": "Check field types match", "action": "tip"}
-        ]
+        body = _MAPPINGS_SUGGESTIONS_BODY
+    else:
+        body = _EMPTY_SUGGESTIONS_BODY
 
-    return {"suggestions": suggestions}
\ No newline at end of file
+    return cached_json_response(request, body)
\ No newline at end of file
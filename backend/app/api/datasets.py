@@ -1,18 +1,53 @@
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Query, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.http_cache import cached_json_response
 from app.services.dataset_service import DatasetService
 from app.services.mapping_service import MappingService
 from app.schemas.dataset import DatasetCreate, DatasetResponse, DatasetListResponse
 from app.field_mapper.core.module_registry import get_module_registry
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from urllib.parse import quote
 import polars as pl
+import asyncio
 import json
+import orjson
 
 router = APIRouter()
 
+# Rows read and serialised per step when streaming export-for-odoo
+EXPORT_BATCH_SIZE = 5000
+
+
+def _x_accel_response(file_path: Path, filename: str):
+    """
+    Build an empty response that tells nginx to serve ``file_path`` itself.
+
+    Returns None when X-Accel is disabled or the file lives outside
+    STORAGE_PATH (nginx can only see the aliased storage tree).
+    """
+    if not settings.X_ACCEL_ENABLED:
+        return None
+
+    try:
+        rel_path = file_path.resolve().relative_to(Path(settings.STORAGE_PATH).resolve())
+    except ValueError:
+        return None
+
+    return Response(
+        status_code=200,
+        headers={
+            "X-Accel-Redirect": settings.X_ACCEL_PREFIX.rstrip("/") + "/" + quote(rel_path.as_posix()),
+            "Content-Disposition": f"attachment; filename*=utf-8''{quote(filename)}",
+        },
+        media_type="application/octet-stream",
+    )
+
 
 @router.post("/datasets/upload")
 async def upload_dataset(
@@ -38,7 +73,7 @@ async def upload_dataset(
 
 
 @router.get("/datasets", response_model=DatasetListResponse)
-async def list_datasets(
+def list_datasets(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
@@ -46,11 +81,17 @@ async def list_datasets(
     """List all datasets."""
     service = DatasetService(db)
     datasets = service.list_datasets(skip=skip, limit=limit)
-    return {"datasets": datasets, "total": len(datasets)}
+    # Serialise straight from the ORM rows in pydantic-core rather than
+    # validating the return value and re-encoding it through jsonable_encoder
+    payload = DatasetListResponse(
+        datasets=[DatasetResponse.model_validate(d) for d in datasets],
+        total=len(datasets),
+    )
+    return Response(content=payload.model_dump_json(), media_type="application/json")
 
 
 @router.get("/datasets/{dataset_id}", response_model=DatasetResponse)
-async def get_dataset(dataset_id: int, db: Session = Depends(get_db)):
+def get_dataset(dataset_id: int, db: Session = Depends(get_db)):
     """Get a specific dataset by ID."""
     service = DatasetService(db)
     dataset = service.get_dataset(dataset_id)
@@ -60,7 +101,7 @@ async def get_dataset(dataset_id: int, db: Session = Depends(get_db)):
 
 
 @router.delete("/datasets/{dataset_id}")
-async def delete_dataset(dataset_id: int, db: Session = Depends(get_db)):
+def delete_dataset(dataset_id: int, db: Session = Depends(get_db)):
     """Delete a dataset and all associated data."""
     service = DatasetService(db)
     success = service.delete_dataset(dataset_id)
@@ -69,13 +110,13 @@ async def delete_dataset(dataset_id: int, db: Session = Depends(get_db)):
     return {"status": "deleted"}
 
 
-@router.get("/modules")
-async def get_available_modules():
-    """Get all available Odoo module groups for selection."""
+@lru_cache(maxsize=1)
+def _available_modules_body() -> bytes:
+    """Serialised module group listing; the registry is a static singleton."""
     registry = get_module_registry()
     groups = registry.get_all_groups()
 
-    return {
+    return orjson.dumps({
         "modules": [
             {
                 "name": g.name,
@@ -87,49 +128,49 @@ async def get_available_modules():
             }
             for g in groups
         ]
-    }
+    })
+
+
+@router.get("/modules")
+async def get_available_modules(request: Request):
+    """Get all available Odoo module groups for selection."""
+    return cached_json_response(request, _available_modules_body(), max_age=300)
 
 
 @router.post("/datasets/{dataset_id}/modules")
-async def set_dataset_modules(
+def set_dataset_modules(
     dataset_id: int,
     modules: List[str],
     db: Session = Depends(get_db)
 ):
     """Set selected modules for a dataset to improve field mapping accuracy."""
-    service = DatasetService(db)
-    dataset = service.get_dataset(dataset_id)
-    if not dataset:
-        raise HTTPException(status_code=404, detail="Dataset not found")
-
-    # Validate module names
+    # Validate module names against the registry's name index before any DB work
     registry = get_module_registry()
-    valid_modules = {g.name for g in registry.get_all_groups()}
-    invalid_modules = set(modules) - valid_modules
+    invalid_modules = list(dict.fromkeys(m for m in modules if registry.get_group(m) is None))
 
     if invalid_modules:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid module names: {list(invalid_modules)}"
+            detail=f"Invalid module names: {invalid_modules}"
         )
 
-    # Update dataset
-    dataset.selected_modules = modules
-    db.commit()
+    service = DatasetService(db)
+    if not service.set_selected_modules(dataset_id, modules):
+        raise HTTPException(status_code=404, detail="Dataset not found")
 
     # Calculate how many models this reduces to
-    selected_models = registry.get_models_for_groups(modules)
+    selected_models = registry.get_models_for_groups(modules) if modules else frozenset()
 
     return {
         "dataset_id": dataset_id,
         "selected_modules": modules,
         "model_count": len(selected_models),
-        "models": list(selected_models)[:20]  # Show first 20 models
+        "models": list(islice(selected_models, 20))  # Show first 20 models
     }
 
 
 @router.get("/datasets/{dataset_id}/modules")
-async def get_dataset_modules(dataset_id: int, db: Session = Depends(get_db)):
+def get_dataset_modules(dataset_id: int, db: Session = Depends(get_db)):
     """Get selected modules for a dataset."""
     service = DatasetService(db)
     dataset = service.get_dataset(dataset_id)
@@ -137,37 +178,31 @@ async def get_dataset_modules(dataset_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Dataset not found")
 
     registry = get_module_registry()
-    selected_models = []
+    selected_models = frozenset()
 
     if dataset.selected_modules:
-        selected_models = list(registry.get_models_for_groups(dataset.selected_modules))
+        selected_models = registry.get_models_for_groups(dataset.selected_modules)
 
     return {
         "dataset_id": dataset_id,
         "selected_modules": dataset.selected_modules or [],
         "detected_domain": dataset.detected_domain,
         "model_count": len(selected_models),
-        "models": selected_models[:20]  # Show first 20 models
+        "models": list(islice(selected_models, 20))  # Show first 20 models
     }
 
 
 @router.post("/datasets/{dataset_id}/suggest-modules")
-async def suggest_modules_for_dataset(
+def suggest_modules_for_dataset(
     dataset_id: int,
     db: Session = Depends(get_db)
 ):
     """Suggest appropriate modules based on dataset columns."""
     service = DatasetService(db)
-    dataset = service.get_dataset(dataset_id)
-    if not dataset:
+    column_names = service.get_column_names(dataset_id)
+    if column_names is None:
         raise HTTPException(status_code=404, detail="Dataset not found")
 
-    # Get column names from all sheets
-    column_names = []
-    for sheet in dataset.sheets:
-        for profile in sheet.column_profiles:
-            column_names.append(profile.column_name)
-
     # Get suggestions
     registry = get_module_registry()
     suggested = registry.suggest_groups_for_columns(column_names)
@@ -181,10 +216,10 @@ async def suggest_modules_for_dataset(
 
 
 @router.get("/datasets/{dataset_id}/cleaning-report")
-async def get_cleaning_report(dataset_id: int, db: Session = Depends(get_db)):
+def get_cleaning_report(dataset_id: int, db: Session = Depends(get_db)):
     """Get the data cleaning report for a dataset."""
     service = DatasetService(db)
-    dataset = service.get_dataset(dataset_id)
+    dataset = service.get_dataset(dataset_id, include_cleaning_report=True)
     if not dataset:
         raise HTTPException(status_code=404, detail="Dataset not found")
 
@@ -202,12 +237,19 @@ async def get_cleaning_report(dataset_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/datasets/{dataset_id}/cleaned-data")
-async def get_cleaned_data_preview(
+def get_cleaned_data_preview(
     dataset_id: int,
     limit: int = 100,
+    columns: Optional[List[str]] = Query(None),
     db: Session = Depends(get_db)
 ):
-    """Preview cleaned data from a dataset."""
+    """
+    Preview cleaned data from a dataset.
+
+    Only ``limit`` rows (and, if given, the requested ``columns``) are parsed.
+    Declared as a plain ``def`` so FastAPI runs the DB lookup and file read
+    in its threadpool instead of blocking the event loop.
+    """
     service = DatasetService(db)
     dataset = service.get_dataset(dataset_id)
     if not dataset:
@@ -225,28 +267,29 @@ async def get_cleaned_data_preview(
 
     try:
         if file_path.suffix.lower() in ['.csv', '.cleaned.csv']:
-            df = pl.read_csv(file_path, n_rows=limit)
-            preview_data['Sheet1'] = {
-                "columns": df.columns,
-                "data": df.to_dicts(),
-                "total_rows": df.height
-            }
+            lf = pl.scan_csv(file_path, n_rows=limit)
+            if columns:
+                lf = lf.select([c for c in columns if c in lf.columns])
+            preview_data['Sheet1'] = _preview_sheet(lf.collect())
         else:
-            sheets_dict = pl.read_excel(file_path, sheet_id=None)
+            sheets_dict = pl.read_excel(
+                file_path, sheet_id=0, engine="calamine", read_options={"n_rows": limit}
+            )
             for sheet_name, df in sheets_dict.items():
-                df_limited = df.head(limit)
-                preview_data[sheet_name] = {
-                    "columns": df_limited.columns,
-                    "data": df_limited.to_dicts(),
-                    "total_rows": df_limited.height
-                }
-
-        return {
-            "dataset_id": dataset_id,
-            "cleaned_file_path": str(dataset.cleaned_file_path),
-            "sheets": preview_data,
-            "limit": limit
-        }
+                if columns:
+                    df = df.select([c for c in columns if c in df.columns])
+                preview_data[sheet_name] = _preview_sheet(df)
+
+        # Row data is already JSON (written by polars); embed it as-is
+        return Response(
+            content=orjson.dumps({
+                "dataset_id": dataset_id,
+                "cleaned_file_path": str(dataset.cleaned_file_path),
+                "sheets": preview_data,
+                "limit": limit
+            }),
+            media_type="application/json",
+        )
 
     except Exception as e:
         raise HTTPException(
@@ -255,8 +298,16 @@ async def get_cleaned_data_preview(
         )
 
 
+def _preview_sheet(df: pl.DataFrame) -> dict:
+    return {
+        "columns": df.columns,
+        "data": orjson.Fragment(df.write_json(row_oriented=True)),
+        "total_rows": df.height
+    }
+
+
 @router.get("/datasets/{dataset_id}/download-cleaned")
-async def download_cleaned_data(dataset_id: int, db: Session = Depends(get_db)):
+def download_cleaned_data(dataset_id: int, db: Session = Depends(get_db)):
     """
     Download the cleaned data file.
 
@@ -264,7 +315,7 @@ async def download_cleaned_data(dataset_id: int, db: Session = Depends(get_db)):
     The file has already been cleaned and transformed during the profiling step.
     """
     service = DatasetService(db)
-    dataset = service.get_dataset(dataset_id)
+    dataset = service.get_dataset(dataset_id, include_source_file=True)
 
     if not dataset:
         raise HTTPException(status_code=404, detail="Dataset not found")
@@ -283,6 +334,11 @@ async def download_cleaned_data(dataset_id: int, db: Session = Depends(get_db)):
     extension = file_path.suffix
     filename = f"{base_name}_cleaned{extension}"
 
+    # In production nginx pumps the bytes (sendfile) and the worker is freed
+    accel_response = _x_accel_response(file_path, filename)
+    if accel_response is not None:
+        return accel_response
+
     return FileResponse(
         path=str(file_path),
         filename=filename,
@@ -291,7 +347,7 @@ async def download_cleaned_data(dataset_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/datasets/{dataset_id}/export-for-odoo")
-async def export_for_odoo(dataset_id: int, db: Session = Depends(get_db)):
+def export_for_odoo(dataset_id: int, db: Session = Depends(get_db)):
     """
     Export dataset with cleaning report and field mappings for manual Odoo import.
 
@@ -301,12 +357,13 @@ async def export_for_odoo(dataset_id: int, db: Session = Depends(get_db)):
     - Cleaning report showing what was transformed
     - Selected modules for context
 
-    Returns JSON with cleaned data and metadata ready for manual Odoo import.
+    Streams NDJSON: a metadata line, then a header line per sheet followed
+    by one line per cleaned row (see ``_export_lines``).
     """
     dataset_service = DatasetService(db)
     mapping_service = MappingService(db)
 
-    dataset = dataset_service.get_dataset(dataset_id)
+    dataset = dataset_service.get_dataset(dataset_id, include_cleaning_report=True)
     if not dataset:
         raise HTTPException(status_code=404, detail="Dataset not found")
 
@@ -317,8 +374,7 @@ async def export_for_odoo(dataset_id: int, db: Session = Depends(get_db)):
         )
 
     # Get confirmed mappings
-    mappings = mapping_service.get_mappings_for_dataset(dataset_id)
-    confirmed_mappings = [m for m in mappings if m.chosen]
+    confirmed_mappings = mapping_service.get_confirmed_mappings_for_export(dataset_id)
 
     if not confirmed_mappings:
         raise HTTPException(
@@ -326,20 +382,11 @@ async def export_for_odoo(dataset_id: int, db: Session = Depends(get_db)):
             detail="No confirmed mappings found. Please confirm field mappings before exporting."
         )
 
-    # Read cleaned data
-    file_path = Path(dataset.cleaned_file_path)
-    export_data = {
-        "dataset_id": dataset_id,
-        "dataset_name": dataset.name,
-        "selected_modules": dataset.selected_modules or [],
-        "cleaning_report": dataset.cleaning_report,
-        "field_mappings": [],
-        "sheets": {}
-    }
-
-    # Build field mappings structure
+    # Build the mapping list and the set of target models in one pass
+    field_mappings = []
+    models_detected = {}
     for mapping in confirmed_mappings:
-        export_data["field_mappings"].append({
+        field_mappings.append({
             "source_column": mapping.header_name,
             "target_model": mapping.target_model,
             "target_field": mapping.target_field,
@@ -347,41 +394,67 @@ async def export_for_odoo(dataset_id: int, db: Session = Depends(get_db)):
             "rationale": mapping.rationale,
             "sheet_id": mapping.sheet_id
         })
+        if mapping.target_model:
+            models_detected[mapping.target_model] = None
 
-    # Read cleaned data per sheet
-    try:
-        if file_path.suffix.lower() in ['.csv', '.cleaned.csv']:
-            df = pl.read_csv(file_path)
-            export_data["sheets"]["Sheet1"] = {
-                "columns": df.columns,
-                "row_count": df.height,
-                "data": df.to_dicts()
-            }
-        else:
-            sheets_dict = pl.read_excel(file_path, sheet_id=None)
-            for sheet_name, df in sheets_dict.items():
-                export_data["sheets"][sheet_name] = {
-                    "columns": df.columns,
-                    "row_count": df.height,
-                    "data": df.to_dicts()
-                }
-
-        # Add import instructions
-        export_data["import_instructions"] = {
+    file_path = Path(dataset.cleaned_file_path)
+    metadata = {
+        "type": "metadata",
+        "dataset_id": dataset_id,
+        "dataset_name": dataset.name,
+        "selected_modules": dataset.selected_modules or [],
+        "cleaning_report": dataset.cleaning_report,
+        "field_mappings": field_mappings,
+        "import_instructions": {
             "workflow": [
                 "1. Review the field_mappings to understand how columns map to Odoo models/fields",
                 "2. Use the cleaning_report to see what data transformations were applied",
                 "3. Import sheets data to Odoo manually or via API using the field mappings",
                 "4. Respect the topological order if importing related records (parents before children)"
             ],
-            "models_detected": list(set(m.target_model for m in confirmed_mappings if m.target_model)),
+            "models_detected": list(models_detected),
             "cleaning_applied": dataset.cleaning_report is not None
-        }
+        },
+    }
 
-        return export_data
+    return StreamingResponse(
+        _export_lines(file_path, metadata),
+        media_type="application/x-ndjson",
+    )
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error exporting data: {str(e)}"
-        )
+
+async def _export_lines(file_path: Path, metadata: dict):
+    """
+    Yield the Odoo export as NDJSON.
+
+    The first line is the metadata object. Each sheet then contributes a
+    ``{"type": "sheet"}`` header line followed by one ``{"type": "row"}``
+    line per record. Rows are read in batches off the event loop so the
+    whole cleaned file is never held in memory.
+    """
+    yield orjson.dumps(metadata) + b"\n"
+
+    if file_path.suffix.lower() == ".csv":
+        reader = await asyncio.to_thread(pl.read_csv_batched, file_path, batch_size=EXPORT_BATCH_SIZE)
+        header_sent = False
+        while True:
+            batches = await asyncio.to_thread(reader.next_batches, 1)
+            if not batches:
+                break
+            df = batches[0]
+            if not header_sent:
+                yield orjson.dumps({"type": "sheet", "name": "Sheet1", "columns": df.columns}) + b"\n"
+                header_sent = True
+            yield await asyncio.to_thread(_rows_to_ndjson, df)
+    else:
+        sheets_dict = await asyncio.to_thread(pl.read_excel, file_path, sheet_id=0, engine="calamine")
+        for sheet_name, sheet_df in sheets_dict.items():
+            yield orjson.dumps({"type": "sheet", "name": sheet_name, "columns": sheet_df.columns}) + b"\n"
+            for df in sheet_df.iter_slices(EXPORT_BATCH_SIZE):
+                yield await asyncio.to_thread(_rows_to_ndjson, df)
+
+
+def _rows_to_ndjson(df: pl.DataFrame) -> bytes:
+    """Encode each row as a ``{"type": "row", "data": {...}}`` line, entirely inside polars."""
+    rows = df.select(pl.lit("row").alias("type"), pl.struct(pl.all()).alias("data"))
+    return rows.write_ndjson().encode()
@@ -3,15 +3,15 @@ Exceptions API endpoints.
 
 Provides GET/DELETE operations for validation exceptions.
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from typing import Optional
+import orjson
 from app.core.database import get_db
 from app.adapters.repositories_sqlite import SQLiteExceptionsRepo
 from app.schemas.exception import (
     ExceptionsListResponse,
     ExceptionsClearResponse,
-    ExceptionResponse,
 )
 
 router = APIRouter()
@@ -21,29 +21,42 @@ router = APIRouter()
 def list_exceptions(
     dataset_id: int,
     model: Optional[str] = Query(None, description="Filter by model (e.g., res.partner)"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(200, ge=1, le=1000),
     db: Session = Depends(get_db),
 ):
     """
-    List validation exceptions for a dataset.
+    List validation exceptions for a dataset, newest first.
 
     Args:
         dataset_id: ID of the dataset
         model: Optional model filter
+        skip: Number of exceptions to skip
+        limit: Page size (max 1000)
 
     Returns:
-        List of exceptions with error codes, hints, and offending data
+        One page of exceptions with error codes, hints, and offending data,
+        plus the total count across all pages
     """
     repo = SQLiteExceptionsRepo(db)
 
-    exceptions = repo.list(dataset_id, model)
-    total = len(exceptions)
-
-    return ExceptionsListResponse(
-        dataset_id=dataset_id,
-        model=model,
-        total=total,
-        exceptions=[ExceptionResponse(**exc) for exc in exceptions],
+    # Stored `offending` JSON is spliced into the body as-is (orjson.Fragment)
+    # rather than parsed into dicts, validated and serialised again.
+    exceptions = repo.list_raw(dataset_id, model, skip=skip, limit=limit)
+    for exc in exceptions:
+        exc["offending"] = orjson.Fragment(exc["offending"] or "null")
+
+    body = orjson.dumps(
+        {
+            "dataset_id": dataset_id,
+            "model": model,
+            "total": repo.count(dataset_id, model),
+            "skip": skip,
+            "limit": limit,
+            "exceptions": exceptions,
+        }
     )
+    return Response(content=body, media_type="application/json")
 
 
 @router.delete(
@@ -66,8 +79,8 @@ def clear_exceptions(
     """
     repo = SQLiteExceptionsRepo(db)
 
+    # The repo commits after each delete batch
     deleted_count = repo.clear(dataset_id, model)
-    db.commit()
 
     return ExceptionsClearResponse(
         dataset_id=dataset_id,
@@ -2,23 +2,40 @@
 Export API endpoints for converting datasets to external formats.
 """
 
-from typing import Optional
+from typing import BinaryIO, Iterator, Optional
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.services.odoo_migrate_export import OdooMigrateExportService
 from app.services.export_service import ExportService, ExportResult
 from app.services.graph_execute_service import GraphExecuteService
-from app.schemas.export import ExportResponse
+from app.schemas.export import (
+    ExportPreview,
+    ExportPreviewField,
+    ExportPreviewModel,
+    ExportResponse,
+)
 from app.models.graph import GraphRun
 
 router = APIRouter()
 
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+_PREVIEW_ADAPTER = TypeAdapter(ExportPreview)
+
+
+def _iter_archive(archive: BinaryIO) -> Iterator[bytes]:
+    """Yield a spooled archive in fixed-size chunks, closing it when done."""
+    with archive:
+        while chunk := archive.read(EXPORT_CHUNK_SIZE):
+            yield chunk
+
 
 @router.post("/datasets/{dataset_id}/export/odoo-migrate")
-async def export_to_odoo_migrate(
+def export_to_odoo_migrate(
     dataset_id: int,
     db: Session = Depends(get_db)
 ):
@@ -44,10 +61,10 @@ async def export_to_odoo_migrate(
     """
     try:
         service = OdooMigrateExportService(db)
-        zip_bytes = await service.export_dataset(dataset_id)
+        archive = service.export_dataset(dataset_id)
 
-        return Response(
-            content=zip_bytes,
+        return StreamingResponse(
+            _iter_archive(archive),
             media_type="application/zip",
             headers={
                 "Content-Disposition": f"attachment; filename=dataset_{dataset_id}_odoo_migrate.zip"
@@ -59,8 +76,8 @@ async def export_to_odoo_migrate(
         raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
 
 
-@router.get("/datasets/{dataset_id}/export/odoo-migrate/preview")
-async def preview_export(
+@router.get("/datasets/{dataset_id}/export/odoo-migrate/preview", response_model=ExportPreview)
+def preview_export(
     dataset_id: int,
     db: Session = Depends(get_db)
 ):
@@ -80,37 +97,34 @@ async def preview_export(
         if not dataset:
             raise HTTPException(status_code=404, detail="Dataset not found")
 
-        # Group mappings by model
-        mappings_by_model = service._group_mappings_by_model(dataset)
-
-        # Generate ID patterns
-        id_patterns = service._generate_id_patterns(dataset, mappings_by_model)
+        # Mappings grouped by model, with ID patterns
+        mappings_by_model, id_patterns = service.export_plan(dataset)
 
         # Build preview response
-        models_info = []
-        for model, mappings in mappings_by_model.items():
-            models_info.append({
-                "model": model,
-                "field_count": len(mappings),
-                "external_id_pattern": id_patterns.get(model),
-                "fields": [
-                    {
-                        "source": m.header_name,
-                        "target": m.target_field,
-                        "has_transforms": len(m.transforms) > 0
-                    }
+        models_info = [
+            ExportPreviewModel(
+                model=model,
+                field_count=len(mappings),
+                external_id_pattern=id_patterns.get(model),
+                fields=[
+                    ExportPreviewField(m.header_name, m.target_field, bool(m.transforms))
                     for m in mappings if m.target_field
-                ]
-            })
-
-        return {
-            "dataset_id": dataset_id,
-            "dataset_name": dataset.name,
-            "models": models_info,
-            "total_models": len(models_info),
-            "namespace": "migr"
-        }
+                ],
+            )
+            for model, mappings in mappings_by_model.items()
+        ]
+
+        preview = ExportPreview(
+            dataset_id=dataset_id,
+            dataset_name=dataset.name,
+            models=models_info,
+            total_models=len(models_info),
+            namespace="migr",
+        )
+        return Response(content=_PREVIEW_ADAPTER.dump_json(preview), media_type="application/json")
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Preview failed: {str(e)}")
 
@@ -161,31 +175,31 @@ def export_for_odoo(
             result = service.export_to_odoo_csv(dataset_id)
 
         # Convert to ExportResponse format
+        run = None
+        error_message = None
         if isinstance(result, ExportResult):
             models = result.models
             total_emitted = result.total_emitted
             total_exceptions = result.total_exceptions
         else:
             # Handle case where service returns RunResponse
-            run = None
             if hasattr(result, 'id'):
-                run = db.query(GraphRun).filter(GraphRun.id == result.id).first()
-            
-            models = []
-            if run and run.metadata:
-                for model_name in run.metadata.get("executed_models", []):
-                    model_summary = {
-                        "model": model_name,
-                        "csv_filename": f"{model_name}.csv",
-                        "rows_emitted": run.metadata.get(f"{model_name}_rows_emitted", 0),
-                        "exceptions_count": run.metadata.get(f"{model_name}_exceptions_count", 0)
-                    }
-                    models.append(model_summary)
-                
-            total_emitted = run.metadata.get("total_emitted", 0) if run else 0
-            total_exceptions = len(run.metadata.get("failed_nodes", [])) if run else 0
+                run = db.get(GraphRun, result.id)
+            md = (run.context or {}) if run else {}
+
+            models = [
+                {
+                    "model": model_name,
+                    "csv_filename": f"{model_name}.csv",
+                    "rows_emitted": md.get(f"{model_name}_rows_emitted", 0),
+                    "exceptions_count": md.get(f"{model_name}_exceptions_count", 0)
+                }
+                for model_name in md.get("executed_nodes", [])
+            ]
+            total_emitted = md.get("total_emitted", 0)
+            total_exceptions = len(md.get("failed_nodes", []))
             error_message = run.error_message if run else None
-        
+
         return ExportResponse(
             dataset_id=dataset_id, 
             zip_path=result.zip_path if hasattr(result, 'zip_path') else "",
@@ -196,7 +210,7 @@ def export_for_odoo(
             message=error_message or "Export completed",
             current_node=run.current_node if run else None,
             progress=run.progress if run else 0,
-            metadata=run.metadata or {}
+            metadata=(run.context or {}) if run else {}
         )
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -1,25 +1,34 @@
 """
 API routes for GraphSpec management
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
+from functools import lru_cache
 from typing import List
+import orjson
 from app.core.database import get_db
+from app.core.http_cache import cached_json_response
 from app.services.graph_service import GraphService
 from app.schemas.graph import (
     GraphSpec,
     GraphSpecCreate,
     GraphSpecUpdate,
     GraphValidation,
-    GraphRunResponse
+    GraphRunResponse,
+    GraphRunDetail,
 )
 from typing import Dict, Any
 
 router = APIRouter()
 
+# Whole lists are validated and serialised in one pydantic-core call
+_GRAPH_LIST_ADAPTER = TypeAdapter(List[GraphSpec])
+_RUN_LIST_ADAPTER = TypeAdapter(List[GraphRunDetail])
+
 
 @router.post("/graphs", response_model=GraphSpec, status_code=status.HTTP_201_CREATED)
-async def create_graph(graph_create: GraphSpecCreate, db: Session = Depends(get_db)):
+def create_graph(graph_create: GraphSpecCreate, db: Session = Depends(get_db)):
     """Create a new graph definition"""
     service = GraphService(db)
     graph = service.create_graph(graph_create)
@@ -28,31 +37,32 @@ async def create_graph(graph_create: GraphSpecCreate, db: Session = Depends(get_
 
 
 @router.get("/graphs/{graph_id}", response_model=GraphSpec)
-async def get_graph(graph_id: str, db: Session = Depends(get_db)):
+def get_graph(graph_id: str, db: Session = Depends(get_db)):
     """Get a graph by ID"""
     service = GraphService(db)
-    graph = service.get_graph(graph_id)
+    graph_spec = service.get_graph_spec(graph_id)
 
-    if not graph:
+    if not graph_spec:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Graph {graph_id} not found"
         )
 
-    return GraphSpec(**graph.spec)
+    return graph_spec
 
 
 @router.get("/graphs", response_model=List[GraphSpec])
-async def list_graphs(limit: int = 100, offset: int = 0, db: Session = Depends(get_db)):
+def list_graphs(limit: int = 100, offset: int = 0, db: Session = Depends(get_db)):
     """List all graphs"""
     service = GraphService(db)
     graphs = service.list_graphs(limit=limit, offset=offset)
 
-    return [GraphSpec(**g.spec) for g in graphs]
+    specs = _GRAPH_LIST_ADAPTER.validate_python([g.spec for g in graphs])
+    return Response(content=_GRAPH_LIST_ADAPTER.dump_json(specs), media_type="application/json")
 
 
 @router.put("/graphs/{graph_id}", response_model=GraphSpec)
-async def update_graph(
+def update_graph(
     graph_id: str,
     graph_update: GraphSpecUpdate,
     db: Session = Depends(get_db)
@@ -71,7 +81,7 @@ async def update_graph(
 
 
 @router.delete("/graphs/{graph_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_graph(graph_id: str, db: Session = Depends(get_db)):
+def delete_graph(graph_id: str, db: Session = Depends(get_db)):
     """Delete a graph"""
     service = GraphService(db)
     success = service.delete_graph(graph_id)
@@ -84,26 +94,26 @@ async def delete_graph(graph_id: str, db: Session = Depends(get_db)):
 
 
 @router.post("/graphs/{graph_id}/validate", response_model=GraphValidation)
-async def validate_graph(graph_id: str, db: Session = Depends(get_db)):
+def validate_graph(graph_id: str, db: Session = Depends(get_db)):
     """Validate a graph for correctness"""
     service = GraphService(db)
-    graph = service.get_graph(graph_id)
+    graph_spec = service.get_graph_spec(graph_id)
 
-    if not graph:
+    if not graph_spec:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Graph {graph_id} not found"
         )
 
-    graph_spec = GraphSpec(**graph.spec)
     validation = service.validate_graph(graph_spec)
 
     return validation
 
 
 @router.post("/graphs/{graph_id}/run", response_model=GraphRunResponse)
-async def run_graph(
+def run_graph(
     graph_id: str,
+    background_tasks: BackgroundTasks,
     dataset_id: int = None,
     db: Session = Depends(get_db)
 ):
@@ -111,18 +121,19 @@ async def run_graph(
     Execute a graph in the background using InlineTaskRunner.
 
     Returns immediately with a run ID that can be used to track progress.
+    The task is handed to the runner after the response is sent, once the
+    request's DB session has been released.
     """
     service = GraphService(db)
-    graph = service.get_graph(graph_id)
+    graph_spec = service.get_graph_spec(graph_id)
 
-    if not graph:
+    if not graph_spec:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Graph {graph_id} not found"
         )
 
     # Validate first
-    graph_spec = GraphSpec(**graph.spec)
     validation = service.validate_graph(graph_spec)
 
     if not validation.valid:
@@ -133,46 +144,44 @@ async def run_graph(
 
     # Create run record
     run = service.create_run(graph_id, dataset_id)
+    run_id = run.id
 
     # Execute the graph in background using shared task runner singleton
     from app.core.task_runner import get_task_runner
     from app.services.graph_execute_service import GraphExecuteService
 
-    # Get shared task runner singleton
-    task_runner = get_task_runner()
-
     def execute_graph_background():
         """Execute graph in background thread."""
-        # Create new DB session for background thread
+        # Own session, checked out only for the duration of the run
         from app.core.database import SessionLocal
-        db_thread = SessionLocal()
-        try:
+        with SessionLocal() as db_thread:
             execute_service = GraphExecuteService(db_thread)
-            result = execute_service.execute_graph_export(
+            return execute_service.execute_graph_export(
                 dataset_id=dataset_id,
                 graph_id=graph_id,
-                run_id=run.id  # Pass the run ID for concurrent safety
+                run_id=run_id  # Pass the run ID for concurrent safety
             )
-            return result
-        finally:
-            db_thread.close()
-
-    # Submit task for background execution
-    task_id = task_runner.submit(
-        execute_graph_background,
-        task_id=run.id  # Use run ID as task ID
+
+    # Submit to the shared runner once the response is out (run ID is the task ID)
+    background_tasks.add_task(
+        get_task_runner().submit, execute_graph_background, task_id=run_id
     )
 
     # Return immediately with run ID
     return GraphRunResponse(
-        id=run.id,
+        id=run_id,
         status="queued",
-        message=f"Graph execution queued with task ID: {task_id}"
+        message=f"Graph execution queued with task ID: {run_id}"
     )
 
 
-@router.get("/graphs/{graph_id}/runs")
-async def list_graph_runs(graph_id: str, db: Session = Depends(get_db)):
+@router.get("/graphs/{graph_id}/runs", response_model=List[GraphRunDetail])
+def list_graph_runs(
+    graph_id: str,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db)
+):
     """
     List all runs for a graph with detailed execution information.
 
@@ -182,29 +191,14 @@ async def list_graph_runs(graph_id: str, db: Session = Depends(get_db)):
     - logs: Array of timestamped log entries for each run
     """
     service = GraphService(db)
-    runs = service.list_runs(graph_id=graph_id)
-
-    return [
-        {
-            "id": run.id,
-            "graph_id": run.graph_id,
-            "dataset_id": run.dataset_id,
-            "status": run.status,
-            "started_at": run.started_at.isoformat() if run.started_at else None,
-            "finished_at": run.finished_at.isoformat() if run.finished_at else None,
-            "progress": run.progress,
-            "current_node": run.current_node,  # Direct access, no getattr
-            "context": run.context or {},  # Direct access with default
-            "logs": run.logs or [],  # Direct access with default
-            "stats": run.stats,
-            "error_message": run.error_message,
-        }
-        for run in runs
-    ]
-
-
-@router.get("/runs/{run_id}")
-async def get_run_status(run_id: str, db: Session = Depends(get_db)):
+    runs = service.list_run_rows(graph_id=graph_id, limit=limit, offset=offset)
+
+    body = _RUN_LIST_ADAPTER.dump_json(_RUN_LIST_ADAPTER.validate_python(runs))
+    return Response(content=body, media_type="application/json")
+
+
+@router.get("/runs/{run_id}", response_model=GraphRunDetail)
+def get_run_status(run_id: str, db: Session = Depends(get_db)):
     """
     Get detailed status of a specific run.
 
@@ -214,7 +208,7 @@ async def get_run_status(run_id: str, db: Session = Depends(get_db)):
     - logs: Array of timestamped log entries
     """
     service = GraphService(db)
-    run = service.get_run(run_id)
+    run = service.get_run_row(run_id)
 
     if not run:
         raise HTTPException(
@@ -222,27 +216,16 @@ async def get_run_status(run_id: str, db: Session = Depends(get_db)):
             detail=f"Run {run_id} not found"
         )
 
-    # Ensure all fields are properly exposed
-    return {
-        "id": run.id,
-        "graph_id": run.graph_id,
-        "dataset_id": run.dataset_id,
-        "status": run.status,
-        "started_at": run.started_at.isoformat() if run.started_at else None,
-        "finished_at": run.finished_at.isoformat() if run.finished_at else None,
-        "progress": run.progress,
-        "current_node": run.current_node,  # Direct access, no getattr
-        "context": run.context or {},  # Direct access with default
-        "logs": run.logs or [],  # Direct access with default
-        "stats": run.stats,
-        "error_message": run.error_message,
-    }
+    return Response(
+        content=GraphRunDetail.model_validate(run).model_dump_json(),
+        media_type="application/json"
+    )
 
 
 # Registry Integration Endpoints
 
 @router.post("/graphs/registry/{template_type}")
-async def create_registry_graph(template_type: str, db: Session = Depends(get_db)):
+def create_registry_graph(template_type: str, db: Session = Depends(get_db)):
     """Generate graph from registry template"""
     service = GraphService(db)
     
@@ -256,20 +239,25 @@ async def create_registry_graph(template_type: str, db: Session = Depends(get_db
         )
 
 
-@router.get("/graphs/registry/templates")
-async def list_registry_templates(db: Session = Depends(get_db)):
-    """List available registry-based templates"""
-    service = GraphService(db)
-    templates = service.list_registry_templates()
-    
-    return {
+@lru_cache(maxsize=1)
+def _registry_templates_body() -> bytes:
+    """Serialised template listing; odoo.yaml only changes on redeploy."""
+    templates = GraphService(None).list_registry_templates()
+
+    return orjson.dumps({
         "templates": templates,
         "total": len(templates)
-    }
+    })
+
+
+@router.get("/graphs/registry/templates")
+def list_registry_templates(request: Request):
+    """List available registry-based templates"""
+    return cached_json_response(request, _registry_templates_body(), max_age=300)
 
 
 @router.post("/graphs/{graph_id}/validate/registry")
-async def validate_graph_registry(graph_id: str, db: Session = Depends(get_db)):
+def validate_graph_registry(graph_id: str, db: Session = Depends(get_db)):
     """Validate graph against current registry"""
     service = GraphService(db)
     
@@ -284,7 +272,7 @@ async def validate_graph_registry(graph_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/graphs/registry/dependencies/{model_name}")
-async def get_registry_dependencies(model_name: str, db: Session = Depends(get_db)):
+def get_registry_dependencies(model_name: str, db: Session = Depends(get_db)):
     """Get dependency information for a specific model from registry"""
     service = GraphService(db)
     dependencies = service.get_registry_dependencies(model_name)
@@ -20,7 +20,7 @@ async def create_run(
 
 
 @router.get("/runs", response_model=RunListResponse)
-async def list_runs(
+def list_runs(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
@@ -32,7 +32,7 @@ async def list_runs(
 
 
 @router.get("/runs/{run_id}", response_model=RunResponse)
-async def get_run(run_id: int, db: Session = Depends(get_db)):
+def get_run(run_id: int, db: Session = Depends(get_db)):
     """Get a specific run by ID."""
     service = ImportService(db)
     run = service.get_run(run_id)
@@ -1,53 +1,85 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from app.core.database import get_db
+from app.core.http_cache import revalidated_json_response
+from app.core.pagination import cursor_headers, split_page
 from app.services.mapping_service import MappingService
-from app.schemas.mapping import MappingResponse, MappingUpdate, MappingListResponse
+from app.schemas.mapping import (
+    MappingListResponse,
+    MappingResponse,
+    MappingUpdate,
+    SuggestionResponse,
+    TransformResponse,
+)
 
 router = APIRouter()
 
 
+def _construct(schema, obj, **overrides):
+    """Copy ``schema``'s fields off an ORM row without running validation."""
+    data = {name: getattr(obj, name) for name in schema.model_fields if name not in overrides}
+    return schema.model_construct(**data, **overrides)
+
+
+def _mapping_response(mapping) -> MappingResponse:
+    """
+    Build a MappingResponse from a trusted, DB-loaded Mapping.
+
+    model_construct skips validation, so the schema's before-validators
+    (unscored confidence -> 0.0, null collections -> []) are applied here.
+    """
+    return _construct(
+        MappingResponse,
+        mapping,
+        confidence=0.0 if mapping.confidence is None else mapping.confidence,
+        transforms=[_construct(TransformResponse, t) for t in mapping.transforms or ()],
+        suggestions=[_construct(SuggestionResponse, s) for s in mapping.suggestions or ()],
+    )
+
+
+def _mapping_list_body(mappings, total: Optional[int] = None, next_cursor: Optional[int] = None) -> bytes:
+    """
+    Serialise ORM mappings as a MappingListResponse body in one pass.
+
+    Rows come from our own tables, so they are assembled with model_construct
+    rather than re-validated field by field; returning the bytes also skips
+    FastAPI's response_model pass.
+    """
+    return MappingListResponse.model_construct(
+        mappings=[_mapping_response(m) for m in mappings],
+        total=len(mappings) if total is None else total,
+        next_cursor=next_cursor,
+    ).model_dump_json().encode()
+
+
 @router.get("/datasets/{dataset_id}/mappings", response_model=MappingListResponse)
-async def get_dataset_mappings(dataset_id: int, db: Session = Depends(get_db)):
-    """Get all mappings for a dataset."""
+def get_dataset_mappings(
+    dataset_id: int,
+    request: Request,
+    after_id: Optional[int] = None,
+    limit: int = Query(1000, ge=1, le=1000),
+    db: Session = Depends(get_db),
+):
+    """
+    Get a dataset's mappings in id order (ETag-validated for pollers).
+
+    Pages with ``after_id``/``limit``; ``next_cursor`` is set while more
+    remain. ``total`` counts the whole dataset, and needs its own query only
+    when the result spans more than one page.
+    """
     service = MappingService(db)
-    mappings = service.get_mappings_for_dataset(dataset_id)
-
-    # Explicitly convert SQLAlchemy objects to dicts for proper serialization
-    mapping_responses = []
-    for mapping in mappings:
-        mapping_dict = {
-            "id": mapping.id,
-            "dataset_id": mapping.dataset_id,
-            "sheet_id": mapping.sheet_id,
-            "header_name": mapping.header_name,
-            "target_model": mapping.target_model,
-            "target_field": mapping.target_field,
-            "confidence": mapping.confidence if mapping.confidence is not None else 0.0,
-            "status": mapping.status,
-            "chosen": mapping.chosen,
-            "rationale": mapping.rationale,
-            "custom_field_definition": mapping.custom_field_definition,
-            "transforms": [
-                {
-                    "id": t.id,
-                    "mapping_id": t.mapping_id,
-                    "order": t.order,
-                    "fn": t.fn,
-                    "params": t.params
-                } for t in mapping.transforms
-            ] if mapping.transforms else [],
-            "suggestions": [
-                {
-                    "id": s.id,
-                    "mapping_id": s.mapping_id,
-                    "candidates": s.candidates
-                } for s in mapping.suggestions
-            ] if mapping.suggestions else []
-        }
-        mapping_responses.append(mapping_dict)
-
-    return {"mappings": mapping_responses, "total": len(mapping_responses)}
+    rows = service.get_mappings_for_dataset(dataset_id, after_id=after_id, limit=limit)
+    mappings, next_cursor = split_page(rows, limit)
+
+    if after_id is None and next_cursor is None:
+        total = len(mappings)
+    else:
+        total = service.count_mappings_for_dataset(dataset_id)
+
+    body = _mapping_list_body(mappings, total=total, next_cursor=next_cursor)
+    return revalidated_json_response(request, body, headers=cursor_headers(next_cursor))
 
 
 @router.post("/datasets/{dataset_id}/mappings/generate", response_model=MappingListResponse)
@@ -67,45 +99,11 @@ async def generate_mappings(
     service = MappingService(db)
     mappings = await service.generate_mappings_v2(dataset_id, use_deterministic=use_deterministic)
 
-    # Explicitly convert SQLAlchemy objects to dicts for proper serialization
-    mapping_responses = []
-    for mapping in mappings:
-        mapping_dict = {
-            "id": mapping.id,
-            "dataset_id": mapping.dataset_id,
-            "sheet_id": mapping.sheet_id,
-            "header_name": mapping.header_name,
-            "target_model": mapping.target_model,
-            "target_field": mapping.target_field,
-            "confidence": mapping.confidence if mapping.confidence is not None else 0.0,
-            "status": mapping.status,
-            "chosen": mapping.chosen,
-            "rationale": mapping.rationale,
-            "custom_field_definition": mapping.custom_field_definition,
-            "transforms": [
-                {
-                    "id": t.id,
-                    "mapping_id": t.mapping_id,
-                    "order": t.order,
-                    "fn": t.fn,
-                    "params": t.params
-                } for t in mapping.transforms
-            ] if hasattr(mapping, 'transforms') and mapping.transforms else [],
-            "suggestions": [
-                {
-                    "id": s.id,
-                    "mapping_id": s.mapping_id,
-                    "candidates": s.candidates
-                } for s in mapping.suggestions
-            ] if hasattr(mapping, 'suggestions') and mapping.suggestions else []
-        }
-        mapping_responses.append(mapping_dict)
-
-    return {"mappings": mapping_responses, "total": len(mapping_responses)}
+    return Response(content=_mapping_list_body(mappings), media_type="application/json")
 
 
 @router.put("/mappings/{mapping_id}", response_model=MappingResponse)
-async def update_mapping(
+def update_mapping(
     mapping_id: int,
     mapping_data: MappingUpdate,
     db: Session = Depends(get_db),
@@ -119,7 +117,7 @@ async def update_mapping(
 
 
 @router.delete("/mappings/{mapping_id}")
-async def delete_mapping(mapping_id: int, db: Session = Depends(get_db)):
+def delete_mapping(mapping_id: int, db: Session = Depends(get_db)):
     """Delete a mapping."""
     service = MappingService(db)
     success = service.delete_mapping(mapping_id)
@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from datetime import datetime
-from typing import List
-from pydantic import BaseModel, Field
-from app.core.database import get_db
+from typing import List, Optional
+from pydantic import BaseModel, Field, TypeAdapter
+from app.core.database import get_db, insert_returning
+from app.core.http_cache import revalidated_json_response
+from app.core.pagination import cursor_headers, keyset_page, split_page
 from app.models import OdooConnection
 from app.connectors.odoo import OdooConnector
 from app.services.odoo_field_service import OdooFieldService
@@ -59,7 +62,7 @@ class CreateFieldsResponse(BaseModel):
 
 # Endpoints
 @router.post("/odoo/test-connection", response_model=TestConnectionResponse)
-async def test_connection(connection: OdooConnectionTest):
+def test_connection(connection: OdooConnectionTest):
     """Test connection to Odoo instance."""
     try:
         connector = OdooConnector(
@@ -80,17 +83,29 @@ async def test_connection(connection: OdooConnectionTest):
         }
 
 
+_CONNECTION_LIST_ADAPTER = TypeAdapter(List[OdooConnectionResponse])
+
+# Only what the listing returns; the password never leaves the database
+_CONNECTION_COLUMNS = tuple(
+    getattr(OdooConnection, name) for name in OdooConnectionResponse.model_fields
+)
+
+
 @router.post("/odoo/connections", response_model=OdooConnectionResponse)
-async def create_connection(
+def create_connection(
     connection: OdooConnectionCreate,
     db: Session = Depends(get_db)
 ):
     """Create a new Odoo connection configuration."""
     # If setting as default, unset any other default
     if connection.is_default:
-        db.query(OdooConnection).update({"is_default": False})
+        db.query(OdooConnection).filter(
+            OdooConnection.is_default == True
+        ).update({"is_default": False}, synchronize_session=False)
 
-    new_connection = OdooConnection(
+    new_connection = insert_returning(
+        db,
+        OdooConnection,
         name=connection.name,
         url=connection.url,
         database=connection.database,
@@ -99,35 +114,42 @@ async def create_connection(
         is_default=connection.is_default,
         last_tested_at=datetime.utcnow()  # Set since we just tested it
     )
-
-    db.add(new_connection)
     db.commit()
-    db.refresh(new_connection)
 
     return new_connection
 
 
 @router.get("/odoo/connections", response_model=List[OdooConnectionResponse])
-async def list_connections(
+def list_connections(
+    request: Request,
+    after_id: Optional[int] = None,
+    limit: int = Query(100, ge=1, le=1000),
     db: Session = Depends(get_db)
 ):
-    """List all Odoo connection configurations."""
-    connections = db.query(OdooConnection).filter(
-        OdooConnection.is_active == True
-    ).all()
+    """
+    List active Odoo connection configurations (ETag-validated).
 
-    return connections
+    Pages in id order with ``after_id``/``limit``; the X-Next-Cursor header
+    is set while more remain.
+    """
+    stmt = select(*_CONNECTION_COLUMNS).where(OdooConnection.is_active == True)
+    connections, next_cursor = split_page(
+        db.execute(keyset_page(stmt, OdooConnection.id, after_id, limit)).all(), limit
+    )
+
+    body = _CONNECTION_LIST_ADAPTER.dump_json(
+        _CONNECTION_LIST_ADAPTER.validate_python(connections, from_attributes=True)
+    )
+    return revalidated_json_response(request, body, headers=cursor_headers(next_cursor))
 
 
 @router.get("/odoo/connections/{connection_id}", response_model=OdooConnectionResponse)
-async def get_connection(
+def get_connection(
     connection_id: int,
     db: Session = Depends(get_db)
 ):
     """Get a specific Odoo connection configuration."""
-    connection = db.query(OdooConnection).filter(
-        OdooConnection.id == connection_id
-    ).first()
+    connection = db.get(OdooConnection, connection_id)
 
     if not connection:
         raise HTTPException(status_code=404, detail="Connection not found")
@@ -136,14 +158,12 @@ async def get_connection(
 
 
 @router.delete("/odoo/connections/{connection_id}")
-async def delete_connection(
+def delete_connection(
     connection_id: int,
     db: Session = Depends(get_db)
 ):
     """Delete an Odoo connection configuration."""
-    connection = db.query(OdooConnection).filter(
-        OdooConnection.id == connection_id
-    ).first()
+    connection = db.get(OdooConnection, connection_id)
 
     if not connection:
         raise HTTPException(status_code=404, detail="Connection not found")
@@ -156,7 +176,7 @@ async def delete_connection(
 
 
 @router.post("/datasets/{dataset_id}/create-custom-fields", response_model=CreateFieldsResponse)
-async def create_custom_fields(
+def create_custom_fields(
     dataset_id: int,
     connection_id: int | None = None,
     db: Session = Depends(get_db)
@@ -168,9 +188,7 @@ async def create_custom_fields(
     """
     # Get Odoo connection
     if connection_id:
-        connection = db.query(OdooConnection).filter(
-            OdooConnection.id == connection_id
-        ).first()
+        connection = db.get(OdooConnection, connection_id)
     else:
         connection = db.query(OdooConnection).filter(
             OdooConnection.is_default == True
@@ -1,18 +1,64 @@
 """
 Operations API - Endpoints for tracking operation progress.
 """
-from fastapi import APIRouter, HTTPException
+import asyncio
+from typing import Optional
+from weakref import WeakValueDictionary
+
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from app.core.http_cache import revalidated_json_response
 from app.services.operation_tracker import OperationTracker
 
 router = APIRouter()
 
+# Serialised status per operation. Parallel pollers within the TTL share one
+# read of the operations store; only touched from the event loop, so no lock.
+STATUS_TTL_SECONDS = 0.25
+_status_cache: TTLCache = TTLCache(maxsize=10000, ttl=STATUS_TTL_SECONDS)
+_status_locks: "WeakValueDictionary[str, asyncio.Lock]" = WeakValueDictionary()
+
+
+def _read_status(operation_id: str) -> Optional[bytes]:
+    tracker = OperationTracker.get(operation_id)
+    if not tracker:
+        return None
+
+    try:
+        return orjson.dumps(tracker.get_status())
+    finally:
+        tracker.close()
+
+
+async def _status_body(operation_id: str) -> Optional[bytes]:
+    """Return the cached status body, letting one caller per id refresh it."""
+    body = _status_cache.get(operation_id)
+    if body is not None:
+        return body
+
+    lock = _status_locks.get(operation_id)
+    if lock is None:
+        lock = _status_locks[operation_id] = asyncio.Lock()
+
+    async with lock:
+        body = _status_cache.get(operation_id)
+        if body is None:
+            body = await run_in_threadpool(_read_status, operation_id)
+            if body is not None:
+                _status_cache[operation_id] = body
+    return body
+
 
 @router.get("/operations/{operation_id}/status")
-async def get_operation_status(operation_id: str):
+async def get_operation_status(operation_id: str, request: Request):
     """
     Get the current status of an operation.
 
     Frontend polls this endpoint to get real-time progress updates.
+    Polls within STATUS_TTL_SECONDS share one read, and an unchanged status
+    revalidates to an empty 304.
 
     Returns:
         {
@@ -30,12 +76,8 @@ async def get_operation_status(operation_id: str):
             "error": "...",   // Present when error
         }
     """
-    tracker = OperationTracker.get(operation_id)
-    if not tracker:
+    body = await _status_body(operation_id)
+    if body is None:
         raise HTTPException(status_code=404, detail="Operation not found")
 
-    try:
-        status = tracker.get_status()
-        return status
-    finally:
-        tracker.close()
+    return revalidated_json_response(request, body)
@@ -1,41 +1,73 @@
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+import orjson
 from app.core.database import get_db
+from app.core.http_cache import cached_file_response, revalidated_json_response
+from app.core.pagination import cursor_headers, keyset_page, split_page
 from app.models import Sheet, ColumnProfile
 from app.core.config import settings
 from pathlib import Path
 
 router = APIRouter()
 
+_PROFILE_COLUMNS = (
+    ColumnProfile.id,
+    ColumnProfile.name,
+    ColumnProfile.dtype_guess,
+    ColumnProfile.null_pct,
+    ColumnProfile.distinct_pct,
+    ColumnProfile.patterns,
+    ColumnProfile.sample_values,
+)
+
 
 @router.get("/sheets/{sheet_id}/profiles")
-async def get_sheet_profiles(sheet_id: int, db: Session = Depends(get_db)):
-    """Get all column profiles for a sheet."""
-    sheet = db.query(Sheet).filter(Sheet.id == sheet_id).first()
-    if not sheet:
+def get_sheet_profiles(
+    sheet_id: int,
+    request: Request,
+    after_id: Optional[int] = None,
+    limit: int = Query(1000, ge=1, le=1000),
+    db: Session = Depends(get_db),
+):
+    """
+    Get a sheet's column profiles in id order (ETag-validated for pollers).
+
+    Pages with ``after_id``/``limit``; the X-Next-Cursor header is set while
+    more remain.
+    """
+    rows = db.execute(
+        keyset_page(
+            select(*_PROFILE_COLUMNS).where(ColumnProfile.sheet_id == sheet_id),
+            ColumnProfile.id,
+            after_id,
+            limit,
+        )
+    ).mappings().all()
+
+    # Only an empty result needs to tell a missing sheet from a bare one
+    if not rows and db.scalar(select(Sheet.id).where(Sheet.id == sheet_id)) is None:
         raise HTTPException(status_code=404, detail="Sheet not found")
 
-    profiles = db.query(ColumnProfile).filter(ColumnProfile.sheet_id == sheet_id).all()
+    rows, next_cursor = split_page(rows, limit, id_of=lambda row: row["id"])
 
-    return [
+    body = orjson.dumps([
         {
-            "id": p.id,
-            "name": p.name,
-            "dtype_guess": p.dtype_guess,
-            "null_pct": p.null_pct,
-            "distinct_pct": p.distinct_pct,
-            "patterns": p.patterns or {},
-            "sample_values": p.sample_values or [],
+            **row,
+            "patterns": row["patterns"] or {},
+            "sample_values": row["sample_values"] or [],
         }
-        for p in profiles
-    ]
+        for row in rows
+    ])
+    return revalidated_json_response(request, body, headers=cursor_headers(next_cursor))
 
 
 @router.get("/sheets/{sheet_id}/download")
-async def download_sheet(sheet_id: int, db: Session = Depends(get_db)):
-    """Download a split sheet as CSV file."""
-    sheet = db.query(Sheet).filter(Sheet.id == sheet_id).first()
+def download_sheet(sheet_id: int, request: Request, db: Session = Depends(get_db)):
+    """Download a split sheet as CSV file (revalidated by mtime and size)."""
+    sheet = db.get(Sheet, sheet_id)
     if not sheet:
         raise HTTPException(status_code=404, detail="Sheet not found")
 
@@ -50,8 +82,9 @@ async def download_sheet(sheet_id: int, db: Session = Depends(get_db)):
             detail="Split sheet file not found. This sheet may not have been split yet."
         )
 
-    return FileResponse(
-        path=str(file_path),
+    return cached_file_response(
+        request,
+        file_path,
         filename=f"{sheet.name}.csv",
         media_type="text/csv"
     )
@@ -1,10 +1,15 @@
 """
 API routes for import templates
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from functools import lru_cache
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.core.database import get_db
+from app.core.http_cache import cached_json_response
 from app.services.template_service import TemplateService
 from app.schemas.template import (
     Template,
@@ -15,11 +20,31 @@ from app.schemas.template import (
 
 router = APIRouter()
 
+_TEMPLATE_LIST_ADAPTER = TypeAdapter(List[TemplateListItem])
+
+
+@lru_cache(maxsize=16)
+def _template_list_body(category: Optional[str] = None) -> bytes:
+    """Serialised template listing; the JSON templates only change on redeploy."""
+    templates = TemplateService(None).list_templates(category=category)
+    return _TEMPLATE_LIST_ADAPTER.dump_json(templates)
+
+
+@lru_cache(maxsize=1)
+def _template_categories_body() -> bytes:
+    return orjson.dumps(TemplateService(None).get_categories())
+
+
+def warm_template_cache() -> None:
+    """Build the unfiltered listing and categories before the first request."""
+    _template_list_body()
+    _template_categories_body()
+
 
 @router.get("/templates", response_model=List[TemplateListItem])
 async def list_templates(
+    request: Request,
     category: Optional[str] = Query(None, description="Filter by category"),
-    db: Session = Depends(get_db)
 ):
     """
     List all available import templates
@@ -27,20 +52,32 @@ async def list_templates(
     Query parameters:
     - category: Optional filter by category (foundation, sales, projects, accounting, complete)
     """
-    service = TemplateService(db)
-    templates = service.list_templates(category=category)
-    return templates
+    return cached_json_response(request, _template_list_body(category), max_age=300)
 
 
 @router.get("/templates/categories")
-async def get_template_categories(db: Session = Depends(get_db)):
+async def get_template_categories(request: Request):
     """Get all available template categories"""
+    return cached_json_response(request, _template_categories_body(), max_age=300)
+
+
+@router.get("/templates/progress", response_model=List[TemplateProgress])
+def get_templates_progress(
+    ids: List[str] = Query(..., description="Template identifiers"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get progress for several templates in one call (e.g. a dashboard)
+
+    Unknown template ids are skipped. Runs for all templates are loaded in
+    one query rather than one round trip per template.
+    """
     service = TemplateService(db)
-    return service.get_categories()
+    return list(service.get_templates_progress(ids).values())
 
 
 @router.get("/templates/{template_id}", response_model=Template)
-async def get_template(template_id: str, db: Session = Depends(get_db)):
+def get_template(template_id: str, db: Session = Depends(get_db)):
     """
     Get detailed information about a specific template
 
@@ -60,7 +97,7 @@ async def get_template(template_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/templates/{template_id}/progress", response_model=TemplateProgress)
-async def get_template_progress(template_id: str, db: Session = Depends(get_db)):
+def get_template_progress(template_id: str, db: Session = Depends(get_db)):
     """
     Get progress information for a template based on completed imports
 
@@ -80,7 +117,7 @@ async def get_template_progress(template_id: str, db: Session = Depends(get_db))
 
 
 @router.post("/templates/{template_id}/instantiate", status_code=status.HTTP_201_CREATED)
-async def instantiate_template(
+def instantiate_template(
     template_id: str,
     request: TemplateInstantiateRequest,
     db: Session = Depends(get_db)
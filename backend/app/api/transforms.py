@@ -1,6 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from functools import lru_cache
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import case, func, select, update
 from sqlalchemy.orm import Session
-from app.core.database import get_db
+from app.core.database import get_db, insert_returning
+from app.core.http_cache import cached_json_response
 from app.models import Transform, Mapping
 from app.services.transform_service import TransformService
 from pydantic import BaseModel
@@ -37,14 +42,41 @@ class TestTransformRequest(BaseModel):
     sample_value: Any
 
 
+@lru_cache(maxsize=1)
+def _available_transforms_body() -> bytes:
+    """Serialised transform registry; it is fixed for the life of the process."""
+    return orjson.dumps(TransformService.get_available_transforms())
+
+
+def _renumber_transforms(db: Session, transform_ids: List[int]) -> None:
+    """Set each transform's order to its index in one UPDATE ... CASE."""
+    if not transform_ids:
+        return
+
+    db.execute(
+        update(Transform)
+        .where(Transform.id.in_(transform_ids))
+        .values(order=case({tid: i for i, tid in enumerate(transform_ids)}, value=Transform.id))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _ordered_transform_ids(db: Session, mapping_id: int) -> List[int]:
+    return list(db.scalars(
+        select(Transform.id)
+        .where(Transform.mapping_id == mapping_id)
+        .order_by(Transform.order, Transform.id)
+    ))
+
+
 @router.get("/transforms/available")
-async def get_available_transforms():
+async def get_available_transforms(request: Request):
     """Get list of available transform functions with metadata."""
-    return TransformService.get_available_transforms()
+    return cached_json_response(request, _available_transforms_body(), max_age=3600)
 
 
 @router.get("/mappings/{mapping_id}/transforms", response_model=List[TransformResponse])
-async def get_mapping_transforms(
+def get_mapping_transforms(
     mapping_id: int,
     db: Session = Depends(get_db)
 ):
@@ -57,44 +89,46 @@ async def get_mapping_transforms(
 
 
 @router.post("/mappings/{mapping_id}/transforms", response_model=TransformResponse)
-async def create_transform(
+def create_transform(
     mapping_id: int,
     transform: TransformCreate,
     db: Session = Depends(get_db)
 ):
     """Add a transform to a mapping."""
-    # Verify mapping exists
-    mapping = db.query(Mapping).filter(Mapping.id == mapping_id).first()
-    if not mapping:
+    # Append after the current tail, even if the chain has holes. Selecting
+    # from mappings by PK doubles as the existence check: no row means 404.
+    tail = (
+        select(func.max(Transform.order) + 1)
+        .where(Transform.mapping_id == mapping_id)
+        .scalar_subquery()
+    )
+    next_order = db.scalar(
+        select(func.coalesce(tail, 0)).where(Mapping.id == mapping_id)
+    )
+    if next_order is None:
         raise HTTPException(status_code=404, detail="Mapping not found")
 
-    # Get next order number
-    max_order = db.query(Transform).filter(
-        Transform.mapping_id == mapping_id
-    ).count()
-
-    new_transform = Transform(
+    new_transform = insert_returning(
+        db,
+        Transform,
         mapping_id=mapping_id,
-        order=max_order,
+        order=next_order,
         fn=transform.fn,
         params=transform.params
     )
-
-    db.add(new_transform)
     db.commit()
-    db.refresh(new_transform)
 
     return new_transform
 
 
 @router.put("/transforms/{transform_id}", response_model=TransformResponse)
-async def update_transform(
+def update_transform(
     transform_id: int,
     update: TransformUpdate,
     db: Session = Depends(get_db)
 ):
     """Update a transform."""
-    transform = db.query(Transform).filter(Transform.id == transform_id).first()
+    transform = db.get(Transform, transform_id)
     if not transform:
         raise HTTPException(status_code=404, detail="Transform not found")
 
@@ -112,60 +146,44 @@ async def update_transform(
 
 
 @router.delete("/transforms/{transform_id}")
-async def delete_transform(
+def delete_transform(
     transform_id: int,
     db: Session = Depends(get_db)
 ):
     """Delete a transform."""
-    transform = db.query(Transform).filter(Transform.id == transform_id).first()
+    transform = db.get(Transform, transform_id)
     if not transform:
         raise HTTPException(status_code=404, detail="Transform not found")
 
     mapping_id = transform.mapping_id
     db.delete(transform)
+    db.flush()
 
-    # Reorder remaining transforms
-    remaining = db.query(Transform).filter(
-        Transform.mapping_id == mapping_id
-    ).order_by(Transform.order).all()
-
-    for i, t in enumerate(remaining):
-        t.order = i
-
+    # Close the gap left by the deleted transform
+    _renumber_transforms(db, _ordered_transform_ids(db, mapping_id))
     db.commit()
 
     return {"message": "Transform deleted"}
 
 
 @router.post("/transforms/{transform_id}/reorder")
-async def reorder_transform(
+def reorder_transform(
     transform_id: int,
     new_order: int,
     db: Session = Depends(get_db)
 ):
     """Reorder a transform in the execution chain."""
-    transform = db.query(Transform).filter(Transform.id == transform_id).first()
+    transform = db.get(Transform, transform_id)
     if not transform:
         raise HTTPException(status_code=404, detail="Transform not found")
 
-    old_order = transform.order
-    mapping_id = transform.mapping_id
-
-    # Get all transforms for this mapping
-    transforms = db.query(Transform).filter(
-        Transform.mapping_id == mapping_id
-    ).order_by(Transform.order).all()
-
-    # Remove from old position
-    transforms.pop(old_order)
-
-    # Insert at new position
-    transforms.insert(new_order, transform)
+    transform_ids = _ordered_transform_ids(db, transform.mapping_id)
 
-    # Update all orders
-    for i, t in enumerate(transforms):
-        t.order = i
+    # Move to the new position and renumber the chain
+    transform_ids.remove(transform_id)
+    transform_ids.insert(new_order, transform_id)
 
+    _renumber_transforms(db, transform_ids)
     db.commit()
 
     return {"message": "Transform reordered"}
@@ -21,7 +21,7 @@ class ChangeType(Enum):
     DTYPE_CHANGED = "dtype_changed"
 
 
-@dataclass
+@dataclass(slots=True)
 class Change:
     """Represents a single change made during cleaning."""
     change_type: ChangeType
@@ -37,7 +37,7 @@ class Change:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CleaningResult:
     """
     Result of a cleaning rule execution.
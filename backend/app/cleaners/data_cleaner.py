@@ -4,7 +4,8 @@ Main data cleaning orchestrator using Polars.
 Runs cleaning rules in priority order and generates a comprehensive report.
 """
 from pathlib import Path
-from typing import List, Tuple, Optional, Union
+from collections import Counter
+from typing import Dict, List, Tuple, Optional, Union
 import polars as pl
 import logging
 
@@ -73,8 +74,9 @@ class DataCleaner:
         # Store original column names for mapping
         original_columns = df.columns
 
-        # Clone to avoid modifying original
-        df_cleaned = df.clone()
+        # Rules return new frames rather than mutating their input, so the
+        # caller's df is left intact without an up-front clone
+        df_cleaned = df
 
         logger.info(f"Starting data cleaning with {len(self.rules)} rules")
 
@@ -113,35 +115,46 @@ class DataCleaner:
         # (This is approximate since columns may have been added/removed)
         final_columns = df_cleaned.columns
 
+        final_set = set(final_columns)
+        dropped = set(report.columns_dropped)
+
         # Try to match original to final columns
         for orig_col in original_columns:
-            if orig_col in final_columns:
+            if orig_col in final_set:
                 # Column still exists (unchanged or renamed back)
                 report.column_mappings[orig_col] = orig_col
-            elif orig_col not in final_columns:
+            elif orig_col not in dropped:
                 # Column was either renamed or dropped
                 # For now, just mark as dropped
-                if orig_col not in report.columns_dropped:
-                    report.columns_dropped.append(orig_col)
+                report.columns_dropped.append(orig_col)
+                dropped.add(orig_col)
+
+        # First recorded rename into each new name, indexed once instead of
+        # rescanning every change for every final column
+        renamed_from: Dict[str, str] = {}
+        for change in report.changes:
+            if change.get("type") == "column_renamed":
+                details = change.get("details", {})
+                old_name = details.get("old_name")
+                if old_name:
+                    renamed_from.setdefault(details.get("new_name"), old_name)
+
+        # Occurrences of each mapped-to name, kept in step with column_mappings
+        mapped_to = Counter(report.column_mappings.values())
+
+        def map_column(orig_col: str, final_col: str) -> None:
+            previous = report.column_mappings.get(orig_col)
+            if previous is not None:
+                mapped_to[previous] -= 1
+            report.column_mappings[orig_col] = final_col
+            mapped_to[final_col] += 1
 
         # Add any new columns that appeared
         for final_col in final_columns:
-            if final_col not in report.column_mappings.values():
-                # This is a renamed column or new column
-                # Try to find the original name from changes
-                found = False
-                for change in report.changes:
-                    if (change.get("type") == "column_renamed" and
-                        change.get("details", {}).get("new_name") == final_col):
-                        old_name = change["details"].get("old_name")
-                        if old_name:
-                            report.column_mappings[old_name] = final_col
-                            found = True
-                            break
-
-                if not found:
-                    # Assume it's unchanged
-                    report.column_mappings[final_col] = final_col
+            if mapped_to[final_col] <= 0:
+                # This is a renamed column or new column; assume it is
+                # unchanged unless a rename produced it
+                map_column(renamed_from.get(final_col, final_col), final_col)
 
         # Update final shape
         report.cleaned_shape = (df_cleaned.height, df_cleaned.width)
@@ -4,12 +4,51 @@ Cleaning report generation and formatting.
 Tracks what was cleaned and provides output in multiple formats.
 """
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple, Any
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 import json
 from datetime import datetime
 
+import orjson
 
-@dataclass
+
+def _capped(
+    items: Sequence[Any],
+    limit: int,
+    render: Callable[[Any], str],
+    more: Callable[[int], str],
+) -> Iterator[str]:
+    """Render the first ``limit`` items, then a "... and N more" line if any were cut."""
+    yield from map(render, items[:limit])
+    if len(items) > limit:
+        yield more(len(items) - limit)
+
+
+def _more_line(count: int) -> str:
+    return f"  ... and {count} more"
+
+
+def _dumps(obj: Any, indent: Optional[int]) -> str:
+    """
+    Serialize with orjson; it only offers 2-space or compact output, so
+    other indents go through the stdlib encoder.
+    """
+    if indent not in (None, 2):
+        return json.dumps(obj, indent=indent, default=str)
+    option = orjson.OPT_NON_STR_KEYS
+    if indent == 2:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, default=str, option=option).decode()
+
+
+def _section(heading: str, body: Iterable[str]) -> Iterator[str]:
+    """A summary section: heading, body lines, blank separator."""
+    yield heading
+    yield from body
+    yield ""
+
+
+@dataclass(slots=True)
 class CleaningReport:
     """
     Report of cleaning operations performed.
@@ -90,116 +129,91 @@ class CleaningReport:
             "config_used": self.config_used,
         }
 
-    def to_json(self, indent: int = 2) -> str:
+    def to_json(self, indent: Optional[int] = 2) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent, default=str)
+        return _dumps(self.to_dict(), indent)
+
+    def _renamed(self) -> List[Tuple[str, str]]:
+        return [(orig, clean) for orig, clean in self.column_mappings.items() if orig != clean]
+
+    def _rule_stat_lines(self) -> Iterator[str]:
+        for rule_name, stats in self.rule_stats.items():
+            yield f"  {rule_name}:"
+            yield from (f"    {key}: {value}" for key, value in stats.items())
 
     def to_summary(self) -> str:
         """Generate a text summary of the cleaning report."""
-        lines = [
-            "="*80,
-            "DATA CLEANING REPORT",
-            "="*80,
-            f"Timestamp: {self.timestamp}",
-            "",
-            "SHAPE CHANGES:",
-            f"  Original: {self.original_shape[0]} rows × {self.original_shape[1]} columns",
-            f"  Cleaned:  {self.cleaned_shape[0]} rows × {self.cleaned_shape[1]} columns",
-            f"  Removed:  {self.rows_removed} rows, {self.columns_removed} columns",
-            "",
-        ]
-
-        if self.column_mappings:
-            renamed = [(orig, clean) for orig, clean in self.column_mappings.items() if orig != clean]
-            if renamed:
-                lines.extend([
-                    f"COLUMN RENAMES ({len(renamed)}):",
-                ])
-                for orig, clean in renamed[:10]:
-                    lines.append(f"  '{orig}' → '{clean}'")
-                if len(renamed) > 10:
-                    lines.append(f"  ... and {len(renamed)-10} more")
-                lines.append("")
-
-        if self.columns_dropped:
-            lines.extend([
+        renamed = self._renamed()
+
+        return "\n".join(chain(
+            (
+                "="*80,
+                "DATA CLEANING REPORT",
+                "="*80,
+                f"Timestamp: {self.timestamp}",
+                "",
+                "SHAPE CHANGES:",
+                f"  Original: {self.original_shape[0]} rows × {self.original_shape[1]} columns",
+                f"  Cleaned:  {self.cleaned_shape[0]} rows × {self.cleaned_shape[1]} columns",
+                f"  Removed:  {self.rows_removed} rows, {self.columns_removed} columns",
+                "",
+            ),
+            _section(
+                f"COLUMN RENAMES ({len(renamed)}):",
+                _capped(renamed, 10, lambda pair: f"  '{pair[0]}' → '{pair[1]}'", _more_line),
+            ) if renamed else (),
+            _section(
                 f"COLUMNS DROPPED ({len(self.columns_dropped)}):",
-            ])
-            for col in self.columns_dropped[:10]:
-                lines.append(f"  '{col}'")
-            if len(self.columns_dropped) > 10:
-                lines.append(f"  ... and {len(self.columns_dropped)-10} more")
-            lines.append("")
-
-        if self.rule_stats:
-            lines.extend([
-                "RULE STATISTICS:",
-            ])
-            for rule_name, stats in self.rule_stats.items():
-                lines.append(f"  {rule_name}:")
-                for key, value in stats.items():
-                    lines.append(f"    {key}: {value}")
-            lines.append("")
-
-        if self.warnings:
-            lines.extend([
+                _capped(self.columns_dropped, 10, lambda col: f"  '{col}'", _more_line),
+            ) if self.columns_dropped else (),
+            _section("RULE STATISTICS:", self._rule_stat_lines()) if self.rule_stats else (),
+            _section(
                 f"WARNINGS ({len(self.warnings)}):",
-            ])
-            for warning in self.warnings[:5]:
-                lines.append(f"  ⚠ {warning}")
-            if len(self.warnings) > 5:
-                lines.append(f"  ... and {len(self.warnings)-5} more")
-            lines.append("")
-
-        lines.append("="*80)
-
-        return "\n".join(lines)
+                _capped(self.warnings, 5, lambda warning: f"  ⚠ {warning}", _more_line),
+            ) if self.warnings else (),
+            ("="*80,),
+        ))
 
     def to_html(self) -> str:
         """Generate HTML report (for frontend display)."""
         # Simplified HTML for now
-        html = [
-            "<div class='cleaning-report'>",
-            f"<h2>Data Cleaning Report</h2>",
-            f"<p><strong>Timestamp:</strong> {self.timestamp}</p>",
-            "",
-            "<h3>Summary</h3>",
-            "<ul>",
-            f"<li><strong>Original:</strong> {self.original_shape[0]} rows × {self.original_shape[1]} columns</li>",
-            f"<li><strong>Cleaned:</strong> {self.cleaned_shape[0]} rows × {self.cleaned_shape[1]} columns</li>",
-            f"<li><strong>Rows removed:</strong> {self.rows_removed}</li>",
-            f"<li><strong>Columns removed:</strong> {self.columns_removed}</li>",
-            f"<li><strong>Columns renamed:</strong> {self.columns_renamed}</li>",
-            "</ul>",
-        ]
-
-        renamed = [(orig, clean) for orig, clean in self.column_mappings.items() if orig != clean]
-        if renamed:
-            html.extend([
-                "<h3>Column Renames</h3>",
-                "<table>",
-                "<tr><th>Original</th><th>Cleaned</th></tr>",
-            ])
-            for orig, clean in renamed[:20]:
-                html.append(f"<tr><td>{orig}</td><td>{clean}</td></tr>")
-            if len(renamed) > 20:
-                html.append(f"<tr><td colspan='2'><em>... and {len(renamed)-20} more</em></td></tr>")
-            html.append("</table>")
-
-        if self.warnings:
-            html.extend([
-                "<h3>Warnings</h3>",
+        renamed = self._renamed()
+
+        return "\n".join(chain(
+            (
+                "<div class='cleaning-report'>",
+                f"<h2>Data Cleaning Report</h2>",
+                f"<p><strong>Timestamp:</strong> {self.timestamp}</p>",
+                "",
+                "<h3>Summary</h3>",
                 "<ul>",
-            ])
-            for warning in self.warnings[:10]:
-                html.append(f"<li>{warning}</li>")
-            if len(self.warnings) > 10:
-                html.append(f"<li><em>... and {len(self.warnings)-10} more</em></li>")
-            html.append("</ul>")
-
-        html.append("</div>")
-
-        return "\n".join(html)
+                f"<li><strong>Original:</strong> {self.original_shape[0]} rows × {self.original_shape[1]} columns</li>",
+                f"<li><strong>Cleaned:</strong> {self.cleaned_shape[0]} rows × {self.cleaned_shape[1]} columns</li>",
+                f"<li><strong>Rows removed:</strong> {self.rows_removed}</li>",
+                f"<li><strong>Columns removed:</strong> {self.columns_removed}</li>",
+                f"<li><strong>Columns renamed:</strong> {len(renamed)}</li>",
+                "</ul>",
+            ),
+            chain(
+                ("<h3>Column Renames</h3>", "<table>", "<tr><th>Original</th><th>Cleaned</th></tr>"),
+                _capped(
+                    renamed, 20,
+                    lambda pair: f"<tr><td>{pair[0]}</td><td>{pair[1]}</td></tr>",
+                    lambda n: f"<tr><td colspan='2'><em>... and {n} more</em></td></tr>",
+                ),
+                ("</table>",),
+            ) if renamed else (),
+            chain(
+                ("<h3>Warnings</h3>", "<ul>"),
+                _capped(
+                    self.warnings, 10,
+                    lambda warning: f"<li>{warning}</li>",
+                    lambda n: f"<li><em>... and {n} more</em></li>",
+                ),
+                ("</ul>",),
+            ) if self.warnings else (),
+            ("</div>",),
+        ))
 
     def __str__(self) -> str:
         """String representation (summary)."""
@@ -8,7 +8,9 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import List
+from collections import Counter
+from functools import lru_cache
+from typing import List, Optional
 
 import polars as pl
 
@@ -18,6 +20,80 @@ from ..config import CleaningConfig
 
 logger = logging.getLogger(__name__)
 
+_PARENTHETICAL = r"\s*\([^)]*\)"
+_PARENTHETICAL_RE = re.compile(_PARENTHETICAL)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=32)
+def _fused_pattern(special_chars: str) -> re.Pattern:
+    """
+    Compile the pattern that does steps 1-2 in one pass.
+
+    A special-char run is "trailing" once parentheticals are gone, i.e.
+    when only parentheticals and further special chars follow it. Stray
+    "?" go in the same pass.
+    """
+    chars = re.escape(special_chars)
+    return re.compile(
+        rf"{_PARENTHETICAL}|[{chars}\.]+(?=(?:{_PARENTHETICAL}|[{chars}\.])*$)|\?"
+    )
+
+
+def _strip_trailing(text: str, chars: str) -> str:
+    """Drop a trailing run of ``chars``, matching ``re.sub(rf"[{chars}]+$", "", text)``."""
+    if text.endswith("\n") and "\n" not in chars:
+        # "$" also matches just before a final newline
+        return text[:-1].rstrip(chars) + "\n"
+    return text.rstrip(chars)
+
+
+@lru_cache(maxsize=4096)
+def _clean_name_cached(
+    name: str,
+    remove_parentheses: bool,
+    remove_special_chars: bool,
+    special_chars: str,
+    trim: bool,
+    normalize_spaces: bool,
+) -> str:
+    """
+    Clean one column name; pure in its arguments, so results are memoised.
+
+    The same headers recur across sheets, files and pipeline re-runs.
+    """
+    # Default config: one regex pass, then one split/join for steps 3-4
+    if remove_parentheses and remove_special_chars:
+        cleaned = _fused_pattern(special_chars).sub("", name)
+    else:
+        cleaned = name
+
+        # Step 1: Remove parentheses and contents if enabled
+        if remove_parentheses:
+            cleaned = _PARENTHETICAL_RE.sub("", cleaned)
+
+        # Step 2: Remove trailing special characters if enabled
+        if remove_special_chars:
+            cleaned = _strip_trailing(cleaned, special_chars + ".")
+            cleaned = cleaned.replace("?", "")
+
+    if trim and normalize_spaces:
+        # Trim and collapse whitespace runs in a single scan
+        cleaned = " ".join(cleaned.split())
+    else:
+        # Step 3: Trim whitespace
+        if trim:
+            cleaned = cleaned.strip()
+
+        # Step 4: Normalize spaces if enabled
+        if normalize_spaces:
+            cleaned = _WHITESPACE_RE.sub(" ", cleaned)
+
+    if not cleaned or cleaned.isspace():
+        cleaned = "Unnamed"
+
+    return cleaned
+
 
 class ColumnNameCleaningRule(CleaningRule):
     """
@@ -54,32 +130,38 @@ class ColumnNameCleaningRule(CleaningRule):
         Returns:
             CleaningResult with cleaned column names
         """
-        result = CleaningResult(df=df.clone())
+        # Only renames, which return a new frame; the input is never mutated
+        result = CleaningResult(df=df)
 
         original_columns = result.df.columns
-        cleaned_columns: List[str] = []
-        changes_made = 0
-
-        for col in original_columns:
-            cleaned = self._clean_column_name(str(col))
-
-            if cleaned != str(col):
-                changes_made += 1
-                result.add_change(
-                    ChangeType.COLUMN_RENAMED,
-                    "Renamed column",
-                    {"old_name": str(col), "new_name": cleaned},
-                )
-                logger.debug(f"Renamed column: '{col}' → '{cleaned}'")
-
-            cleaned_columns.append(cleaned)
-
-        # Check for duplicates after cleaning
-        if len(cleaned_columns) != len(set(cleaned_columns)):
-            cleaned_columns = self._handle_duplicates(cleaned_columns, result)
-
-        rename_map = dict(zip(original_columns, cleaned_columns))
-        result.df = result.df.rename(rename_map)
+        cleaned_columns = [self._clean_column_name(str(col)) for col in original_columns]
+
+        renamed = [
+            (str(old), new)
+            for old, new in zip(original_columns, cleaned_columns)
+            if str(old) != new
+        ]
+        changes_made = len(renamed)
+        for old, new in renamed:
+            result.add_change(
+                ChangeType.COLUMN_RENAMED,
+                "Renamed column",
+                {"old_name": old, "new_name": new},
+            )
+            logger.debug("Renamed column: '%s' → '%s'", old, new)
+
+        # Frame columns are unique, so already-clean headers (e.g. a pipeline
+        # re-run) can neither collide nor need a rename: return df untouched
+        if renamed:
+            # Check for duplicates after cleaning
+            counts = Counter(cleaned_columns)
+            if len(counts) != len(cleaned_columns):
+                cleaned_columns = self._handle_duplicates(cleaned_columns, result, counts)
+
+            # One rename covering only the columns that actually change
+            result.df = result.df.rename({
+                old: new for old, new in zip(original_columns, cleaned_columns) if old != new
+            })
 
         result.stats["columns_renamed"] = changes_made
         result.stats["original_column_count"] = len(original_columns)
@@ -100,47 +182,44 @@ class ColumnNameCleaningRule(CleaningRule):
         Returns:
             Cleaned column name
         """
-        cleaned = name
-
-        # Step 1: Remove parentheses and contents if enabled
-        if self.config.remove_parentheses:
-            cleaned = re.sub(r"\s*\([^)]*\)", "", cleaned)
-
-        # Step 2: Remove trailing special characters if enabled
-        if self.config.remove_special_chars:
-            chars = re.escape(self.config.special_chars_to_remove)
-            cleaned = re.sub(rf"[{chars}\.]+$", "", cleaned)
-            cleaned = cleaned.replace("?", "")
-
-        # Step 3: Trim whitespace
-        if self.config.trim_column_names:
-            cleaned = cleaned.strip()
-
-        # Step 4: Normalize spaces if enabled
-        if self.config.normalize_spaces:
-            cleaned = re.sub(r"\s+", " ", cleaned)
-
-        if not cleaned or cleaned.isspace():
-            cleaned = "Unnamed"
-
-        return cleaned
-
-    def _handle_duplicates(self, columns: List[str], result: CleaningResult) -> List[str]:
+        config = self.config
+        return _clean_name_cached(
+            name,
+            config.remove_parentheses,
+            config.remove_special_chars,
+            config.special_chars_to_remove,
+            config.trim_column_names,
+            config.normalize_spaces,
+        )
+
+    def _handle_duplicates(
+        self,
+        columns: List[str],
+        result: CleaningResult,
+        counts: Optional[Counter] = None,
+    ) -> List[str]:
         """
         Handle duplicate column names by adding suffixes.
 
         Args:
             columns: List of column names (may have duplicates)
             result: CleaningResult to add warnings to
+            counts: Occurrences of each name, if the caller already has them
 
         Returns:
             List with unique column names
         """
+        if counts is None:
+            counts = Counter(columns)
+
         seen = {}
         unique_columns: List[str] = []
 
         for col in columns:
-            if col not in seen:
+            # Names that occur once pass straight through
+            if counts[col] == 1:
+                unique_columns.append(col)
+            elif col not in seen:
                 seen[col] = 0
                 unique_columns.append(col)
             else:
@@ -39,6 +39,13 @@ class WhitespaceRule(CleaningRule):
     def description(self) -> str:
         return "Trim leading/trailing whitespace from all text values"
 
+    def _trimmed(self, column_name: str) -> pl.Expr:
+        """Expression for the cleaned values of one string column."""
+        trimmed = pl.col(column_name).str.strip_chars()
+        if self.config.normalize_internal_spaces:
+            trimmed = trimmed.str.replace_all(r"\s+", " ")
+        return trimmed
+
     def clean(self, df: pl.DataFrame) -> CleaningResult:
         """
         Trim whitespace from all string columns.
@@ -49,45 +56,52 @@ class WhitespaceRule(CleaningRule):
         Returns:
             CleaningResult with trimmed values
         """
-        result = CleaningResult(df=df.clone())
+        # Columns are cleaned independently, so every column's work goes into
+        # one batch of expressions that Polars evaluates in parallel
+        result = CleaningResult(df=df)
+
+        string_columns = [
+            name for name, dtype in df.schema.items()
+            if dtype in (pl.Utf8, pl.String)
+        ]
 
         columns_cleaned = 0
         values_cleaned = 0
 
-        for column_name in result.df.columns:
-            column = result.df[column_name]
-
-            if column.dtype not in (pl.Utf8, pl.String):
-                continue
-
-            non_null_mask = column.is_not_null()
-            if not bool(non_null_mask.any()):
-                continue
-
-            trimmed = column.str.strip_chars()
-            if self.config.normalize_internal_spaces:
-                trimmed = trimmed.str.replace_all(r"\s+", " ")
-
-            # Identify actual changes (ignoring nulls)
-            changed_mask = non_null_mask & (column != trimmed)
-            changed = int(changed_mask.sum())
-            if changed == 0:
-                continue
-
-            columns_cleaned += 1
-            values_cleaned += changed
-
-            result.df = result.df.with_columns(trimmed.alias(column_name))
-            result.add_change(
-                ChangeType.VALUE_MODIFIED,
-                f"Trimmed whitespace in column '{column_name}'",
-                {"column": column_name, "values_modified": changed},
-            )
-            logger.debug(
-                "Trimmed whitespace in %s values for column '%s'",
-                changed,
-                column_name,
-            )
+        if string_columns:
+            # Count actual changes per column (ignoring nulls) in one pass
+            counts = df.select(
+                (pl.col(name).is_not_null() & (pl.col(name) != self._trimmed(name)))
+                .sum()
+                .alias(name)
+                for name in string_columns
+            ).row(0)
+
+            changed_columns = []
+            for column_name, changed in zip(string_columns, counts):
+                changed = int(changed or 0)
+                if changed == 0:
+                    continue
+
+                changed_columns.append(column_name)
+                columns_cleaned += 1
+                values_cleaned += changed
+
+                result.add_change(
+                    ChangeType.VALUE_MODIFIED,
+                    f"Trimmed whitespace in column '{column_name}'",
+                    {"column": column_name, "values_modified": changed},
+                )
+                logger.debug(
+                    "Trimmed whitespace in %s values for column '%s'",
+                    changed,
+                    column_name,
+                )
+
+            if changed_columns:
+                result.df = df.with_columns(
+                    self._trimmed(name).alias(name) for name in changed_columns
+                )
 
         result.stats["columns_cleaned"] = columns_cleaned
         result.stats["values_cleaned"] = values_cleaned
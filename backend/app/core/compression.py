@@ -0,0 +1,38 @@
+"""
+Response compression limited to JSON bodies.
+
+Large JSON listings compress well (repeated keys), but file downloads, ZIP
+archives and NDJSON streams must pass through untouched: compressing a
+FileResponse defeats sendfile and breaks Range requests, ZIPs are already
+compressed, and a gzipped stream is buffered by the compressor.
+"""
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from starlette.types import Message, Receive, Scope, Send
+
+COMPRESSIBLE_CONTENT_TYPES = ("application/json",)
+
+
+class JSONGZipResponder(GZipResponder):
+    """GZipResponder that passes every non-JSON response through as-is."""
+
+    async def send_with_compression(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            await super().send_with_compression(message)
+            if not content_type.startswith(COMPRESSIBLE_CONTENT_TYPES):
+                self.content_type_is_excluded = True
+            return
+        await super().send_with_compression(message)
+
+
+class JSONGZipMiddleware(GZipMiddleware):
+    """Gzip ``application/json`` responses for clients that accept it."""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or "gzip" not in Headers(scope=scope).get("Accept-Encoding", ""):
+            await self.app(scope, receive, send)
+            return
+
+        responder = JSONGZipResponder(self.app, self.minimum_size, compresslevel=self.compresslevel)
+        await responder(scope, receive, send)
@@ -28,6 +28,8 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    # Compiled-statement LRU shared by all connections (SQLAlchemy default 500)
+    DB_QUERY_CACHE_SIZE: int = 1200
 
     # Redis
     REDIS_URL: str
@@ -44,6 +46,11 @@ class Settings(BaseSettings):
     # Storage
     STORAGE_PATH: str = "../storage"
 
+    # Hand large file downloads to nginx via X-Accel-Redirect. Requires an
+    # `internal` nginx location at X_ACCEL_PREFIX aliased to STORAGE_PATH.
+    X_ACCEL_ENABLED: bool = False
+    X_ACCEL_PREFIX: str = "/_storage/"
+
     # Field Mapper - Odoo Dictionary Path
     ODOO_DICTIONARY_PATH: str = "../odoo-dictionary"
 
@@ -56,6 +63,18 @@ class Settings(BaseSettings):
     ENVIRONMENT: str = "development"
     DEBUG: bool = False
 
+    # Per-request SQL query count/time headers (always on when DEBUG)
+    QUERY_STATS_ENABLED: bool = False
+    QUERY_COUNT_WARN_THRESHOLD: int = 20
+
+    # gzip JSON responses at least this large; level 5 keeps most of the
+    # size win of 9 at a fraction of the CPU
+    GZIP_MIN_SIZE: int = 1024
+    GZIP_LEVEL: int = 5
+
+    # Worker threads for sync handlers and blocking Odoo XML-RPC (AnyIO default 40)
+    THREADPOOL_SIZE: int = 100
+
     # Export settings (Commit 5)
     MODE: str = "lean"  # lean or scale
     RUNNER: str = "inline"  # inline or thread or celery
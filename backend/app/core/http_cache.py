@@ -0,0 +1,121 @@
+"""
+HTTP validator helpers for endpoints that serve pre-serialised JSON or files.
+
+Bodies are fingerprinted with a short BLAKE2b digest used as a strong ETag,
+so repeat requests carrying If-None-Match get an empty 304. Files use a weak
+ETag and Last-Modified derived from their stat, so they are never read to
+be validated.
+"""
+import hashlib
+import os
+from email.utils import formatdate, parsedate_to_datetime
+from functools import lru_cache
+from typing import Optional
+
+from fastapi import Request, Response
+from fastapi.responses import FileResponse
+
+
+def _digest_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+
+@lru_cache(maxsize=512)
+def etag_for(body: bytes) -> str:
+    """Return a quoted strong ETag for ``body`` (memoised; static bodies only)."""
+    return _digest_etag(body)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    # If-None-Match uses weak comparison, so W/"x" matches "x"
+    etag = etag.removeprefix("W/")
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def _conditional_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    cache_control: str,
+    headers: Optional[dict] = None,
+) -> Response:
+    headers = {**(headers or {}), "ETag": etag, "Cache-Control": cache_control}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def cached_json_response(request: Request, body: bytes, max_age: int = 60) -> Response:
+    """
+    Serve a pre-serialised static JSON body with ETag/Cache-Control headers.
+
+    Returns 304 Not Modified when the client's If-None-Match matches.
+    """
+    return _conditional_response(request, body, etag_for(body), f"public, max-age={max_age}")
+
+
+def revalidated_json_response(request: Request, body: bytes, headers: Optional[dict] = None) -> Response:
+    """
+    Serve a JSON body built from live data, letting clients revalidate it.
+
+    ``no-cache`` makes clients check back on every request, but an unchanged
+    body costs them an empty 304. The digest is not memoised: keying an
+    lru_cache on live bodies would pin every variant in memory.
+    """
+    return _conditional_response(request, body, _digest_etag(body), "no-cache", headers)
+
+
+def _not_modified_since(if_modified_since: str, mtime: float) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+    # HTTP dates have one-second resolution
+    return int(mtime) <= since
+
+
+def cached_file_response(
+    request: Request,
+    path: os.PathLike | str,
+    filename: str,
+    media_type: str,
+    max_age: int = 300,
+) -> Response:
+    """
+    Serve a file from disk with ETag/Last-Modified validators.
+
+    If-None-Match takes precedence over If-Modified-Since, as in RFC 9110.
+    The stat result is handed to FileResponse so the file is stat'ed once and
+    still sent with sendfile.
+    """
+    stat = os.stat(path)
+    etag = f'W/"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+        "Cache-Control": f"private, max-age={max_age}",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        not_modified = _etag_matches(if_none_match, etag)
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        not_modified = bool(if_modified_since) and _not_modified_since(if_modified_since, stat.st_mtime)
+
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+
+    return FileResponse(
+        path=path,
+        filename=filename,
+        media_type=media_type,
+        headers=headers,
+        stat_result=stat,
+    )
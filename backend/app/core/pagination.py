@@ -0,0 +1,36 @@
+"""
+Keyset (cursor) pagination for list endpoints.
+
+A page is ``id > after_id ORDER BY id LIMIT limit + 1``: the primary-key index
+serves the scan without OFFSET's skip cost, and the extra row tells whether
+another page follows without a COUNT.
+"""
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+# Bare-list endpoints return the cursor here; object bodies also carry it
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def keyset_page(stmt, id_column, after_id: Optional[int], limit: int):
+    """Restrict ``stmt`` (a Select or Query) to the page after ``after_id``."""
+    if after_id is not None:
+        stmt = stmt.where(id_column > after_id)
+    return stmt.order_by(id_column).limit(limit + 1)
+
+
+def split_page(
+    rows: Sequence[Any],
+    limit: int,
+    id_of: Callable[[Any], int] = lambda row: row.id,
+) -> Tuple[List[Any], Optional[int]]:
+    """Drop the look-ahead row and return ``(page, next_cursor)``."""
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+
+    page = rows[:limit]
+    return page, id_of(page[-1])
+
+
+def cursor_headers(next_cursor: Optional[int]) -> dict:
+    return {NEXT_CURSOR_HEADER: str(next_cursor)} if next_cursor is not None else {}
@@ -0,0 +1,94 @@
+"""
+Per-request SQL query instrumentation.
+
+Counts and times every statement executed while a request is being handled
+and reports them as ``X-DB-Query-Count`` / ``X-DB-Query-Ms`` response headers,
+logging a warning when a request exceeds QUERY_COUNT_WARN_THRESHOLD. This is
+how lazy-load (N+1) regressions show up in development.
+
+Enabled via ``install_query_stats(app)`` when DEBUG or QUERY_STATS_ENABLED is
+set; otherwise no listeners are registered and there is no overhead.
+"""
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class QueryStats:
+    count: int = 0
+    total_seconds: float = 0.0
+
+
+# Stats for the request currently being handled (None outside a request).
+# The middleware installs a fresh mutable object; copied contexts (threadpool
+# handlers, task groups) share it, so their queries are counted too.
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start_time"].pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.total_seconds += time.perf_counter() - started
+
+
+class QueryStatsMiddleware:
+    """ASGI middleware that attaches per-request query stats headers."""
+
+    def __init__(self, app, warn_threshold: int = 20):
+        self.app = app
+        self.warn_threshold = warn_threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+
+        async def send_with_stats(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-db-query-count", str(stats.count).encode()))
+                headers.append((b"x-db-query-ms", f"{stats.total_seconds * 1000:.1f}".encode()))
+                message = {**message, "headers": headers}
+
+                if stats.count > self.warn_threshold:
+                    logger.warning(
+                        "%s %s issued %d SQL queries (%.1f ms)",
+                        scope["method"], scope["path"], stats.count, stats.total_seconds * 1000,
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            _current_stats.reset(token)
+
+
+def install_query_stats(app) -> None:
+    """Register the cursor listeners and middleware if instrumentation is enabled."""
+    if not (settings.DEBUG or settings.QUERY_STATS_ENABLED):
+        return
+
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+    app.add_middleware(QueryStatsMiddleware, warn_threshold=settings.QUERY_COUNT_WARN_THRESHOLD)
@@ -0,0 +1,34 @@
+"""
+Shared Redis client.
+
+One pooled ``redis.asyncio`` client per process, created on first use and
+closed on application shutdown via ``close_redis()``.
+"""
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+
+_redis: Optional[Redis] = None
+
+
+def get_redis() -> Redis:
+    """Return the process-wide Redis client, creating it on first use."""
+    global _redis
+    if _redis is None:
+        _redis = Redis.from_url(
+            settings.REDIS_URL,
+            max_connections=32,
+            socket_keepalive=True,
+            socket_connect_timeout=2,
+        )
+    return _redis
+
+
+async def close_redis() -> None:
+    """Close the shared client and its connection pool, if one was created."""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
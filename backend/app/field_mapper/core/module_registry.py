@@ -4,7 +4,7 @@ Odoo Module Registry - Defines module groups and their associated models.
 This registry helps users pre-select relevant modules to dramatically improve
 field mapping accuracy by reducing the search space.
 """
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, Iterable, List, Set
 from dataclasses import dataclass
 import logging
 
@@ -364,9 +364,40 @@ class OdooModuleRegistry:
         ),
     ]
 
+    # Column-name keywords that suggest a module group (substring match)
+    COLUMN_KEYWORDS = {
+        "sales_crm": ["sale", "order", "customer", "quotation", "lead", "opportunity"],
+        "accounting": ["invoice", "bill", "payment", "tax", "account", "journal", "debit", "credit"],
+        "contacts": ["customer", "vendor", "supplier", "contact", "partner", "email", "phone", "address"],
+        "products": ["product", "item", "sku", "price", "category", "description"],
+        "inventory": ["stock", "quantity", "warehouse", "location", "lot", "serial"],
+        "purchase": ["purchase", "vendor", "supplier", "po", "rfq"],
+        "hr": ["employee", "department", "salary", "leave", "attendance"],
+        "project": ["project", "task", "timesheet", "hours", "milestone"],
+        "manufacturing": ["bom", "manufacturing", "workorder", "routing", "production"],
+        "pos": ["pos", "point of sale", "session", "receipt", "cashier"],
+        "website": ["website", "ecommerce", "cart", "visitor"],
+        "marketing": ["campaign", "mailing", "newsletter", "event", "registration", "survey", "marketing"],
+        "maintenance": ["equipment", "maintenance", "repair"],
+        "fleet": ["vehicle", "odometer", "fuel", "fleet", "driver"],
+        "recruitment": ["applicant", "application", "recruitment", "job position"],
+        "expenses": ["expense", "receipt", "reimbursement"],
+        "skills": ["skill", "competency", "certification"],
+        "calendar": ["meeting", "calendar", "attendee", "appointment"],
+        "notes": ["note", "todo", "task list"],
+        "lunch": ["lunch", "meal", "canteen"],
+        "discuss_livechat": ["chat", "channel", "conversation", "livechat"],
+        "data_cleaning": ["deduplicate", "duplicate", "cleanup", "recycle"],
+    }
+
+    # Exact column names that always suggest the contacts group
+    CONTACT_FIELDS = frozenset(["name", "email", "phone", "address", "city", "country"])
+
     def __init__(self):
         """Initialize the module registry."""
         self._groups_by_name = {g.name: g for g in self.MODULE_GROUPS}
+        self._groups_by_priority = sorted(self.MODULE_GROUPS, key=lambda g: g.priority)
+        self._models_for_groups_cache: Dict[FrozenSet[str], FrozenSet[str]] = {}
         self._build_model_index()
         logger.info(f"Module registry initialized with {len(self.MODULE_GROUPS)} groups")
 
@@ -381,30 +412,40 @@ class OdooModuleRegistry:
 
     def get_all_groups(self) -> List[ModuleGroup]:
         """Get all available module groups sorted by priority."""
-        return sorted(self.MODULE_GROUPS, key=lambda g: g.priority)
+        return list(self._groups_by_priority)
 
     def get_group(self, name: str) -> ModuleGroup:
         """Get a specific module group by name."""
         return self._groups_by_name.get(name)
 
-    def get_models_for_groups(self, group_names: List[str]) -> Set[str]:
+    def get_models_for_groups(self, group_names: Iterable[str]) -> FrozenSet[str]:
         """
         Get all models for the specified groups.
 
+        Results are memoised per distinct set of group names, since the same
+        module selections recur across datasets and requests.
+
         Args:
             group_names: List of group names (e.g., ["sales_crm", "contacts"])
 
         Returns:
-            Set of model names
+            Frozen set of model names
         """
-        models = set()
-        for group_name in group_names:
+        key = frozenset(group_names)
+        models = self._models_for_groups_cache.get(key)
+        if models is not None:
+            return models
+
+        collected = set()
+        for group_name in key:
             group = self.get_group(group_name)
             if group:
-                models.update(group.models)
+                collected.update(group.models)
                 logger.debug(f"Added {len(group.models)} models from group '{group_name}'")
 
-        logger.info(f"Selected groups {group_names} provide {len(models)} models")
+        models = frozenset(collected)
+        self._models_for_groups_cache[key] = models
+        logger.info(f"Selected groups {sorted(key)} provide {len(models)} models")
         return models
 
     def suggest_groups_for_columns(self, column_names: List[str]) -> List[str]:
@@ -419,49 +460,22 @@ class OdooModuleRegistry:
         """
         suggestions = set()
         column_names_lower = [c.lower() for c in column_names]
+        # One haystack for substring checks; the separator can't occur in a keyword
+        columns_text = "\x00".join(column_names_lower)
 
-        # Keywords that suggest specific modules
-        keywords_map = {
-            "sales_crm": ["sale", "order", "customer", "quotation", "lead", "opportunity"],
-            "accounting": ["invoice", "bill", "payment", "tax", "account", "journal", "debit", "credit"],
-            "contacts": ["customer", "vendor", "supplier", "contact", "partner", "email", "phone", "address"],
-            "products": ["product", "item", "sku", "price", "category", "description"],
-            "inventory": ["stock", "quantity", "warehouse", "location", "lot", "serial"],
-            "purchase": ["purchase", "vendor", "supplier", "po", "rfq"],
-            "hr": ["employee", "department", "salary", "leave", "attendance"],
-            "project": ["project", "task", "timesheet", "hours", "milestone"],
-            "manufacturing": ["bom", "manufacturing", "workorder", "routing", "production"],
-            "pos": ["pos", "point of sale", "session", "receipt", "cashier"],
-            "website": ["website", "ecommerce", "cart", "visitor"],
-            "marketing": ["campaign", "mailing", "newsletter", "event", "registration", "survey", "marketing"],
-            "maintenance": ["equipment", "maintenance", "repair"],
-            "fleet": ["vehicle", "odometer", "fuel", "fleet", "driver"],
-            "recruitment": ["applicant", "application", "recruitment", "job position"],
-            "expenses": ["expense", "receipt", "reimbursement"],
-            "skills": ["skill", "competency", "certification"],
-            "calendar": ["meeting", "calendar", "attendee", "appointment"],
-            "notes": ["note", "todo", "task list"],
-            "lunch": ["lunch", "meal", "canteen"],
-            "discuss_livechat": ["chat", "channel", "conversation", "livechat"],
-            "data_cleaning": ["deduplicate", "duplicate", "cleanup", "recycle"],
-        }
-
-        for group_name, keywords in keywords_map.items():
-            for keyword in keywords:
-                if any(keyword in col for col in column_names_lower):
-                    suggestions.add(group_name)
-                    break
+        for group_name, keywords in self.COLUMN_KEYWORDS.items():
+            if any(keyword in columns_text for keyword in keywords):
+                suggestions.add(group_name)
 
         # Always suggest contacts if we see common contact fields
-        contact_fields = ["name", "email", "phone", "address", "city", "country"]
-        if any(field in column_names_lower for field in contact_fields):
+        if not self.CONTACT_FIELDS.isdisjoint(column_names_lower):
             suggestions.add("contacts")
 
         suggested_list = list(suggestions)
         logger.info(f"Suggested module groups based on columns: {suggested_list}")
         return suggested_list
 
-    def get_models_for_domain(self, domain: str) -> Set[str]:
+    def get_models_for_domain(self, domain: str) -> FrozenSet[str]:
         """
         Get models for a business domain detected by BusinessContextAnalyzer.
 
@@ -482,7 +496,7 @@ class OdooModuleRegistry:
         }
 
         group_names = domain_map.get(domain, [])
-        return self.get_models_for_groups(group_names) if group_names else set()
+        return self.get_models_for_groups(group_names) if group_names else frozenset()
 
     def filter_models_by_selection(self, all_models: Set[str], selected_groups: List[str]) -> Set[str]:
         """
@@ -1,12 +1,18 @@
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from app.core.compression import JSONGZipMiddleware
 from app.core.config import settings
+from app.core.query_stats import install_query_stats
+from app.core.redis import close_redis
 from app.api import datasets, mappings, imports, health, sheets, addons, transforms, odoo, exports, operations, graphs, exceptions, templates, assistant
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS
@@ -18,6 +24,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Large JSON listings compress well (repeated keys); 304s and small bodies
+# fall under the minimum size, and downloads/streams are never compressed
+app.add_middleware(JSONGZipMiddleware, minimum_size=settings.GZIP_MIN_SIZE, compresslevel=settings.GZIP_LEVEL)
+
+# SQL query count/time headers (DEBUG or QUERY_STATS_ENABLED only)
+install_query_stats(app)
+
 # Include routers
 app.include_router(health.router, prefix=settings.API_V1_PREFIX, tags=["health"])
 app.include_router(datasets.router, prefix=settings.API_V1_PREFIX, tags=["datasets"])
@@ -35,6 +48,22 @@ app.include_router(templates.router, prefix=settings.API_V1_PREFIX, tags=["templ
 app.include_router(assistant.router, prefix=settings.API_V1_PREFIX, tags=["assistant"])
 
 
+@app.on_event("startup")
+async def size_threadpool():
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+
+
+@app.on_event("startup")
+async def warm_static_listings():
+    templates.warm_template_cache()
+
+
+@app.on_event("shutdown")
+async def close_shared_clients():
+    await assistant.close_mcp_client()
+    await close_redis()
+
+
 @app.get("/")
 async def root():
     return {
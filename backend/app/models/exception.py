@@ -4,7 +4,7 @@ Exception model for tracking validation errors during export.
 Exceptions are first-class: bad rows never block good rows.
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -33,5 +33,10 @@ class Exception(Base):
     # Relationships
     dataset = relationship("Dataset", back_populates="exceptions")
 
+    # Covers the list query: filter by dataset (and model), newest first
+    __table_args__ = (
+        Index("ix_exceptions_dataset_model_created", "dataset_id", "model", created_at.desc()),
+    )
+
 
 # Update Dataset model to include exceptions relationship (add this to models/__init__.py or source.py)
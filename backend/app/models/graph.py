@@ -2,7 +2,7 @@
 Graph models for storing GraphSpec definitions
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, JSON, Text
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -47,3 +47,8 @@ class GraphRun(Base):
 
     # Relationships
     graph = relationship("Graph", back_populates="runs")
+
+    # Covers run listings: filter by graph, newest first
+    __table_args__ = (
+        Index("ix_graph_runs_graph_started", "graph_id", started_at.desc()),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, JSON, Boolean, Text, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, JSON, Boolean, Text, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 import enum
@@ -60,6 +60,11 @@ class Transform(Base):
     # Relationships
     mapping = relationship("Mapping", back_populates="transforms")
 
+    # Covers per-mapping chain loads and the next-order lookup
+    __table_args__ = (
+        Index("ix_transform_mapping_order", "mapping_id", "order"),
+    )
+
 
 class Relationship(Base):
     __tablename__ = "relationships"
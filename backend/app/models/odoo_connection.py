@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Index, text
 from app.core.database import Base
 
 
@@ -17,3 +17,21 @@ class OdooConnection(Base):
     last_tested_at = Column(DateTime, nullable=True)  # Last successful connection test
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        # At most one default; the partial index also serves the default lookup
+        Index(
+            "ux_odoo_connections_default",
+            "is_default",
+            unique=True,
+            postgresql_where=text("is_default"),
+            sqlite_where=text("is_default"),
+        ),
+        # Listings page through active connections in id order
+        Index(
+            "ix_odoo_connections_active",
+            "id",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+    )
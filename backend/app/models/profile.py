@@ -1,5 +1,5 @@
 from sqlalchemy import Column, Integer, String, Float, ForeignKey, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from app.core.database import Base
 
 
@@ -7,7 +7,7 @@ class ColumnProfile(Base):
     __tablename__ = "column_profiles"
 
     id = Column(Integer, primary_key=True, index=True)
-    sheet_id = Column(Integer, ForeignKey("sheets.id"), nullable=False)
+    sheet_id = Column(Integer, ForeignKey("sheets.id"), nullable=False, index=True)
     name = Column(String, nullable=False)  # Original header name
     dtype_guess = Column(String, nullable=False)  # e.g., "string", "integer", "float", "date", "boolean"
     null_pct = Column(Float, nullable=False)
@@ -15,10 +15,10 @@ class ColumnProfile(Base):
     patterns = Column(JSON, nullable=True)  # e.g., {"email": 0.95, "phone": 0.02}
     sample_values = Column(JSON, nullable=True)  # Array of sample values
 
-    # Detection results from enhanced profiler
-    detected_entity = Column(JSON, nullable=True)  # EntitySignature data from ColumnSignatureDetector
-    polymorphic_signature = Column(JSON, nullable=True)  # PolymorphicSignature data
-    pivot_group = Column(JSON, nullable=True)  # PivotGroup data
+    # Detection results from enhanced profiler (deferred: large and rarely read)
+    detected_entity = deferred(Column(JSON, nullable=True))  # EntitySignature data from ColumnSignatureDetector
+    polymorphic_signature = deferred(Column(JSON, nullable=True))  # PolymorphicSignature data
+    pivot_group = deferred(Column(JSON, nullable=True))  # PivotGroup data
 
     # Relationships
     sheet = relationship("Sheet", back_populates="column_profiles")
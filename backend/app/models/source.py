@@ -1,6 +1,6 @@
 from datetime import datetime
 from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from app.core.database import Base
 
 
@@ -36,7 +36,7 @@ class Dataset(Base):
 
     # Data cleaning tracking
     cleaned_file_path = Column(String, nullable=True)  # Path to cleaned data file
-    cleaning_report = Column(JSON, nullable=True)  # Report of what was cleaned
+    cleaning_report = deferred(Column(JSON, nullable=True))  # Report of what was cleaned (loaded on access)
     profiling_status = Column(String, default="pending", nullable=False)  # pending, processing, complete, failed
 
     # Relationships
@@ -8,7 +8,7 @@ Ports (interfaces) for lean stack → scale migration path:
 Easy to swap implementations without changing business logic.
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 import polars as pl
 
 
@@ -47,14 +47,20 @@ class ExceptionsRepo(ABC):
 
     @abstractmethod
     def list(
-        self, dataset_id: int, model: Optional[str] = None
+        self,
+        dataset_id: int,
+        model: Optional[str] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
-        List exceptions for a dataset.
+        List exceptions for a dataset, newest first.
 
         Args:
             dataset_id: ID of the dataset
             model: Optional model filter (e.g., "res.partner")
+            skip: Number of exceptions to skip
+            limit: Optional maximum number of exceptions to return
 
         Returns:
             List of exception dicts with all fields
@@ -66,6 +72,8 @@ class ExceptionsRepo(ABC):
         """
         Clear exceptions for a dataset.
 
+        Implementations may commit while clearing.
+
         Args:
             dataset_id: ID of the dataset
             model: Optional model filter (if None, clear all for dataset)
@@ -98,7 +106,12 @@ class DatasetsRepo(ABC):
     """
 
     @abstractmethod
-    def get_dataframe(self, dataset_id: int, sheet_name: Optional[str] = None) -> pl.DataFrame:
+    def get_dataframe(
+        self,
+        dataset_id: int,
+        sheet_name: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pl.DataFrame:
         """
         Get DataFrame for a dataset.
 
@@ -107,6 +120,7 @@ class DatasetsRepo(ABC):
         Args:
             dataset_id: ID of the dataset
             sheet_name: Optional sheet name filter
+            columns: Optional column projection (only these columns are read)
 
         Returns:
             Polars DataFrame with dataset data
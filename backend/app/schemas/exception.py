@@ -28,6 +28,8 @@ class ExceptionsListResponse(BaseModel):
     dataset_id: int
     model: Optional[str]
     total: int
+    skip: int
+    limit: int
     exceptions: list[ExceptionResponse]
 
 
@@ -1,8 +1,9 @@
 """
 Pydantic schemas for export API.
 """
+from dataclasses import dataclass
 from pydantic import BaseModel
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 
 class ModelExportSummary(BaseModel):
@@ -27,3 +28,30 @@ class ExportResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# Export preview shapes are slotted dataclasses rather than BaseModels: they
+# are built from already-trusted ORM rows and only ever serialised, so they
+# skip per-instance validation and dict storage.
+@dataclass(slots=True)
+class ExportPreviewField:
+    source: str
+    target: str
+    has_transforms: bool
+
+
+@dataclass(slots=True)
+class ExportPreviewModel:
+    model: str
+    field_count: int
+    external_id_pattern: Optional[str]
+    fields: List[ExportPreviewField]
+
+
+@dataclass(slots=True)
+class ExportPreview:
+    dataset_id: int
+    dataset_name: str
+    models: List[ExportPreviewModel]
+    total_models: int
+    namespace: str
@@ -3,7 +3,7 @@ Pydantic schemas for GraphSpec
 Mirror of frontend/src/types/graph.ts
 """
 from typing import Optional, List, Dict, Any, Literal
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, field_validator
 from datetime import datetime
 
 
@@ -139,3 +139,28 @@ class GraphRunResponse(BaseModel):
     id: str
     status: str
     message: str
+
+
+class GraphRunDetail(BaseModel):
+    """Stored run state as returned by the run listing and status endpoints"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    graph_id: str
+    dataset_id: Optional[int] = None
+    status: str
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    progress: int = 0
+    current_node: Optional[str] = None
+    context: Dict[str, Any] = {}
+    logs: List[Any] = []
+    stats: Optional[Any] = None
+    error_message: Optional[str] = None
+
+    @field_validator("context", "logs", mode="before")
+    @classmethod
+    def _null_as_empty(cls, value, info):
+        if value is None:
+            return {} if info.field_name == "context" else []
+        return value
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 from typing import List, Optional, Dict, Any
 from app.models.mapping import MappingStatus
 
@@ -79,7 +79,19 @@ class MappingResponse(MappingBase):
     class Config:
         from_attributes = True
 
+    @field_validator("confidence", mode="before")
+    @classmethod
+    def _unscored_as_zero(cls, value):
+        return 0.0 if value is None else value
+
+    @field_validator("transforms", "suggestions", mode="before")
+    @classmethod
+    def _null_as_empty(cls, value):
+        return [] if value is None else value
+
 
 class MappingListResponse(BaseModel):
     mappings: List[MappingResponse]
     total: int
+    # Pass as after_id to fetch the next page; None on the last page
+    next_cursor: Optional[int] = None
@@ -57,10 +57,11 @@ class OdooAddonGenerator:
                 "related_model": mapping.custom_field_definition.get("related_model"),
             })
 
-        # Create addon structure in memory
+        # Create addon structure in memory. ZIP_STORED: the members are a few
+        # small text files, so pure-Python DEFLATE would cost more than it saves.
         zip_buffer = BytesIO()
 
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_STORED) as zipf:
             # Generate module files
             self._write_manifest(zipf, addon_name, fields_by_model)
             self._write_init_files(zipf, addon_name, fields_by_model)
@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, load_only, selectinload, undefer
 from fastapi import UploadFile
 from app.models import SourceFile, Dataset, Sheet, ColumnProfile
 from app.core.config import settings
@@ -8,7 +8,7 @@ from app.services.operation_tracker import OperationTracker
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 import polars as pl
 
 
@@ -223,12 +223,94 @@ class DatasetService:
         return cleaned_path
 
     def list_datasets(self, skip: int = 0, limit: int = 100):
-        """List all datasets."""
-        return self.db.query(Dataset).offset(skip).limit(limit).all()
+        """List all datasets with their sheets (serialised by DatasetResponse)."""
+        return (
+            self.db.query(Dataset)
+            .options(
+                load_only(
+                    Dataset.id,
+                    Dataset.name,
+                    Dataset.source_file_id,
+                    Dataset.created_at,
+                    Dataset.company_id,
+                ),
+                selectinload(Dataset.sheets),
+            )
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
+    def get_dataset(
+        self,
+        dataset_id: int,
+        include_cleaning_report: bool = False,
+        include_source_file: bool = False,
+    ):
+        """
+        Get a dataset by ID.
+
+        cleaning_report is deferred on the model; pass include_cleaning_report
+        to load it in the same query when the caller is going to read it.
+        include_source_file joins the source file in for callers that need
+        its filename. Use get_dataset_with_sheets to walk sheets/profiles.
+        """
+        query = self.db.query(Dataset)
+        if include_cleaning_report:
+            query = query.options(undefer(Dataset.cleaning_report))
+        if include_source_file:
+            query = query.options(joinedload(Dataset.source_file))
+        return query.filter(Dataset.id == dataset_id).first()
+
+    def set_selected_modules(self, dataset_id: int, modules: List[str]) -> bool:
+        """
+        Store a dataset's module selection with a single UPDATE.
+
+        Returns False if the dataset does not exist.
+        """
+        updated = (
+            self.db.query(Dataset)
+            .filter(Dataset.id == dataset_id)
+            .update({Dataset.selected_modules: modules}, synchronize_session=False)
+        )
+        self.db.commit()
+        return updated > 0
+
+    def get_dataset_with_sheets(self, dataset_id: int, include_cleaning_report: bool = False):
+        """
+        Get a dataset with its source file, sheets and column profiles preloaded.
+
+        selectinload issues one IN-query per collection level, so walking
+        dataset.sheets / sheet.column_profiles never triggers per-sheet lazy loads.
+        """
+        query = self.db.query(Dataset).options(
+            joinedload(Dataset.source_file),
+            selectinload(Dataset.sheets).selectinload(Sheet.column_profiles),
+        )
+        if include_cleaning_report:
+            query = query.options(undefer(Dataset.cleaning_report))
+        return query.filter(Dataset.id == dataset_id).first()
+
+    def get_column_names(self, dataset_id: int) -> Optional[List[str]]:
+        """
+        Get the profiled column names across all sheets of a dataset.
 
-    def get_dataset(self, dataset_id: int):
-        """Get a dataset by ID."""
-        return self.db.query(Dataset).filter(Dataset.id == dataset_id).first()
+        Selects only ColumnProfile.name in a single round trip. Outer joins
+        from Dataset keep a row for a dataset without profiles, so ``None``
+        means the dataset does not exist and ``[]`` means nothing is profiled.
+        """
+        rows = (
+            self.db.query(ColumnProfile.name)
+            .select_from(Dataset)
+            .outerjoin(Sheet, Sheet.dataset_id == Dataset.id)
+            .outerjoin(ColumnProfile, ColumnProfile.sheet_id == Sheet.id)
+            .filter(Dataset.id == dataset_id)
+            .order_by(Sheet.id, ColumnProfile.id)
+            .all()
+        )
+        if not rows:
+            return None
+        return [name for (name,) in rows if name is not None]
 
     def delete_dataset(self, dataset_id: int) -> bool:
         """Delete a dataset."""
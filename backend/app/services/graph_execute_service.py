@@ -159,13 +159,10 @@ class GraphExecuteService:
         Returns:
             RunResponse with final statistics
         """
-        graph = self.graph_service.get_graph(graph_id)
-        if not graph:
+        graph_spec = self.graph_service.get_graph_spec(graph_id)
+        if not graph_spec:
             raise ValueError(f"Graph {graph_id} not found")
 
-        from app.schemas.graph import GraphSpec
-        graph_spec = GraphSpec(**graph.spec)
-
         # Use provided run_id or create new run
         if run_id:
             run = self.graph_service.get_run(run_id)
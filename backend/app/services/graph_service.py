@@ -1,14 +1,45 @@
 """
 Service for managing GraphSpec definitions and execution
 """
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
+import threading
 import uuid
 from pathlib import Path
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from app.models.graph import Graph, GraphRun
 from app.schemas.graph import GraphSpec, GraphSpecCreate, GraphSpecUpdate, GraphValidation, ValidationError, ValidationWarning
 
+# Parsed GraphSpecs keyed on (graph_id, version). update_graph bumps the
+# version, so an edited graph simply misses; delete_graph evicts explicitly.
+_SPEC_CACHE_SIZE = 256
+_spec_cache: "OrderedDict[Tuple[str, int], GraphSpec]" = OrderedDict()
+_spec_cache_lock = threading.Lock()
+
+# Columns served by the run listing/status endpoints
+_RUN_COLUMNS = (
+    GraphRun.id,
+    GraphRun.graph_id,
+    GraphRun.dataset_id,
+    GraphRun.status,
+    GraphRun.started_at,
+    GraphRun.finished_at,
+    GraphRun.progress,
+    GraphRun.current_node,
+    GraphRun.context,
+    GraphRun.logs,
+    GraphRun.stats,
+    GraphRun.error_message,
+)
+
+
+def _evict_graph_spec(graph_id: str) -> None:
+    with _spec_cache_lock:
+        for key in [k for k in _spec_cache if k[0] == graph_id]:
+            del _spec_cache[key]
+
 
 class GraphService:
     def __init__(self, db: Session):
@@ -44,7 +75,37 @@ class GraphService:
 
     def get_graph(self, graph_id: str) -> Optional[Graph]:
         """Get a graph by ID"""
-        return self.db.query(Graph).filter(Graph.id == graph_id).first()
+        return self.db.get(Graph, graph_id)
+
+    def get_graph_spec(self, graph_id: str) -> Optional[GraphSpec]:
+        """
+        Get a graph's parsed spec, reusing a cached GraphSpec when the stored
+        version is unchanged.
+
+        The cache is checked against a version-only SELECT; the JSON spec is
+        loaded and validated only on a miss. Treat the result as read-only.
+        """
+        version = self.db.query(Graph.version).filter(Graph.id == graph_id).scalar()
+        if version is None:
+            return None
+
+        key = (graph_id, version)
+        with _spec_cache_lock:
+            spec = _spec_cache.get(key)
+            if spec is not None:
+                _spec_cache.move_to_end(key)
+                return spec
+
+        raw = self.db.query(Graph.spec).filter(Graph.id == graph_id).scalar()
+        if raw is None:
+            return None
+        spec = GraphSpec(**raw)
+
+        with _spec_cache_lock:
+            _spec_cache[key] = spec
+            if len(_spec_cache) > _SPEC_CACHE_SIZE:
+                _spec_cache.popitem(last=False)
+        return spec
 
     def list_graphs(self, limit: int = 100, offset: int = 0) -> List[Graph]:
         """List all graphs"""
@@ -92,6 +153,7 @@ class GraphService:
 
         self.db.delete(graph)
         self.db.commit()
+        _evict_graph_spec(graph_id)
         return True
 
     def validate_graph(self, graph_spec: GraphSpec) -> GraphValidation:
@@ -233,7 +295,7 @@ class GraphService:
 
     def get_run(self, run_id: str) -> Optional[GraphRun]:
         """Get a run by ID"""
-        return self.db.query(GraphRun).filter(GraphRun.id == run_id).first()
+        return self.db.get(GraphRun, run_id)
 
     def list_runs(self, graph_id: Optional[str] = None, limit: int = 100, offset: int = 0) -> List[GraphRun]:
         """List runs, optionally filtered by graph_id"""
@@ -247,6 +309,26 @@ class GraphService:
             .all()
         )
 
+    def list_run_rows(
+        self, graph_id: Optional[str] = None, limit: int = 100, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        List runs as plain column mappings, newest first.
+
+        Projects the columns straight off the cursor instead of hydrating
+        GraphRun instances, for callers that only serialise the rows.
+        """
+        stmt = select(*_RUN_COLUMNS)
+        if graph_id:
+            stmt = stmt.where(GraphRun.graph_id == graph_id)
+        stmt = stmt.order_by(GraphRun.started_at.desc()).offset(offset).limit(limit)
+        return self.db.execute(stmt).mappings().all()
+
+    def get_run_row(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Get a run as a plain column mapping (see list_run_rows)"""
+        stmt = select(*_RUN_COLUMNS).where(GraphRun.id == run_id)
+        return self.db.execute(stmt).mappings().first()
+
     def update_run_status(
         self,
         run_id: str,
@@ -358,11 +440,9 @@ class GraphService:
         loader = RegistryLoader(registry_path)
         registry = loader.load()
         
-        graph = self.get_graph(graph_id)
-        if not graph:
+        graph_spec = self.get_graph_spec(graph_id)
+        if not graph_spec:
             raise ValueError(f"Graph {graph_id} not found")
-            
-        graph_spec = GraphSpec(**graph.spec)
         
         errors = []
         warnings = []
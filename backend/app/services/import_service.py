@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 from app.models import Run, Dataset, Mapping
+from app.core.database import insert_returning
 from app.schemas.run import RunCreate
 from app.models.run import RunStatus
 from app.connectors.odoo import OdooConnector
@@ -22,14 +23,14 @@ class ImportService:
 
     async def create_run(self, dataset_id: int, run_data: RunCreate):
         """Create a new import run."""
-        run = Run(
+        run = insert_returning(
+            self.db,
+            Run,
             dataset_id=dataset_id,
             graph_id=run_data.graph_id,
             status=RunStatus.PENDING,
         )
-        self.db.add(run)
         self.db.commit()
-        self.db.refresh(run)
 
         # TODO: Trigger import task asynchronously
         # from app.services.import_tasks import execute_import
@@ -50,7 +51,7 @@ class ImportService:
             Run object with import stats
         """
         # Get dataset with all relationships
-        dataset = self.db.query(Dataset).filter(Dataset.id == dataset_id).first()
+        dataset = self.db.get(Dataset, dataset_id)
         if not dataset:
             raise ValueError(f"Dataset {dataset_id} not found")
 
@@ -265,7 +266,7 @@ class ImportService:
 
     def get_run(self, run_id: int):
         """Get a run by ID."""
-        return self.db.query(Run).filter(Run.id == run_id).first()
+        return self.db.get(Run, run_id)
 
     async def rollback_run(self, run_id: int) -> bool:
         """Rollback an import run."""
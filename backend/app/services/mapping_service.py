@@ -1,11 +1,13 @@
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, inspect
+from sqlalchemy.orm import Session, joinedload, load_only, selectinload
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import polars as pl
 from app.models import Mapping, Dataset, Sheet, ColumnProfile, Suggestion, SourceFile
 from app.schemas.mapping import MappingUpdate
 from app.models.mapping import MappingStatus
 from app.core.config import settings
+from app.core.pagination import keyset_page
 from app.core.lambda_transformer import LambdaTransformer
 
 # Import deterministic field mapper
@@ -51,14 +53,76 @@ class MappingService:
                 except Exception as e:
                     print(f"Warning: Could not initialize HybridMatcher: {e}")
 
-    def get_mappings_for_dataset(self, dataset_id: int):
-        """Get all mappings for a dataset."""
-        return self.db.query(Mapping)\
+    def get_mappings_for_dataset(
+        self,
+        dataset_id: int,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ):
+        """
+        Get mappings for a dataset with transforms and suggestions loaded.
+
+        selectinload fetches each collection in one IN-query; joinedload on
+        two collections would multiply rows (transforms x suggestions).
+        With ``limit`` the keyset page after ``after_id`` is returned, plus
+        one look-ahead row.
+        """
+        query = self.db.query(Mapping)\
             .options(
-                joinedload(Mapping.suggestions),
-                joinedload(Mapping.transforms)
+                selectinload(Mapping.suggestions),
+                selectinload(Mapping.transforms)
             )\
+            .filter(Mapping.dataset_id == dataset_id)
+
+        if limit is None:
+            return query.order_by(Mapping.id).all()
+        return keyset_page(query, Mapping.id, after_id, limit).all()
+
+    def count_mappings_for_dataset(self, dataset_id: int) -> int:
+        return self.db.query(func.count(Mapping.id))\
             .filter(Mapping.dataset_id == dataset_id)\
+            .scalar()
+
+    def _reload_with_relations(self, mappings):
+        """
+        Reload freshly committed mappings with their collections in bulk.
+
+        Commit expires every instance, so serialising them directly would
+        refresh each row and lazy-load both collections one mapping at a time.
+        Ids come from the identity key, which survives expiry without SQL.
+        """
+        ids = [inspect(m).identity[0] for m in mappings]
+        if not ids:
+            return []
+        return self.db.query(Mapping)\
+            .options(
+                selectinload(Mapping.suggestions),
+                selectinload(Mapping.transforms)
+            )\
+            .filter(Mapping.id.in_(ids))\
+            .order_by(Mapping.id)\
+            .all()
+
+    def get_confirmed_mappings_for_export(self, dataset_id: int):
+        """
+        Get the chosen mappings for a dataset, loading only the exported columns.
+
+        Filters in SQL and skips the suggestions/transforms joins that
+        get_mappings_for_dataset eager-loads for the mapping editor.
+        """
+        return self.db.query(Mapping)\
+            .options(
+                load_only(
+                    Mapping.header_name,
+                    Mapping.target_model,
+                    Mapping.target_field,
+                    Mapping.confidence,
+                    Mapping.rationale,
+                    Mapping.sheet_id,
+                )
+            )\
+            .filter(Mapping.dataset_id == dataset_id, Mapping.chosen.is_(True))\
+            .order_by(Mapping.id)\
             .all()
 
     async def generate_mappings_v2(self, dataset_id: int, use_deterministic: bool = True):
@@ -228,7 +292,7 @@ class MappingService:
                 print(f"ERROR: Traceback: {traceback.format_exc()}")
                 continue
 
-        return all_mappings
+        return self._reload_with_relations(all_mappings)
 
     async def generate_mappings_hybrid(self, dataset_id: int):
         """
@@ -249,7 +313,7 @@ class MappingService:
         self.db.commit()
 
         # Get dataset with sheets
-        dataset = self.db.query(Dataset).filter(Dataset.id == dataset_id).first()
+        dataset = self.db.get(Dataset, dataset_id)
         if not dataset:
             return []
 
@@ -312,7 +376,7 @@ class MappingService:
             self.db.commit()
 
         print(f"✓ Generated {len(all_mappings)} mappings using HybridMatcher")
-        return all_mappings
+        return self._reload_with_relations(all_mappings)
 
     def create_lambda_mapping(self, dataset_id: int, sheet_id: int, target_field: str,
                             lambda_function: str, target_model: str) -> Mapping:
@@ -341,7 +405,7 @@ class MappingService:
 
     def update_mapping(self, mapping_id: int, mapping_data: MappingUpdate):
         """Update a mapping."""
-        mapping = self.db.query(Mapping).filter(Mapping.id == mapping_id).first()
+        mapping = self.db.get(Mapping, mapping_id)
         if not mapping:
             return None
 
@@ -370,7 +434,7 @@ class MappingService:
 
     def delete_mapping(self, mapping_id: int) -> bool:
         """Delete a mapping."""
-        mapping = self.db.query(Mapping).filter(Mapping.id == mapping_id).first()
+        mapping = self.db.get(Mapping, mapping_id)
         if not mapping:
             return False
         self.db.delete(mapping)
@@ -9,21 +9,24 @@ This service transforms interactive cleanup work into deterministic file-based c
 - Detects external ID patterns from unique keys
 """
 
-import io
 import re
 import yaml
 import zipfile
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO, Dict, List, Any, Optional, Tuple
 from collections import defaultdict
 
 import pandas as pd
 import polars as pl
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.models import Dataset, Sheet, Mapping, Transform, ColumnProfile, Relationship
 from app.services.transform_service import TransformService
 
+# Archives up to this size stay in memory; larger ones roll over to disk
+EXPORT_SPOOL_MAX_SIZE = 8 << 20
+
 
 class OdooMigrateExportService:
     """Service for exporting data-migrator datasets to odoo-migrate format."""
@@ -32,12 +35,12 @@ class OdooMigrateExportService:
         self.db = db
         self.transform_service = TransformService()
 
-    async def export_dataset(self, dataset_id: int) -> bytes:
+    def export_dataset(self, dataset_id: int) -> BinaryIO:
         """
         Export complete dataset to odoo-migrate format.
 
         Returns:
-            ZIP file as bytes containing:
+            Rewound spooled file (caller closes) holding a ZIP archive with:
             - config/mappings/*.yml (field mappings, NO transforms)
             - config/lookups/*.csv (relationship lookups)
             - config/ids.yml (external ID patterns)
@@ -59,34 +62,49 @@ class OdooMigrateExportService:
             error_msg = "Export validation failed:\n" + "\n".join(f"- {e}" for e in validation_errors)
             raise ValueError(error_msg)
 
-        # Create ZIP file in memory
-        zip_buffer = io.BytesIO()
-
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            # Generate and add all config files
-            self._add_config_files(zip_file, dataset)
+        archive = SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_SIZE)
+        try:
+            with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+                # Generate and add all config files
+                self._add_config_files(zip_file, dataset)
 
-            # Generate and add cleaned CSV files
-            self._add_cleaned_csv_files(zip_file, dataset)
+                # Generate and add cleaned CSV files
+                self._add_cleaned_csv_files(zip_file, dataset)
+        except BaseException:
+            archive.close()
+            raise
 
-        zip_buffer.seek(0)
-        return zip_buffer.read()
+        archive.seek(0)
+        return archive
 
     def _load_dataset_with_relations(self, dataset_id: int) -> Optional[Dataset]:
-        """Load dataset with all necessary relationships."""
+        """
+        Load dataset with all necessary relationships.
+
+        Mappings are reached through their sheets, so they are loaded on that
+        path; selectinload keeps profiles and mappings from multiplying into
+        one cartesian joined result.
+        """
+        sheets = selectinload(Dataset.sheets)
         dataset = self.db.query(Dataset)\
             .options(
                 joinedload(Dataset.source_file),
-                joinedload(Dataset.sheets)
-                    .joinedload(Sheet.column_profiles),
-                joinedload(Dataset.mappings)
-                    .joinedload(Mapping.transforms),
+                sheets.selectinload(Sheet.column_profiles),
+                sheets.selectinload(Sheet.mappings)
+                    .selectinload(Mapping.transforms),
             )\
             .filter(Dataset.id == dataset_id)\
             .first()
-                    
+
         return dataset
 
+    def export_plan(
+        self, dataset: Dataset
+    ) -> Tuple[Dict[str, List[Mapping]], Dict[str, str]]:
+        """Mappings grouped by model and their external ID patterns."""
+        mappings_by_model = self._group_mappings_by_model(dataset)
+        return mappings_by_model, self._generate_id_patterns(dataset, mappings_by_model)
+
     def _validate_dataset_for_export(self, dataset: Dataset) -> List[str]:
         """
         Validate dataset is ready for export.
@@ -146,11 +164,8 @@ class OdooMigrateExportService:
     def _add_config_files(self, zip_file: zipfile.ZipFile, dataset: Dataset) -> None:
         """Generate and add all configuration files to ZIP."""
 
-        # Group mappings by target model
-        mappings_by_model = self._group_mappings_by_model(dataset)
-
-        # Generate external ID patterns
-        id_patterns = self._generate_id_patterns(dataset, mappings_by_model)
+        # Mappings grouped by target model, with external ID patterns
+        mappings_by_model, id_patterns = self.export_plan(dataset)
 
         # Add project.yml
         project_config = self._generate_project_config()
@@ -201,9 +216,9 @@ class OdooMigrateExportService:
             else:
                 filename = f"{sheet.name.replace(' ', '_').lower()}.csv"
 
-            # Export to CSV
-            csv_content = cleaned_df.to_csv(index=False)
-            zip_file.writestr(f'data/raw/{filename}', csv_content)
+            # Write CSV straight into the archive entry
+            with zip_file.open(f'data/raw/{filename}', 'w') as entry:
+                cleaned_df.write_csv(entry)
 
     def _apply_transforms_to_sheet(
         self,
@@ -107,58 +107,69 @@ class TemplateService:
         Returns:
             Progress information calculated from actual GraphRun records
         """
-        template = self.get_template(template_id)
-        if not template:
-            return None
+        return self.get_templates_progress([template_id]).get(template_id)
 
-        # Query for graphs created from this template
-        from app.models.graph import Graph, GraphRun
+    def get_templates_progress(self, template_ids: List[str]) -> Dict[str, TemplateProgress]:
+        """
+        Get progress for several templates with two queries in total
 
-        # Get all graphs and filter in Python to avoid SQL JSON operator issues
-        all_graphs = self.db.query(Graph).all()
+        Graph specs are scanned once to group graphs by template, then all of
+        their runs are fetched in one IN query. Unknown template ids are
+        left out of the result.
 
-        # Filter graphs that were created from this template
-        graphs = []
-        for graph in all_graphs:
-            if graph.spec and isinstance(graph.spec, dict):
-                metadata = graph.spec.get("metadata", {})
-                if metadata.get("template_id") == template_id:
-                    graphs.append(graph)
+        Args:
+            template_ids: Template identifiers
 
-        completed_models = set()
-        latest_run = None
+        Returns:
+            Progress keyed by template id
+        """
+        templates = {}
+        for template_id in dict.fromkeys(template_ids):
+            template = self.get_template(template_id)
+            if template:
+                templates[template_id] = template
+        if not templates:
+            return {}
 
-        # Find the most recent run and collect completed models
-        for graph in graphs:
-            runs = self.db.query(GraphRun).filter(
-                GraphRun.graph_id == graph.id
-            ).order_by(GraphRun.started_at.desc()).all()
+        from app.models.graph import Graph, GraphRun
+
+        # Filter specs in Python to avoid SQL JSON operator differences
+        template_by_graph = {}
+        for graph_id, spec in self.db.query(Graph.id, Graph.spec):
+            if spec and isinstance(spec, dict):
+                template_id = (spec.get("metadata") or {}).get("template_id")
+                if template_id in templates:
+                    template_by_graph[graph_id] = template_id
 
-            for run in runs:
-                if latest_run is None or run.started_at > latest_run.started_at:
-                    latest_run = run
+        completed_models = {template_id: set() for template_id in templates}
+
+        if template_by_graph:
+            runs = self.db.query(GraphRun.graph_id, GraphRun.status, GraphRun.context).filter(
+                GraphRun.graph_id.in_(template_by_graph)
+            )
+            for graph_id, run_status, context in runs:
+                if not context:
+                    continue
+                completed = completed_models[template_by_graph[graph_id]]
 
                 # Extract completed models from run context
-                if run.context and "executed_nodes" in run.context:
-                    for node in run.context["executed_nodes"]:
-                        completed_models.add(node)
-
-                # Also check for completed status
-                if run.status == "completed" and run.context and "plan" in run.context:
-                    # If run completed successfully, all planned models are complete
-                    for model in run.context["plan"]:
-                        completed_models.add(model)
-
-        # Calculate completion percentage
-        completed_list = list(completed_models)
-        percent_complete = int((len(completed_list) / len(template.models) * 100)) if template.models else 0
-
-        return TemplateProgress(
-            templateId=template_id,
-            completedModels=completed_list,
-            totalModels=len(template.models),
-            percentComplete=percent_complete
-        )
+                completed.update(context.get("executed_nodes", []))
+
+                # If run completed successfully, all planned models are complete
+                if run_status == "completed":
+                    completed.update(context.get("plan", []))
+
+        progress = {}
+        for template_id, template in templates.items():
+            completed_list = list(completed_models[template_id])
+            total = len(template.models)
+            progress[template_id] = TemplateProgress(
+                templateId=template_id,
+                completedModels=completed_list,
+                totalModels=total,
+                percentComplete=int(len(completed_list) / total * 100) if total else 0
+            )
+        return progress
 
     def instantiate_template(
         self,
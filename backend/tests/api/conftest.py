@@ -3,9 +3,11 @@ Pytest fixtures for API integration tests.
 
 Provides FastAPI test client and database session fixtures.
 """
+from contextlib import contextmanager
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -69,6 +71,33 @@ def client(db_session):
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def count_queries():
+    """
+    Record the SQL statements executed against the test engine.
+
+    Use as a guard against lazy-load (N+1) regressions:
+
+        with count_queries() as queries:
+            client.get(...)
+        assert len(queries) <= 3
+    """
+    @contextmanager
+    def _count():
+        queries = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            queries.append(statement)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield queries
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return _count
+
+
 @pytest.fixture
 def sample_dataset(db_session):
     """
@@ -81,10 +110,9 @@ def sample_dataset(db_session):
 
     # Create source file
     source_file = SourceFile(
-        filename="test_customers.csv",
         path="/tmp/test_customers.csv",
-        size=1024,
-        mime_type="text/csv"
+        mime_type="text/csv",
+        original_filename="test_customers.csv"
     )
     db_session.add(source_file)
     db_session.flush()
@@ -102,7 +130,8 @@ def sample_dataset(db_session):
     sheet = Sheet(
         dataset_id=dataset.id,
         name="Sheet1",
-        row_count=100
+        n_rows=100,
+        n_cols=0
     )
     db_session.add(sheet)
     db_session.commit()
@@ -0,0 +1,95 @@
+"""
+Integration tests for Addon endpoints.
+
+Tests the /api/v1/datasets/{dataset_id}/addon/* endpoints.
+"""
+import io
+import zipfile
+
+import pytest
+from fastapi import status
+
+from app.models import ColumnProfile, Dataset, Mapping, Sheet, SourceFile
+from app.models.mapping import MappingStatus
+
+
+@pytest.fixture
+def dataset_with_custom_field(db_session):
+    """Dataset with a single CREATE_FIELD mapping on res.partner."""
+    source_file = SourceFile(path="/tmp/addon.csv", mime_type="text/csv", original_filename="addon.csv")
+    db_session.add(source_file)
+    db_session.flush()
+
+    dataset = Dataset(name="Addon Dataset", source_file_id=source_file.id)
+    db_session.add(dataset)
+    db_session.flush()
+
+    sheet = Sheet(dataset_id=dataset.id, name="Sheet1", n_rows=1, n_cols=1)
+    db_session.add(sheet)
+    db_session.flush()
+
+    db_session.add(
+        Mapping(
+            dataset_id=dataset.id,
+            sheet_id=sheet.id,
+            header_name="Loyalty Tier",
+            target_model="res.partner",
+            status=MappingStatus.CREATE_FIELD,
+            custom_field_definition={
+                "technical_name": "x_loyalty_tier",
+                "field_label": "Loyalty Tier",
+                "field_type": "Char",
+            },
+        )
+    )
+    db_session.commit()
+    return dataset
+
+
+@pytest.mark.api
+class TestAddonsAPI:
+    """Test suite for addon API endpoints."""
+
+    def test_generate_addon_zip(self, client, dataset_with_custom_field):
+        """Test the generated addon is a valid, uncompressed zip archive."""
+        response = client.post(f"/api/v1/datasets/{dataset_with_custom_field.id}/addon/generate")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/zip"
+
+        with zipfile.ZipFile(io.BytesIO(response.content)) as zipf:
+            names = zipf.namelist()
+            assert "custom_fields_migration/__manifest__.py" in names
+            assert all(info.compress_type == zipfile.ZIP_STORED for info in zipf.infolist())
+            model_sources = [zipf.read(n).decode() for n in names if "/models/" in n]
+            assert any("x_loyalty_tier" in source for source in model_sources)
+
+    def test_generate_addon_without_custom_fields(self, client):
+        """Test generating an addon with no CREATE_FIELD mappings fails cleanly."""
+        response = client.post("/api/v1/datasets/99999/addon/generate")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_suggest_field_type(self, client, db_session, dataset_with_custom_field):
+        """Test field type suggestions include schema defaults."""
+        profile = ColumnProfile(
+            sheet_id=dataset_with_custom_field.sheets[0].id,
+            name="Email",
+            dtype_guess="string",
+            null_pct=0.0,
+            distinct_pct=1.0,
+            patterns={"email": 0.95},
+        )
+        db_session.add(profile)
+        db_session.commit()
+
+        response = client.get(
+            "/api/v1/mappings/1/suggest-field-type",
+            params={"column_profile_id": profile.id},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["field_type"] == "Char"
+        assert data["required"] is True
+        assert data["selection_options"] is None
+        assert "Email pattern" in data["rationale"]
@@ -0,0 +1,118 @@
+"""
+Integration tests for Assistant endpoints.
+
+Tests the /api/v1/assistant/* endpoints.
+"""
+import httpx
+import pytest
+from fastapi import status
+
+from app.api import assistant
+
+
+@pytest.fixture
+def mcp_requests(monkeypatch):
+    """Route MCP tool calls through a mock transport and record request paths."""
+    seen = []
+
+    payloads = {
+        "/api/v1/datasets": {"datasets": [{"id": 1, "name": "Customers", "sheets": []}]},
+        "/api/v1/runs": {"runs": [{"status": "failed", "error_message": "Missing name"}]},
+        "/api/v1/datasets/1/mappings": {"mappings": [], "total": 0},
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return httpx.Response(200, json=payloads[request.url.path])
+
+    client = httpx.AsyncClient(base_url=assistant.MCP_BASE_URL, transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(assistant, "_MCP_CLIENT", client)
+    return seen
+
+
+@pytest.mark.api
+class TestAssistantAPI:
+    """Test suite for assistant API endpoints."""
+
+    def test_chat_reuses_shared_mcp_client(self, client, mcp_requests):
+        """Test consecutive tool calls go through the same pooled client."""
+        shared = assistant._MCP_CLIENT
+
+        for _ in range(2):
+            response = client.post("/api/v1/assistant/chat", json={"message": "list my datasets"})
+            assert response.status_code == status.HTTP_200_OK
+            data = response.json()
+            assert data["tools_used"] == ["list_datasets"]
+            assert "Customers (ID: 1)" in data["response"]
+
+        assert mcp_requests == ["/api/v1/datasets", "/api/v1/datasets"]
+        assert assistant._MCP_CLIENT is shared
+        assert not shared.is_closed
+
+    def test_chat_error_intent_fetches_tools_together(self, client, mcp_requests):
+        """Test the error branch combines import history with the dataset's mappings."""
+        response = client.post(
+            "/api/v1/assistant/chat",
+            json={"message": "why did my import fail?", "context": {"datasetId": 1}},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["tools_used"] == ["get_import_history", "get_current_mappings"]
+        assert "no field mappings" in data["response"]
+        assert "Missing name" in data["response"]
+        assert sorted(mcp_requests) == ["/api/v1/datasets/1/mappings", "/api/v1/runs"]
+
+    @pytest.mark.parametrize(
+        "params,first_text",
+        [
+            ({"page": "/"}, "Upload your first dataset"),
+            ({"page": "/upload"}, "Supported formats: CSV, Excel"),
+            ({"page": "/datasets/7", "dataset_id": 7}, "Generate automatic mappings"),
+            ({"page": "/datasets/7/mappings"}, "Required fields must be mapped"),
+        ],
+    )
+    def test_contextual_suggestions(self, client, params, first_text):
+        """Test page suggestions, including the dataset-specific target."""
+        response = client.get("/api/v1/assistant/suggestions", params=params)
+
+        assert response.status_code == status.HTTP_200_OK
+        suggestions = response.json()["suggestions"]
+        assert suggestions[0]["text"] == first_text
+        if "dataset_id" in params:
+            assert suggestions[1]["target"] == "/datasets/7/quality"
+
+    def test_contextual_suggestions_etag_per_page(self, client):
+        """Test suggestions carry per-page validators and honour If-None-Match."""
+        url = "/api/v1/assistant/suggestions"
+        home = client.get(url, params={"page": "/"})
+        upload = client.get(url, params={"page": "/upload"})
+
+        assert home.headers["cache-control"] == "public, max-age=60"
+        assert home.headers["etag"] != upload.headers["etag"]
+
+        response = client.get(url, params={"page": "/"}, headers={"If-None-Match": home.headers["etag"]})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_contextual_suggestions_unknown_page(self, client):
+        """Test unknown pages return an empty suggestion list."""
+        response = client.get("/api/v1/assistant/suggestions", params={"page": "/nowhere"})
+        assert response.json() == {"suggestions": []}
+
+
+@pytest.mark.parametrize(
+    "message,intent",
+    [
+        ("show my datasets", "list_datasets"),
+        ("what templates are available?", "templates"),
+        ("how do i map fields?", "mapping"),
+        ("why did my import fail?", "errors"),
+        ("what fields does res.partner have?", "partner_fields"),
+        ("what transforms are available?", "transforms"),
+        ("show me around", "help"),
+        ("hello", None),
+    ],
+)
+def test_classify_intent(message, intent):
+    """Test intent priority matches the chat branch order."""
+    assert assistant.classify_intent(message) == intent
@@ -0,0 +1,320 @@
+"""
+Integration tests for Dataset endpoints.
+
+Tests the /api/v1/datasets/{dataset_id}/* and /api/v1/modules endpoints.
+"""
+import orjson
+import pytest
+from fastapi import status
+
+from app.models import ColumnProfile, Dataset, Mapping, Sheet, SourceFile
+
+
+@pytest.fixture
+def profiled_dataset(db_session, tmp_path):
+    """Dataset with one sheet, column profiles and a cleaned CSV on disk."""
+    cleaned_path = tmp_path / "customers.cleaned.csv"
+    cleaned_path.write_text("customer_email,customer_phone\na@example.com,555-0100\n")
+
+    source_file = SourceFile(
+        path=str(tmp_path / "customers.csv"),
+        mime_type="text/csv",
+        original_filename="customers.csv",
+    )
+    db_session.add(source_file)
+    db_session.flush()
+
+    dataset = Dataset(
+        name="Customers",
+        source_file_id=source_file.id,
+        cleaned_file_path=str(cleaned_path),
+    )
+    db_session.add(dataset)
+    db_session.flush()
+
+    sheet = Sheet(dataset_id=dataset.id, name="Sheet1", n_rows=1, n_cols=2)
+    db_session.add(sheet)
+    db_session.flush()
+
+    for name in ("customer_email", "customer_phone"):
+        db_session.add(
+            ColumnProfile(
+                sheet_id=sheet.id,
+                name=name,
+                dtype_guess="string",
+                null_pct=0.0,
+                distinct_pct=1.0,
+            )
+        )
+    db_session.commit()
+    return dataset
+
+
+@pytest.mark.api
+class TestDatasetsAPI:
+    """Test suite for dataset API endpoints."""
+
+    def test_list_datasets(self, client, profiled_dataset):
+        """Test the dataset listing includes nested sheets."""
+        response = client.get("/api/v1/datasets")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["total"] == 1
+        assert data["datasets"][0]["name"] == "Customers"
+        assert data["datasets"][0]["sheets"][0]["name"] == "Sheet1"
+
+    def test_list_datasets_query_count(self, client, db_session, profiled_dataset, count_queries):
+        """Test listing datasets loads sheets in one batch, not once per dataset."""
+        for i in range(3):
+            source_file = SourceFile(path=f"/tmp/extra_{i}.csv", mime_type="text/csv", original_filename=f"extra_{i}.csv")
+            db_session.add(source_file)
+            db_session.flush()
+            dataset = Dataset(name=f"Extra {i}", source_file_id=source_file.id)
+            db_session.add(dataset)
+            db_session.flush()
+            db_session.add(Sheet(dataset_id=dataset.id, name="Sheet1", n_rows=1, n_cols=1))
+        db_session.commit()
+
+        with count_queries() as queries:
+            response = client.get("/api/v1/datasets")
+
+        assert response.json()["total"] == 4
+        assert len(queries) == 2
+
+    def test_available_modules(self, client):
+        """Test module groups are listed with their model counts."""
+        response = client.get("/api/v1/modules")
+
+        assert response.status_code == status.HTTP_200_OK
+        modules = response.json()["modules"]
+        assert modules
+        assert {"name", "display_name", "model_count", "priority"} <= set(modules[0])
+        assert client.get("/api/v1/modules").content == response.content
+
+    def test_available_modules_conditional_get(self, client):
+        """Test a matching If-None-Match yields an empty 304."""
+        etag = client.get("/api/v1/modules").headers["etag"]
+
+        response = client.get("/api/v1/modules", headers={"If-None-Match": f"W/{etag}, \"other\""})
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert client.get("/api/v1/modules", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+    def test_set_and_get_dataset_modules(self, client, profiled_dataset):
+        """Test module selection round-trips with a capped model preview."""
+        from app.field_mapper.core.module_registry import get_module_registry
+
+        url = f"/api/v1/datasets/{profiled_dataset.id}/modules"
+        set_response = client.post(url, json=["sales_crm", "contacts"])
+        get_response = client.get(url)
+
+        assert set_response.status_code == status.HTTP_200_OK
+        assert get_response.status_code == status.HTTP_200_OK
+        data = get_response.json()
+        assert data["selected_modules"] == ["sales_crm", "contacts"]
+        assert data["model_count"] == set_response.json()["model_count"]
+        assert len(data["models"]) == min(data["model_count"], 20)
+
+        registry = get_module_registry()
+        assert registry.get_models_for_groups(["contacts", "sales_crm"]) is registry.get_models_for_groups(
+            ["sales_crm", "contacts"]
+        )
+
+    def test_set_dataset_modules_single_update(self, client, profiled_dataset, count_queries):
+        """Test storing a selection is one UPDATE, and an empty selection clears it."""
+        url = f"/api/v1/datasets/{profiled_dataset.id}/modules"
+        with count_queries() as queries:
+            response = client.post(url, json=["contacts"])
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(queries) == 1
+
+        assert client.post(url, json=[]).json()["model_count"] == 0
+        assert client.get(url).json()["selected_modules"] == []
+        assert client.post("/api/v1/datasets/99999/modules", json=["contacts"]).status_code == 404
+
+    def test_set_dataset_modules_rejects_unknown_names(self, client, profiled_dataset):
+        """Test unknown module names are reported once each, in request order."""
+        response = client.post(
+            f"/api/v1/datasets/{profiled_dataset.id}/modules",
+            json=["bogus", "contacts", "nope", "bogus"],
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"] == "Invalid module names: ['bogus', 'nope']"
+
+    def test_suggest_modules_uses_profiled_columns(self, client, profiled_dataset, count_queries):
+        """Test module suggestions are derived from the sheet column profiles."""
+        url = f"/api/v1/datasets/{profiled_dataset.id}/suggest-modules"
+        with count_queries() as queries:
+            response = client.post(url)
+
+        assert len(queries) == 1
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["column_count"] == 2
+        assert data["analyzed_columns"] == ["customer_email", "customer_phone"]
+        assert "contacts" in data["suggested_modules"]
+
+    def test_suggest_modules_without_profiles(self, client, db_session):
+        """Test a dataset with no profiled columns still gets a response."""
+        source_file = SourceFile(path="/tmp/empty.csv", mime_type="text/csv", original_filename="empty.csv")
+        db_session.add(source_file)
+        db_session.flush()
+        dataset = Dataset(name="Empty", source_file_id=source_file.id)
+        db_session.add(dataset)
+        db_session.commit()
+
+        response = client.post(f"/api/v1/datasets/{dataset.id}/suggest-modules")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["column_count"] == 0
+
+    def test_suggest_modules_missing_dataset(self, client):
+        """Test module suggestions for a non-existent dataset."""
+        response = client.post("/api/v1/datasets/99999/suggest-modules")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_cleaning_report_loaded_with_dataset(self, client, db_session, profiled_dataset, count_queries):
+        """Test the deferred cleaning report is undeferred into the dataset query."""
+        profiled_dataset.cleaning_report = {"columns_cleaned": 2, "transformations": []}
+        db_session.commit()
+
+        url = f"/api/v1/datasets/{profiled_dataset.id}/cleaning-report"
+        with count_queries() as queries:
+            response = client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["cleaning_report"]["columns_cleaned"] == 2
+        assert len(queries) == 1
+
+    def test_cleaned_data_preview(self, client, profiled_dataset):
+        """Test the cleaned CSV preview."""
+        response = client.get(f"/api/v1/datasets/{profiled_dataset.id}/cleaned-data", params={"limit": 10})
+
+        assert response.status_code == status.HTTP_200_OK
+        sheet = response.json()["sheets"]["Sheet1"]
+        assert sheet["columns"] == ["customer_email", "customer_phone"]
+        assert sheet["data"] == [{"customer_email": "a@example.com", "customer_phone": "555-0100"}]
+
+    def test_cleaned_data_preview_column_projection(self, client, profiled_dataset):
+        """Test only requested columns are previewed; unknown names are ignored."""
+        response = client.get(
+            f"/api/v1/datasets/{profiled_dataset.id}/cleaned-data",
+            params={"columns": ["customer_phone", "missing"]},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        sheet = response.json()["sheets"]["Sheet1"]
+        assert sheet["columns"] == ["customer_phone"]
+        assert sheet["data"] == [{"customer_phone": "555-0100"}]
+
+    def test_cleaned_data_preview_excel(self, client, db_session, profiled_dataset, tmp_path):
+        """Test every sheet of a cleaned workbook is previewed up to the limit."""
+        pd = pytest.importorskip("pandas")
+        xlsx_path = tmp_path / "customers.cleaned.xlsx"
+        with pd.ExcelWriter(xlsx_path) as writer:
+            pd.DataFrame({"a": [1, 2, 3]}).to_excel(writer, sheet_name="First", index=False)
+            pd.DataFrame({"b": ["x"]}).to_excel(writer, sheet_name="Second", index=False)
+        profiled_dataset.cleaned_file_path = str(xlsx_path)
+        db_session.commit()
+
+        response = client.get(f"/api/v1/datasets/{profiled_dataset.id}/cleaned-data", params={"limit": 2})
+
+        assert response.status_code == status.HTTP_200_OK
+        sheets = response.json()["sheets"]
+        assert sheets["First"]["data"] == [{"a": 1}, {"a": 2}]
+        assert sheets["Second"]["total_rows"] == 1
+
+    def test_download_cleaned_data(self, client, profiled_dataset, count_queries):
+        """Test the cleaned file is returned as an attachment."""
+        url = f"/api/v1/datasets/{profiled_dataset.id}/download-cleaned"
+        with count_queries() as queries:
+            response = client.get(url)
+
+        # dataset joined with its source file, nothing else
+        assert len(queries) == 1
+        assert response.status_code == status.HTTP_200_OK
+        assert 'filename="customers_cleaned.csv"' in response.headers["content-disposition"]
+        assert response.content.startswith(b"customer_email,customer_phone")
+
+    def test_download_cleaned_data_x_accel(self, client, profiled_dataset, tmp_path, monkeypatch):
+        """Test downloads are delegated to nginx when X-Accel is enabled."""
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "X_ACCEL_ENABLED", True)
+        monkeypatch.setattr(settings, "STORAGE_PATH", str(tmp_path))
+
+        response = client.get(f"/api/v1/datasets/{profiled_dataset.id}/download-cleaned")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["x-accel-redirect"] == "/_storage/customers.cleaned.csv"
+        assert "customers_cleaned.csv" in response.headers["content-disposition"]
+        assert response.content == b""
+
+    def test_export_for_odoo_streams_ndjson(self, client, db_session, profiled_dataset, count_queries):
+        """Test the export streams metadata, a sheet header and one line per row."""
+        sheet = profiled_dataset.sheets[0]
+        db_session.add(
+            Mapping(
+                dataset_id=profiled_dataset.id,
+                sheet_id=sheet.id,
+                header_name="customer_email",
+                target_model="res.partner",
+                target_field="email",
+                chosen=True,
+            )
+        )
+        db_session.add(
+            Mapping(
+                dataset_id=profiled_dataset.id,
+                sheet_id=sheet.id,
+                header_name="customer_phone",
+                target_model="crm.lead",
+                target_field="phone",
+                chosen=False,
+            )
+        )
+        db_session.commit()
+
+        url = f"/api/v1/datasets/{profiled_dataset.id}/export-for-odoo"
+        with count_queries() as queries:
+            response = client.get(url)
+
+        # dataset (with cleaning report) + mappings; sheets and profiles are not loaded
+        assert len(queries) == 2
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [orjson.loads(line) for line in response.content.splitlines()]
+        assert lines[0]["type"] == "metadata"
+        assert [m["target_field"] for m in lines[0]["field_mappings"]] == ["email"]
+        assert lines[0]["import_instructions"]["models_detected"] == ["res.partner"]
+        assert lines[1] == {
+            "type": "sheet",
+            "name": "Sheet1",
+            "columns": ["customer_email", "customer_phone"],
+        }
+        assert lines[2:] == [
+            {"type": "row", "data": {"customer_email": "a@example.com", "customer_phone": "555-0100"}}
+        ]
+
+    def test_export_for_odoo_producer_is_async(self):
+        """Test the export stream is fed by an async generator.
+
+        Sync iterators are wrapped by Starlette in iterate_in_threadpool,
+        costing a thread hop per chunk.
+        """
+        import inspect
+
+        from app.api.datasets import _export_lines
+
+        assert inspect.isasyncgenfunction(_export_lines)
+
+    def test_export_for_odoo_requires_confirmed_mappings(self, client, profiled_dataset):
+        """Test exporting without confirmed mappings is rejected before streaming."""
+        response = client.get(f"/api/v1/datasets/{profiled_dataset.id}/export-for-odoo")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,100 @@
+"""
+Integration tests for Exceptions API endpoints.
+
+Tests:
+- GET /datasets/{id}/exceptions
+- GET /datasets/{id}/exceptions/count
+- DELETE /datasets/{id}/exceptions
+"""
+import pytest
+
+from app.adapters.repositories_sqlite import SQLiteExceptionsRepo
+from app.models import Dataset, SourceFile
+
+
+@pytest.fixture
+def dataset_with_exceptions(db_session):
+    """Dataset with three exceptions across two models."""
+    source_file = SourceFile(
+        path="/tmp/exceptions.csv",
+        mime_type="text/csv",
+        original_filename="exceptions.csv",
+    )
+    db_session.add(source_file)
+    db_session.flush()
+
+    dataset = Dataset(name="Exceptions Dataset", source_file_id=source_file.id)
+    db_session.add(dataset)
+    db_session.flush()
+
+    repo = SQLiteExceptionsRepo(db_session)
+    repo.add(dataset.id, "res.partner", "row_1", "REQ_MISSING", "Name required", {"name": None})
+    repo.add(dataset.id, "res.partner", "row_2", "ENUM_UNKNOWN", "Bad type", {"type": "x", "n": 1.5})
+    repo.add(dataset.id, "crm.lead", "row_3", "FK_UNRESOLVED", "No partner", {"partner": "y"})
+    db_session.commit()
+    return dataset
+
+
+class TestExceptionsAPI:
+    """Test suite for exceptions API endpoints."""
+
+    def test_list_exceptions(self, client, dataset_with_exceptions):
+        """Test listing exceptions returns offending payloads intact."""
+        response = client.get(f"/api/v1/datasets/{dataset_with_exceptions.id}/exceptions")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["dataset_id"] == dataset_with_exceptions.id
+        assert data["model"] is None
+        assert data["total"] == 3
+
+        offending = {exc["row_ptr"]: exc["offending"] for exc in data["exceptions"]}
+        assert offending == {
+            "row_1": {"name": None},
+            "row_2": {"type": "x", "n": 1.5},
+            "row_3": {"partner": "y"},
+        }
+        assert all(isinstance(exc["created_at"], str) for exc in data["exceptions"])
+
+    def test_list_exceptions_model_filter(self, client, dataset_with_exceptions):
+        """Test listing exceptions filtered by model."""
+        response = client.get(
+            f"/api/v1/datasets/{dataset_with_exceptions.id}/exceptions",
+            params={"model": "crm.lead"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert data["exceptions"][0]["error_code"] == "FK_UNRESOLVED"
+
+    def test_list_exceptions_paginated(self, client, dataset_with_exceptions):
+        """Test a page carries the full total but only its own rows."""
+        url = f"/api/v1/datasets/{dataset_with_exceptions.id}/exceptions"
+        pages = [client.get(url, params={"skip": skip, "limit": 2}).json() for skip in (0, 2)]
+
+        assert [page["total"] for page in pages] == [3, 3]
+        assert [len(page["exceptions"]) for page in pages] == [2, 1]
+        row_ptrs = {exc["row_ptr"] for page in pages for exc in page["exceptions"]}
+        assert row_ptrs == {"row_1", "row_2", "row_3"}
+
+        assert client.get(url, params={"limit": 1001}).status_code == 422
+
+    def test_count_and_clear_exceptions(self, client, dataset_with_exceptions):
+        """Test counting and clearing exceptions."""
+        url = f"/api/v1/datasets/{dataset_with_exceptions.id}/exceptions"
+
+        assert client.get(f"{url}/count").json()["count"] == 3
+
+        response = client.delete(url, params={"model": "res.partner"})
+        assert response.status_code == 200
+        assert response.json()["deleted_count"] == 2
+
+        assert client.get(f"{url}/count").json()["count"] == 1
+
+    def test_clear_exceptions_in_batches(self, db_session, dataset_with_exceptions):
+        """Test clearing in batches smaller than the match set removes every row."""
+        repo = SQLiteExceptionsRepo(db_session)
+
+        assert repo.clear(dataset_with_exceptions.id, batch_size=2) == 3
+        assert repo.count(dataset_with_exceptions.id) == 0
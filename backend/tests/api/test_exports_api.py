@@ -0,0 +1,127 @@
+"""
+Integration tests for Export endpoints.
+
+Tests the /api/v1/datasets/{dataset_id}/export/* endpoints.
+"""
+import io
+import zipfile
+
+import pytest
+from fastapi import status
+
+from app.models import Dataset, Mapping, Sheet, SourceFile
+
+
+@pytest.fixture
+def mapped_dataset(db_session, tmp_path):
+    """Dataset with a CSV on disk and one chosen mapping."""
+    csv_path = tmp_path / "contacts.csv"
+    csv_path.write_text("email\na@example.com\nb@example.com\n")
+
+    source_file = SourceFile(path=str(csv_path), mime_type="text/csv", original_filename="contacts.csv")
+    db_session.add(source_file)
+    db_session.flush()
+
+    dataset = Dataset(name="Contacts", source_file_id=source_file.id)
+    db_session.add(dataset)
+    db_session.flush()
+
+    sheet = Sheet(dataset_id=dataset.id, name="contacts", n_rows=2, n_cols=1)
+    db_session.add(sheet)
+    db_session.flush()
+
+    db_session.add(
+        Mapping(
+            dataset_id=dataset.id,
+            sheet_id=sheet.id,
+            header_name="email",
+            target_model="res.partner",
+            target_field="email",
+            chosen=True,
+        )
+    )
+    db_session.commit()
+    return dataset
+
+
+@pytest.mark.api
+class TestExportsAPI:
+    """Test suite for export API endpoints."""
+
+    def test_export_odoo_migrate_streams_zip(self, client, mapped_dataset):
+        """Test the streamed archive unpacks to config files and cleaned CSVs."""
+        response = client.post(f"/api/v1/datasets/{mapped_dataset.id}/export/odoo-migrate")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/zip"
+        assert "content-length" not in response.headers
+
+        with zipfile.ZipFile(io.BytesIO(response.content)) as zipf:
+            assert "config/project.yml" in zipf.namelist()
+            assert zipf.read("data/raw/res.partner.csv").decode().splitlines() == [
+                "email",
+                "a@example.com",
+                "b@example.com",
+            ]
+
+    def test_iter_archive_chunks_and_closes(self, monkeypatch):
+        """Test the archive is yielded in fixed-size chunks and closed afterwards."""
+        from app.api import exports
+
+        monkeypatch.setattr(exports, "EXPORT_CHUNK_SIZE", 4)
+        archive = io.BytesIO(b"0123456789")
+
+        assert list(exports._iter_archive(archive)) == [b"0123", b"4567", b"89"]
+        assert archive.closed
+
+    def test_export_odoo_migrate_missing_dataset(self, client):
+        """Test exporting a non-existent dataset fails before streaming."""
+        response = client.post("/api/v1/datasets/99999/export/odoo-migrate")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_preview_export_query_count(self, client, db_session, mapped_dataset, count_queries):
+        """Test the preview loads mappings per level, not once per sheet."""
+        for name in ("second", "third", "fourth", "fifth", "sixth"):
+            sheet = Sheet(dataset_id=mapped_dataset.id, name=name, n_rows=0, n_cols=1)
+            db_session.add(sheet)
+            db_session.flush()
+            db_session.add(
+                Mapping(
+                    dataset_id=mapped_dataset.id,
+                    sheet_id=sheet.id,
+                    header_name=f"{name}_ref",
+                    target_model="res.partner",
+                    target_field="ref",
+                    chosen=True,
+                )
+            )
+        db_session.commit()
+
+        url = f"/api/v1/datasets/{mapped_dataset.id}/export/odoo-migrate/preview"
+        with count_queries() as queries:
+            response = client.get(url)
+
+        # dataset + source file (joined), sheets, profiles, mappings, transforms
+        assert len(queries) == 5
+        assert response.status_code == status.HTTP_200_OK
+        (model,) = response.json()["models"]
+        assert model["field_count"] == 6
+        assert model["external_id_pattern"] == "migr.partner.{ref}"
+        assert model["fields"][0] == {"source": "email", "target": "email", "has_transforms": False}
+
+    def test_preview_export_missing_dataset(self, client):
+        """Test previewing a non-existent dataset is a 404, not a wrapped 500."""
+        response = client.get("/api/v1/datasets/99999/export/odoo-migrate/preview")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_export_for_odoo_legacy(self, client, mapped_dataset, tmp_path, monkeypatch):
+        """Test the registry-driven export reports a summary without a graph run."""
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "ARTIFACT_ROOT", str(tmp_path))
+        response = client.post(f"/api/v1/datasets/{mapped_dataset.id}/export-for-odoo")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["dataset_id"] == mapped_dataset.id
+        assert data["message"] == "Export completed"
@@ -0,0 +1,74 @@
+"""
+Integration tests for the health endpoint.
+
+Tests the /api/v1/health endpoint.
+"""
+import asyncio
+import time
+
+import pytest
+from fastapi import status
+
+from app.core import redis as redis_module
+
+
+class _FakeRedis:
+    def __init__(self, error=None, delay=0.0):
+        self.error = error
+        self.delay = delay
+        self.pings = 0
+
+    async def ping(self):
+        self.pings += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return True
+
+    async def aclose(self):
+        pass
+
+
+@pytest.mark.api
+class TestHealthAPI:
+    """Test suite for the health endpoint."""
+
+    def test_health_reuses_shared_redis_client(self, client, monkeypatch):
+        """Test consecutive checks ping through the same Redis client."""
+        fake = _FakeRedis()
+        monkeypatch.setattr(redis_module, "_redis", fake)
+
+        for _ in range(2):
+            response = client.get("/api/v1/health")
+            assert response.status_code == status.HTTP_200_OK
+            assert response.json() == {"status": "healthy", "database": "connected", "redis": "connected"}
+
+        assert fake.pings == 2
+
+    def test_health_reports_redis_failure(self, client, monkeypatch):
+        """Test a Redis error marks the service unhealthy."""
+        monkeypatch.setattr(redis_module, "_redis", _FakeRedis(ConnectionError("refused")))
+
+        data = client.get("/api/v1/health").json()
+
+        assert data["status"] == "unhealthy"
+        assert data["database"] == "connected"
+        assert data["redis"] == "error: refused"
+
+    def test_health_checks_run_concurrently(self, client, db_session, monkeypatch):
+        """Test a slow database and a slow Redis are probed in parallel."""
+        monkeypatch.setattr(redis_module, "_redis", _FakeRedis(delay=0.3))
+        original_execute = db_session.execute
+
+        def slow_execute(*args, **kwargs):
+            time.sleep(0.3)
+            return original_execute(*args, **kwargs)
+
+        monkeypatch.setattr(db_session, "execute", slow_execute)
+
+        started = time.perf_counter()
+        data = client.get("/api/v1/health").json()
+        elapsed = time.perf_counter() - started
+
+        assert data["status"] == "healthy"
+        assert elapsed < 0.55
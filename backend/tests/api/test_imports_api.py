@@ -0,0 +1,26 @@
+"""
+Integration tests for import run endpoints.
+
+Tests the /api/v1/datasets/{dataset_id}/runs endpoint.
+"""
+import pytest
+from fastapi import status
+
+
+@pytest.mark.api
+class TestImportsAPI:
+    """Test suite for import run API endpoints."""
+
+    def test_create_run(self, client, sample_dataset, count_queries):
+        """Test a run is created with a single INSERT ... RETURNING."""
+        dataset_id = sample_dataset.id
+
+        with count_queries() as queries:
+            response = client.post(f"/api/v1/datasets/{dataset_id}/runs", json={"dry_run": True})
+
+        assert response.status_code == status.HTTP_200_OK
+        run = response.json()
+        assert run["dataset_id"] == dataset_id
+        assert run["status"] == "pending"
+        assert run["started_at"]
+        assert [q for q in queries if q.lstrip().upper().startswith("SELECT")] == []
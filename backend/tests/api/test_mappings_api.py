@@ -80,6 +80,99 @@ class TestMappingsAPI:
         # Verify all mappings returned
         assert len(data["mappings"]) == len(sample_mappings)
 
+    def test_get_dataset_mappings_query_count(self, client, db_session, sample_mappings, sample_dataset, count_queries):
+        """Test transforms and suggestions are batch-loaded, not fetched per mapping."""
+        from app.models import Suggestion, Transform
+
+        for mapping in sample_mappings:
+            db_session.add(Transform(mapping_id=mapping.id, order=0, fn="trim", params={}))
+            db_session.add(Suggestion(mapping_id=mapping.id, candidates=[{"field": "name"}]))
+        db_session.commit()
+
+        url = f"/api/v1/datasets/{sample_dataset.id}/mappings"
+        with count_queries() as queries:
+            response = client.get(url)
+
+        # mappings, suggestions, transforms
+        assert len(queries) == 3
+        mappings = response.json()["mappings"]
+        assert [m["id"] for m in mappings] == sorted(m["id"] for m in mappings)
+        assert all(len(m["transforms"]) == 1 and len(m["suggestions"]) == 1 for m in mappings)
+
+    def test_get_dataset_mappings_conditional_get(self, client, sample_mappings, sample_dataset):
+        """Test polling unchanged mappings with If-None-Match yields an empty 304."""
+        url = f"/api/v1/datasets/{sample_dataset.id}/mappings"
+        etag = client.get(url).headers["etag"]
+
+        response = client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+
+    def test_get_dataset_mappings_keyset_pages(self, client, sample_mappings, sample_dataset):
+        """Test mappings page by id, with total covering the whole dataset."""
+        url = f"/api/v1/datasets/{sample_dataset.id}/mappings"
+        first = client.get(url, params={"limit": 2}).json()
+        rest = client.get(url, params={"limit": 2, "after_id": first["next_cursor"]}).json()
+
+        ids = [m["id"] for m in first["mappings"] + rest["mappings"]]
+        assert ids == sorted(m.id for m in sample_mappings)
+        assert first["total"] == rest["total"] == len(sample_mappings)
+        assert rest["next_cursor"] is None
+
+    def test_mapping_list_body_matches_validated_schema(self, db_session, sample_mappings, sample_dataset):
+        """Test the unvalidated fast path serialises exactly like the schema would."""
+        from app.api.mappings import _mapping_list_body
+        from app.models import Suggestion, Transform
+        from app.schemas.mapping import MappingListResponse
+        from app.services.mapping_service import MappingService
+
+        db_session.add(Transform(mapping_id=sample_mappings[0].id, order=0, fn="trim", params={"x": 1}))
+        db_session.add(Suggestion(mapping_id=sample_mappings[0].id, candidates=[{"field": "name"}]))
+        sample_mappings[1].confidence = None
+        db_session.commit()
+
+        mappings = MappingService(db_session).get_mappings_for_dataset(sample_dataset.id)
+        expected = MappingListResponse.model_validate(
+            {"mappings": mappings, "total": len(mappings)}, from_attributes=True
+        ).model_dump_json().encode()
+
+        assert _mapping_list_body(mappings) == expected
+
+    def test_get_dataset_mappings_unscored(self, client, db_session, sample_dataset):
+        """Test an unscored mapping serialises with zero confidence and empty collections."""
+        from app.models import Mapping
+
+        db_session.add(
+            Mapping(
+                dataset_id=sample_dataset.id,
+                sheet_id=sample_dataset.sheets[0].id,
+                header_name="Notes",
+                confidence=None,
+            )
+        )
+        db_session.commit()
+
+        (mapping,) = client.get(f"/api/v1/datasets/{sample_dataset.id}/mappings").json()["mappings"]
+
+        assert mapping["confidence"] == 0.0
+        assert mapping["status"] == "pending"
+        assert mapping["transforms"] == [] and mapping["suggestions"] == []
+        assert mapping["custom_field_definition"] is None
+
+    def test_reload_generated_mappings_in_bulk(self, db_session, sample_mappings, count_queries):
+        """Test committed (expired) mappings are reloaded with their collections in three queries."""
+        from app.services.mapping_service import MappingService
+
+        db_session.expire_all()
+        with count_queries() as queries:
+            reloaded = MappingService(db_session)._reload_with_relations(sample_mappings)
+            for mapping in reloaded:
+                mapping.transforms, mapping.suggestions
+
+        assert len(queries) == 3
+        assert len(reloaded) == len(sample_mappings)
+
     def test_get_mappings_empty_dataset(self, client, sample_dataset):
         """Test retrieving mappings from dataset with no mappings."""
         response = client.get(f"/api/v1/datasets/{sample_dataset.id}/mappings")
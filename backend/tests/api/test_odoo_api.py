@@ -0,0 +1,63 @@
+"""
+Integration tests for Odoo connection endpoints.
+
+Tests the /api/v1/odoo/connections endpoints.
+"""
+import pytest
+from fastapi import status
+
+
+def _connection(name, is_default=False):
+    return {
+        "name": name,
+        "url": "https://odoo.example.com",
+        "database": "odoo",
+        "username": "admin",
+        "password": "secret",
+        "is_default": is_default,
+    }
+
+
+@pytest.mark.api
+class TestOdooConnectionsAPI:
+    """Test suite for Odoo connection API endpoints."""
+
+    def test_create_default_connection_replaces_previous(self, client):
+        """Test a new default connection clears the flag on the old one."""
+        first = client.post("/api/v1/odoo/connections", json=_connection("Staging", is_default=True))
+        client.post("/api/v1/odoo/connections", json=_connection("Sandbox"))
+        second = client.post("/api/v1/odoo/connections", json=_connection("Production", is_default=True))
+
+        assert first.status_code == second.status_code == status.HTTP_200_OK
+
+        defaults = {c["name"]: c["is_default"] for c in client.get("/api/v1/odoo/connections").json()}
+        assert defaults == {"Staging": False, "Sandbox": False, "Production": True}
+
+    def test_get_missing_connection(self, client):
+        """Test fetching a non-existent connection."""
+        response = client.get("/api/v1/odoo/connections/99999")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_list_connections_keyset_pages(self, client):
+        """Test connections page by id with an X-Next-Cursor header."""
+        for name in ("A", "B", "C"):
+            client.post("/api/v1/odoo/connections", json=_connection(name))
+
+        first = client.get("/api/v1/odoo/connections", params={"limit": 2})
+        cursor = first.headers["x-next-cursor"]
+        second = client.get("/api/v1/odoo/connections", params={"limit": 2, "after_id": cursor})
+
+        assert [c["name"] for c in first.json()] == ["A", "B"]
+        assert [c["name"] for c in second.json()] == ["C"]
+        assert "x-next-cursor" not in second.headers
+
+    def test_list_connections_skips_password(self, client, count_queries):
+        """Test the listing selects only the columns it returns."""
+        client.post("/api/v1/odoo/connections", json=_connection("Staging"))
+
+        with count_queries() as queries:
+            response = client.get("/api/v1/odoo/connections")
+
+        assert "password" not in response.json()[0]
+        assert len(queries) == 1 and "password" not in queries[0]
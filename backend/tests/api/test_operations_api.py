@@ -0,0 +1,78 @@
+"""
+Integration tests for operation status polling.
+
+Tests the /api/v1/operations/{operation_id}/status endpoint.
+"""
+import pytest
+from fastapi import status
+
+from app.api import operations
+
+
+class _FakeTracker:
+    def __init__(self, state):
+        self.state = state
+
+    def get_status(self):
+        return dict(self.state)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def tracked_operation(monkeypatch):
+    """Serve one operation from an in-memory tracker and count store reads."""
+    state = {"id": "op-1", "status": "running", "progress": 10.0}
+    reads = []
+
+    def fake_get(operation_id):
+        reads.append(operation_id)
+        return _FakeTracker(state) if operation_id == state["id"] else None
+
+    monkeypatch.setattr(operations.OperationTracker, "get", staticmethod(fake_get))
+    operations._status_cache.clear()
+    yield state, reads
+    operations._status_cache.clear()
+
+
+@pytest.mark.api
+class TestOperationsAPI:
+    """Test suite for the operation status endpoint."""
+
+    def test_polls_within_ttl_share_one_read(self, client, tracked_operation):
+        """Test back-to-back polls are served from the short-lived cache."""
+        state, reads = tracked_operation
+
+        first = client.get("/api/v1/operations/op-1/status")
+        second = client.get("/api/v1/operations/op-1/status")
+
+        assert first.json() == second.json() == state
+        assert reads == ["op-1"]
+
+    def test_progress_visible_after_ttl(self, client, tracked_operation):
+        """Test a new status is read once the cached one expires."""
+        state, reads = tracked_operation
+        client.get("/api/v1/operations/op-1/status")
+
+        state["progress"] = 55.0
+        operations._status_cache.expire(operations._status_cache.timer() + operations.STATUS_TTL_SECONDS)
+
+        assert client.get("/api/v1/operations/op-1/status").json()["progress"] == 55.0
+        assert len(reads) == 2
+
+    def test_unchanged_status_is_not_modified(self, client, tracked_operation):
+        """Test pollers sending the last ETag get an empty 304."""
+        etag = client.get("/api/v1/operations/op-1/status").headers["etag"]
+
+        response = client.get("/api/v1/operations/op-1/status", headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_missing_operation(self, client, tracked_operation):
+        """Test unknown operations are a 404 and are not cached."""
+        _, reads = tracked_operation
+
+        assert client.get("/api/v1/operations/nope/status").status_code == status.HTTP_404_NOT_FOUND
+        assert client.get("/api/v1/operations/nope/status").status_code == status.HTTP_404_NOT_FOUND
+        assert reads == ["nope", "nope"]
@@ -0,0 +1,63 @@
+"""
+Convention checks across API routes.
+
+Handlers that take a sync SQLAlchemy session must be plain ``def`` so FastAPI
+runs them in its threadpool rather than blocking the event loop.
+"""
+import inspect
+
+import pytest
+from fastapi.routing import APIRoute
+
+from app.core.database import get_db
+from app.main import app
+
+# Handlers that genuinely await (e.g. reading the upload body) stay async
+ASYNC_ALLOWED = {"upload_dataset", "create_run", "rollback_run", "generate_mappings", "generate_addon"}
+
+
+def _uses_get_db(dependant) -> bool:
+    return any(
+        dep.call is get_db or _uses_get_db(dep)
+        for dep in dependant.dependencies
+    )
+
+
+@pytest.mark.parametrize("module", [
+    "app.api.addons", "app.api.datasets", "app.api.exceptions", "app.api.exports", "app.api.graphs", "app.api.odoo",
+    "app.api.imports", "app.api.mappings", "app.api.sheets", "app.api.templates", "app.api.transforms",
+])
+def test_db_handlers_are_sync(module):
+    offenders = [
+        route.endpoint.__name__
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        and route.endpoint.__module__ == module
+        and _uses_get_db(route.dependant)
+        and inspect.iscoroutinefunction(route.endpoint)
+        and route.endpoint.__name__ not in ASYNC_ALLOWED
+    ]
+    assert offenders == []
+
+
+def test_odoo_handlers_are_sync():
+    """XML-RPC calls block, so Odoo routes run in the threadpool even without a session."""
+    offenders = [
+        route.endpoint.__name__
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        and route.endpoint.__module__ == "app.api.odoo"
+        and inspect.iscoroutinefunction(route.endpoint)
+    ]
+    assert offenders == []
+
+
+def test_routes_default_to_orjson():
+    from fastapi.responses import ORJSONResponse
+
+    defaults = {
+        getattr(route.response_class, "value", route.response_class)
+        for route in app.routes
+        if isinstance(route, APIRoute)
+    }
+    assert defaults == {ORJSONResponse}
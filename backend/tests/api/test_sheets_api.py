@@ -0,0 +1,144 @@
+"""
+Integration tests for Sheet endpoints.
+
+Tests the /api/v1/sheets/{sheet_id}/* endpoints.
+"""
+import pytest
+from fastapi import status
+
+from app.models import ColumnProfile
+
+
+@pytest.mark.api
+class TestSheetsAPI:
+    """Test suite for sheet API endpoints."""
+
+    def test_get_sheet_profiles(self, client, db_session, sample_dataset):
+        """Test profiles are listed with null JSON columns defaulted."""
+        sheet = sample_dataset.sheets[0]
+        db_session.add(
+            ColumnProfile(sheet_id=sheet.id, name="email", dtype_guess="string", null_pct=0.0, distinct_pct=1.0)
+        )
+        db_session.commit()
+
+        response = client.get(f"/api/v1/sheets/{sheet.id}/profiles")
+
+        assert response.status_code == status.HTTP_200_OK
+        (profile,) = response.json()
+        assert profile["name"] == "email"
+        assert profile["patterns"] == {} and profile["sample_values"] == []
+        assert response.headers["cache-control"] == "no-cache"
+
+    def test_get_sheet_profiles_single_query(self, client, db_session, sample_dataset, count_queries):
+        """Test a sheet with profiles is served without a separate existence check."""
+        sheet_id = sample_dataset.sheets[0].id
+        db_session.add(
+            ColumnProfile(sheet_id=sheet_id, name="email", dtype_guess="string", null_pct=0.0, distinct_pct=1.0)
+        )
+        db_session.commit()
+
+        with count_queries() as queries:
+            response = client.get(f"/api/v1/sheets/{sheet_id}/profiles")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(queries) == 1
+
+    def test_get_sheet_profiles_keyset_pages(self, client, db_session, sample_dataset):
+        """Test profiles page by id with an X-Next-Cursor header."""
+        sheet_id = sample_dataset.sheets[0].id
+        db_session.add_all([
+            ColumnProfile(sheet_id=sheet_id, name=name, dtype_guess="string", null_pct=0.0, distinct_pct=1.0)
+            for name in ("a", "b", "c")
+        ])
+        db_session.commit()
+        url = f"/api/v1/sheets/{sheet_id}/profiles"
+
+        first = client.get(url, params={"limit": 2})
+        second = client.get(url, params={"limit": 2, "after_id": first.headers["x-next-cursor"]})
+
+        assert [p["name"] for p in first.json()] == ["a", "b"]
+        assert [p["name"] for p in second.json()] == ["c"]
+        assert "x-next-cursor" not in second.headers
+
+    def test_get_sheet_profiles_empty(self, client, sample_dataset):
+        """Test an existing sheet without profiles returns an empty list."""
+        response = client.get(f"/api/v1/sheets/{sample_dataset.sheets[0].id}/profiles")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+
+    def test_get_sheet_profiles_revalidation(self, client, db_session, sample_dataset):
+        """Test an unchanged profile list is a 304 and a change yields a new ETag."""
+        sheet = sample_dataset.sheets[0]
+        url = f"/api/v1/sheets/{sheet.id}/profiles"
+        etag = client.get(url).headers["etag"]
+
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == status.HTTP_304_NOT_MODIFIED
+
+        db_session.add(
+            ColumnProfile(sheet_id=sheet.id, name="phone", dtype_guess="string", null_pct=0.0, distinct_pct=1.0)
+        )
+        db_session.commit()
+
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"] != etag
+
+    def test_get_sheet_profiles_missing_sheet(self, client):
+        """Test profiles for a non-existent sheet."""
+        assert client.get("/api/v1/sheets/99999/profiles").status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.fixture
+    def split_sheet(self, tmp_path, monkeypatch, sample_dataset):
+        """Write the split CSV for the sample sheet under a temporary storage root."""
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "STORAGE_PATH", str(tmp_path))
+        sheet = sample_dataset.sheets[0]
+        split_dir = tmp_path / "split_sheets"
+        split_dir.mkdir()
+        (split_dir / f"dataset_{sheet.dataset_id}_{sheet.name}.csv").write_text("name\nAda\n")
+        return sheet
+
+    def test_download_sheet_validators(self, client, split_sheet):
+        """Test the CSV is sent with ETag, Last-Modified and a private cache policy."""
+        response = client.get(f"/api/v1/sheets/{split_sheet.id}/download")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.text == "name\nAda\n"
+        assert response.headers["etag"].startswith('W/"')
+        assert "last-modified" in response.headers
+        assert response.headers["cache-control"] == "private, max-age=300"
+
+    def test_download_sheet_not_gzipped(self, client, tmp_path, split_sheet):
+        """Test file downloads bypass gzip so sendfile and Range requests keep working."""
+        path = tmp_path / "split_sheets" / f"dataset_{split_sheet.dataset_id}_{split_sheet.name}.csv"
+        path.write_text("name\n" + "Ada Lovelace\n" * 500)
+
+        response = client.get(f"/api/v1/sheets/{split_sheet.id}/download", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "content-encoding" not in response.headers
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.text.startswith("name\nAda Lovelace\n")
+
+    def test_download_sheet_not_modified(self, client, split_sheet):
+        """Test either validator turns a repeat download into an empty 304."""
+        url = f"/api/v1/sheets/{split_sheet.id}/download"
+        first = client.get(url)
+
+        by_etag = client.get(url, headers={"If-None-Match": first.headers["etag"]})
+        by_date = client.get(url, headers={"If-Modified-Since": first.headers["last-modified"]})
+
+        assert by_etag.status_code == status.HTTP_304_NOT_MODIFIED
+        assert by_date.status_code == status.HTTP_304_NOT_MODIFIED
+        assert by_etag.content == b""
+
+    def test_download_sheet_stale_etag(self, client, split_sheet):
+        """Test a non-matching ETag wins over a fresh If-Modified-Since."""
+        url = f"/api/v1/sheets/{split_sheet.id}/download"
+        last_modified = client.get(url).headers["last-modified"]
+
+        response = client.get(url, headers={"If-None-Match": 'W/"stale"', "If-Modified-Since": last_modified})
+
+        assert response.status_code == status.HTTP_200_OK
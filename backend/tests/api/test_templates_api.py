@@ -0,0 +1,70 @@
+"""
+Integration tests for Template endpoints.
+
+Tests the /api/v1/templates listing endpoints.
+"""
+import pytest
+from fastapi import status
+
+
+@pytest.mark.api
+class TestTemplatesAPI:
+    """Test suite for template API endpoints."""
+
+    def test_list_templates_cached(self, client):
+        """Test the listing is served as a cacheable body with an ETag."""
+        response = client.get("/api/v1/templates")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert isinstance(response.json(), list)
+        assert response.headers["cache-control"] == "public, max-age=300"
+
+        repeat = client.get("/api/v1/templates", headers={"If-None-Match": response.headers["etag"]})
+        assert repeat.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_list_templates_by_category(self, client):
+        """Test the category filter is applied to the cached listing."""
+        templates = client.get("/api/v1/templates", params={"category": "sales"}).json()
+
+        assert all(t["category"] == "sales" for t in templates)
+
+    def test_get_template_categories(self, client):
+        """Test categories are served from the cached body."""
+        response = client.get("/api/v1/templates/categories")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "foundation" in {c["id"] for c in response.json()}
+
+    @pytest.fixture
+    def template_runs(self, db_session):
+        """Two graphs from different templates, each with runs."""
+        from app.models.graph import Graph, GraphRun
+
+        for graph_id, template_id in (("g-sales", "template_sales_crm"), ("g-projects", "template_projects")):
+            db_session.add(Graph(id=graph_id, name=graph_id, spec={"metadata": {"template_id": template_id}}))
+        db_session.add_all([
+            GraphRun(id="r1", graph_id="g-sales", status="failed", context={"executed_nodes": ["res.partner"]}),
+            GraphRun(id="r2", graph_id="g-projects", status="completed", context={"plan": ["res.partner"]}),
+        ])
+        db_session.commit()
+
+    def test_get_templates_progress_batched(self, client, template_runs, count_queries):
+        """Test progress for several templates is read with one graph and one run query."""
+        with count_queries() as queries:
+            response = client.get(
+                "/api/v1/templates/progress",
+                params=[("ids", "template_sales_crm"), ("ids", "template_projects"), ("ids", "template_missing")],
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        progress = {p["templateId"]: p["completedModels"] for p in response.json()}
+        assert progress == {"template_sales_crm": ["res.partner"], "template_projects": ["res.partner"]}
+        assert len(queries) == 2
+
+    def test_get_template_progress(self, client, template_runs):
+        """Test the single-template endpoint reuses the batched path."""
+        response = client.get("/api/v1/templates/template_sales_crm/progress")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["completedModels"] == ["res.partner"]
+        assert client.get("/api/v1/templates/template_missing/progress").status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,118 @@
+"""
+Integration tests for Transform endpoints.
+
+Tests the /api/v1/transforms/* endpoints.
+"""
+import pytest
+from fastapi import status
+
+from app.services.transform_service import TransformService
+
+
+@pytest.mark.api
+class TestTransformsAPI:
+    """Test suite for transform API endpoints."""
+
+    def test_get_available_transforms(self, client):
+        """Test the registry is served with a long-lived cache header."""
+        response = client.get("/api/v1/transforms/available")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == TransformService.get_available_transforms()
+        assert response.headers["cache-control"] == "public, max-age=3600"
+
+    def test_get_available_transforms_gzipped(self, client):
+        """Test large JSON bodies are gzipped for clients that accept it."""
+        response = client.get("/api/v1/transforms/available", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.json() == TransformService.get_available_transforms()
+
+    def test_get_available_transforms_not_modified(self, client):
+        """Test a matching If-None-Match short-circuits to 304."""
+        etag = client.get("/api/v1/transforms/available").headers["etag"]
+
+        response = client.get("/api/v1/transforms/available", headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    @pytest.fixture
+    def transform_chain(self, db_session, sample_mappings):
+        """Four transforms on one mapping, in order trim, lowercase, uppercase, titlecase."""
+        from app.models import Transform
+
+        mapping = sample_mappings[0]
+        transforms = [
+            Transform(mapping_id=mapping.id, order=i, fn=fn)
+            for i, fn in enumerate(["trim", "lowercase", "uppercase", "titlecase"])
+        ]
+        db_session.add_all(transforms)
+        db_session.commit()
+        return mapping, transforms
+
+    def _chain(self, client, mapping_id):
+        response = client.get(f"/api/v1/mappings/{mapping_id}/transforms")
+        return [(t["fn"], t["order"]) for t in response.json()]
+
+    def test_reorder_transform(self, client, transform_chain, count_queries):
+        """Test moving a transform renumbers the chain in a single UPDATE."""
+        mapping, transforms = transform_chain
+
+        with count_queries() as queries:
+            response = client.post(f"/api/v1/transforms/{transforms[3].id}/reorder", params={"new_order": 1})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert sum(q.lstrip().upper().startswith("UPDATE") for q in queries) == 1
+        assert self._chain(client, mapping.id) == [
+            ("trim", 0), ("titlecase", 1), ("lowercase", 2), ("uppercase", 3)
+        ]
+
+    def test_delete_transform_closes_gap(self, client, transform_chain):
+        """Test deleting a transform renumbers the remaining ones."""
+        mapping, transforms = transform_chain
+
+        response = client.delete(f"/api/v1/transforms/{transforms[1].id}")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert self._chain(client, mapping.id) == [("trim", 0), ("uppercase", 1), ("titlecase", 2)]
+
+    def test_reorder_missing_transform(self, client):
+        """Test reordering a non-existent transform."""
+        response = client.post("/api/v1/transforms/99999/reorder", params={"new_order": 0})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_create_transform_appends_after_gap(self, client, db_session, transform_chain):
+        """Test a new transform goes after the highest order, not the row count."""
+        mapping, transforms = transform_chain
+        transforms[3].order = 7
+        db_session.commit()
+
+        response = client.post(f"/api/v1/mappings/{mapping.id}/transforms", json={"fn": "trim"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["order"] == 8
+
+    def test_create_first_transform(self, client, sample_mappings):
+        """Test the first transform on a mapping starts at order 0."""
+        response = client.post(f"/api/v1/mappings/{sample_mappings[1].id}/transforms", json={"fn": "trim"})
+
+        assert response.json()["order"] == 0
+
+    def test_create_transform_missing_mapping(self, client):
+        """Test adding a transform to a non-existent mapping."""
+        response = client.post("/api/v1/mappings/99999/transforms", json={"fn": "trim"})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_create_transform_single_lookup(self, client, sample_mappings, count_queries):
+        """Test existence and next order come from one SELECT, and the INSERT returns the row."""
+        mapping_id = sample_mappings[1].id
+
+        with count_queries() as queries:
+            client.post(f"/api/v1/mappings/{mapping_id}/transforms", json={"fn": "trim"})
+
+        selects = [q for q in queries if q.lstrip().upper().startswith("SELECT")]
+        assert len(selects) == 1
+        assert any("RETURNING" in q for q in queries)
@@ -78,6 +78,7 @@ class TestMappingServiceCRUD:
         mock_db.query.return_value = mock_query
         mock_query.options.return_value = mock_query
         mock_query.filter.return_value = mock_query
+        mock_query.order_by.return_value = mock_query
         mock_query.all.return_value = []
 
         result = mapping_service.get_mappings_for_dataset(dataset_id)
@@ -91,7 +92,7 @@ class TestMappingServiceCRUD:
         mock_mapping = Mock(spec=Mapping)
         mock_mapping.id = mapping_id
 
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_mapping
+        mock_db.get.return_value = mock_mapping
 
         from app.schemas.mapping import MappingUpdate
         update_data = MappingUpdate(
@@ -110,7 +111,7 @@ class TestMappingServiceCRUD:
 
     def test_update_mapping_not_found(self, mapping_service, mock_db):
         """Test updating non-existent mapping returns None."""
-        mock_db.query.return_value.filter.return_value.first.return_value = None
+        mock_db.get.return_value = None
 
         from app.schemas.mapping import MappingUpdate
         update_data = MappingUpdate(target_field="name")
@@ -124,7 +125,7 @@ class TestMappingServiceCRUD:
         mapping_id = 1
         mock_mapping = Mock(spec=Mapping)
 
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_mapping
+        mock_db.get.return_value = mock_mapping
 
         result = mapping_service.delete_mapping(mapping_id)
 
@@ -134,7 +135,7 @@ class TestMappingServiceCRUD:
 
     def test_delete_mapping_not_found(self, mapping_service, mock_db):
         """Test deleting non-existent mapping returns False."""
-        mock_db.query.return_value.filter.return_value.first.return_value = None
+        mock_db.get.return_value = None
 
         result = mapping_service.delete_mapping(99999)
 
@@ -0,0 +1,245 @@
+"""
+Tests for the data cleaning module.
+
+Validates:
+- Column name cleaning (parentheticals, trailing special characters)
+- Duplicate column suffixing
+- DataCleaner column mappings after renames and drops
+- Whitespace trimming counts
+- CleaningReport JSON output
+"""
+import json
+
+import polars as pl
+import pytest
+
+from app.cleaners import CleaningConfig, CleaningReport, CleaningResult, CleaningRule, DataCleaner
+from app.cleaners.rules.column_name import ColumnNameCleaningRule
+from app.cleaners.rules.whitespace import WhitespaceRule
+
+
+def _config(**overrides) -> CleaningConfig:
+    config = CleaningConfig.default()
+    for key, value in overrides.items():
+        setattr(config, key, value)
+    return config
+
+
+class TestColumnNameCleaning:
+    """Tests for ColumnNameCleaningRule name cleaning."""
+
+    @pytest.mark.parametrize("name, expected", [
+        ("Name (Contact)", "Name"),
+        ("Email (Work) (Opp)", "Email"),
+        ("Stage (All)*", "Stage"),
+        ("Amount*", "Amount"),
+        ("Notes#?", "Notes"),
+        ("Is Active?", "Is Active"),
+        ("Why? Because", "Why Because"),
+        ("a*b", "a*b"),
+        ("Total.*", "Total"),
+        ("Phone*\n", "Phone"),
+        ("  Full   Name  ", "Full Name"),
+        ("(Only parens)", "Unnamed"),
+        ("***", "Unnamed"),
+    ])
+    def test_default_config(self, name, expected):
+        """Test parentheticals and trailing special chars are removed."""
+        rule = ColumnNameCleaningRule(_config())
+        assert rule._clean_column_name(name) == expected
+
+    @pytest.mark.parametrize("name, expected", [
+        ("Phone*\n", "Phone\n"),
+        ("Phone\n*", "Phone\n"),
+        ("Phone*\n\n", "Phone*\n\n"),
+        ("Notes#?", "Notes"),
+        ("Why? Because", "Why Because"),
+        ("Name (Contact)*", "Name (Contact)"),
+    ])
+    def test_trailing_chars_without_parentheses(self, name, expected):
+        """Test the rstrip path: "$" also matches before one final newline."""
+        rule = ColumnNameCleaningRule(_config(
+            remove_parentheses=False, trim_column_names=False, normalize_spaces=False,
+        ))
+        assert rule._clean_column_name(name) == expected
+
+    def test_trailing_newline_with_parentheses(self):
+        """Test the fused pattern treats a final newline like the end of the name."""
+        rule = ColumnNameCleaningRule(_config(trim_column_names=False, normalize_spaces=False))
+        assert rule._clean_column_name("Phone (Work)*\n") == "Phone\n"
+
+    def test_clean_renames_only_changed_columns(self):
+        """Test unchanged headers keep their names and get no change entry."""
+        df = pl.DataFrame({"Name (Contact)": ["Ada"], "id": [1]})
+
+        result = ColumnNameCleaningRule(_config()).clean(df)
+
+        assert result.df.columns == ["Name", "id"]
+        assert [c.details for c in result.changes] == [{"old_name": "Name (Contact)", "new_name": "Name"}]
+        assert result.stats["columns_renamed"] == 1
+
+    def test_clean_already_clean_frame_is_untouched(self):
+        """Test a frame with clean headers is returned as-is."""
+        df = pl.DataFrame({"Name": ["Ada"], "id": [1]})
+
+        result = ColumnNameCleaningRule(_config()).clean(df)
+
+        assert result.df is df
+        assert result.changes == []
+
+
+class TestDuplicateColumns:
+    """Tests for duplicate column suffixing."""
+
+    def test_duplicates_get_numbered_suffixes(self):
+        """Test later duplicates are suffixed _2, _3 in column order."""
+        df = pl.DataFrame({"Email*": ["a"], "Email (Work)": ["b"], "Phone": ["c"], "Email": ["d"]})
+
+        result = ColumnNameCleaningRule(_config()).clean(df)
+
+        assert result.df.columns == ["Email", "Email_2", "Phone", "Email_3"]
+        assert result.warnings == [
+            "Duplicate column name 'Email' renamed to 'Email_2'",
+            "Duplicate column name 'Email' renamed to 'Email_3'",
+        ]
+        duplicate_changes = [c.details for c in result.changes if "renamed_to" in c.details]
+        assert duplicate_changes == [
+            {"original": "Email", "renamed_to": "Email_2", "occurrence": 2},
+            {"original": "Email", "renamed_to": "Email_3", "occurrence": 3},
+        ]
+
+
+class _DropNotesRule(CleaningRule):
+    """Drops the ``notes`` column, between name cleaning and whitespace."""
+
+    @property
+    def name(self) -> str:
+        return "Drop Notes"
+
+    @property
+    def priority(self) -> int:
+        return 25
+
+    def clean(self, df: pl.DataFrame) -> CleaningResult:
+        return CleaningResult(df=df.drop("notes"))
+
+
+class TestDataCleaner:
+    """Tests for DataCleaner orchestration and column mappings."""
+
+    @pytest.fixture
+    def cleaner(self):
+        config = _config()
+        cleaner = DataCleaner(config)
+        cleaner.register_rules([WhitespaceRule(config), _DropNotesRule(), ColumnNameCleaningRule(config)])
+        return cleaner
+
+    def test_column_mappings_after_renames_and_drops(self, cleaner):
+        """Test renamed columns map to their new names and dropped ones are listed."""
+        df = pl.DataFrame({"Name (Contact)": [" Ada "], "Email*": ["a@x"], "notes": ["n"], "id": [1]})
+
+        cleaned, report = cleaner.clean(df)
+
+        assert cleaned.columns == ["Name", "Email", "id"]
+        assert report.column_mappings == {"id": "id", "Name (Contact)": "Name", "Email*": "Email"}
+        # Mapping is approximate: originals missing from the output are listed
+        # as dropped even when a rename explains them
+        assert report.columns_dropped == ["Name (Contact)", "Email*", "notes"]
+        assert report.original_shape == (1, 4)
+        assert report.cleaned_shape == (1, 3)
+        assert report.columns_renamed == 2
+
+    def test_input_frame_is_not_modified(self, cleaner):
+        """Test the caller's frame keeps its columns and values."""
+        df = pl.DataFrame({"Name (Contact)": [" Ada "], "notes": ["n"]})
+
+        cleaner.clean(df)
+
+        assert df.columns == ["Name (Contact)", "notes"]
+        assert df["Name (Contact)"].to_list() == [" Ada "]
+
+
+class TestWhitespaceRule:
+    """Tests for WhitespaceRule."""
+
+    def test_values_modified_per_column(self):
+        """Test counts cover only changed, non-null values of string columns."""
+        df = pl.DataFrame({
+            "name": [" Ada", "Grace ", "Alan", None],
+            "city": ["London", "NYC", None, "Paris"],
+            "notes": ["  a  ", "b", " ", None],
+            "n": [1, 2, 3, 4],
+        })
+
+        result = WhitespaceRule(_config()).clean(df)
+
+        assert [c.details for c in result.changes] == [
+            {"column": "name", "values_modified": 2},
+            {"column": "notes", "values_modified": 2},
+        ]
+        assert result.stats == {"columns_cleaned": 2, "values_cleaned": 4, "total_columns": 4}
+        assert result.df["name"].to_list() == ["Ada", "Grace", "Alan", None]
+        assert result.df["notes"].to_list() == ["a", "b", "", None]
+        assert result.df["city"].to_list() == ["London", "NYC", None, "Paris"]
+
+    def test_internal_spaces_normalised_when_enabled(self):
+        """Test internal runs count as changes only with normalize_internal_spaces."""
+        df = pl.DataFrame({"name": ["Ada  Lovelace", "Grace"]})
+
+        default = WhitespaceRule(_config()).clean(df)
+        normalised = WhitespaceRule(_config(normalize_internal_spaces=True)).clean(df)
+
+        assert default.changes == []
+        assert default.df is df
+        assert [c.details["values_modified"] for c in normalised.changes] == [1]
+        assert normalised.df["name"].to_list() == ["Ada Lovelace", "Grace"]
+
+
+class TestCleaningReport:
+    """Tests for CleaningReport serialisation."""
+
+    @pytest.fixture
+    def report(self):
+        report = CleaningReport(
+            original_shape=(10, 3),
+            cleaned_shape=(8, 2),
+            timestamp="2024-01-01T00:00:00",
+        )
+        report.column_mappings = {"Name (Contact)": "Name", "id": "id"}
+        report.columns_dropped = ["notes"]
+        report.add_rule_stats("Whitespace Trimming", {"values_cleaned": 3})
+        report.add_change({"type": "column_renamed", "details": {"old_name": "Name (Contact)", "new_name": "Name"}})
+        report.add_warning("[Rule] Café header")
+        return report
+
+    def test_to_json(self, report):
+        """Test the default output is 2-space indented JSON of to_dict()."""
+        output = report.to_json()
+
+        assert json.loads(output) == report.to_dict()
+        assert output.startswith('{\n  "timestamp": "2024-01-01T00:00:00",\n  "original_shape": {\n    "rows": 10,')
+        assert '"warnings": [\n    "[Rule] Café header"\n  ]' in output
+        assert json.loads(output)["summary"] == {
+            "rows_removed": 2,
+            "columns_removed": 1,
+            "columns_renamed": 1,
+            "warnings_count": 1,
+        }
+
+    def test_to_json_compact_and_custom_indent(self, report):
+        """Test indent=None is compact and other indents still work."""
+        assert report.to_json(None).startswith('{"timestamp":"2024-01-01T00:00:00","original_shape":{"rows":10,')
+        assert report.to_json(4).startswith('{\n    "timestamp"')
+
+    def test_to_json_non_string_keys(self, report):
+        """Test non-string keys in stats are serialised as strings."""
+        report.add_rule_stats("Header Detection", {1: "row"})
+
+        assert json.loads(report.to_json())["rule_stats"]["Header Detection"] == {"1": "row"}
+
+    def test_to_dict_reflects_in_place_edits(self, report):
+        """Test summary counts follow edits made after an earlier to_dict()."""
+        report.to_dict()
+        report.columns_dropped.append("extra")
+
+        assert report.to_dict()["summary"]["columns_removed"] == 2
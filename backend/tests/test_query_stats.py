@@ -0,0 +1,106 @@
+"""
+Tests for the per-request SQL query instrumentation.
+
+Tests cover:
+1. Query count/time headers on responses
+2. Warning log above the threshold
+3. No-op when disabled
+"""
+import sys
+from pathlib import Path
+
+# Add backend directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+
+from app.core import query_stats
+from app.core.config import settings
+
+
+@pytest.fixture
+def engine():
+    return create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+
+@pytest.fixture
+def make_app(engine, monkeypatch):
+    """Build a throwaway app whose endpoints run ``n`` queries."""
+    def _make(enabled=True, threshold=20):
+        monkeypatch.setattr(settings, "QUERY_STATS_ENABLED", enabled)
+        monkeypatch.setattr(settings, "DEBUG", False)
+        monkeypatch.setattr(settings, "QUERY_COUNT_WARN_THRESHOLD", threshold)
+
+        app = FastAPI()
+
+        @app.get("/async/{n}")
+        async def run_async(n: int):
+            with engine.connect() as conn:
+                for _ in range(n):
+                    conn.execute(text("SELECT 1"))
+            return {"ok": True}
+
+        @app.get("/sync/{n}")
+        def run_sync(n: int):
+            with engine.connect() as conn:
+                for _ in range(n):
+                    conn.execute(text("SELECT 1"))
+            return {"ok": True}
+
+        query_stats.install_query_stats(app)
+        return TestClient(app)
+
+    yield _make
+
+    for name, fn in (
+        ("before_cursor_execute", query_stats._before_cursor_execute),
+        ("after_cursor_execute", query_stats._after_cursor_execute),
+    ):
+        if event.contains(Engine, name, fn):
+            event.remove(Engine, name, fn)
+
+
+@pytest.mark.parametrize("kind", ["async", "sync"])
+def test_query_count_headers(make_app, kind):
+    """Async and threadpool handlers both report their query counts."""
+    client = make_app()
+
+    response = client.get(f"/{kind}/3")
+
+    assert response.status_code == 200
+    assert response.headers["x-db-query-count"] == "3"
+    assert float(response.headers["x-db-query-ms"]) >= 0.0
+    assert client.get(f"/{kind}/0").headers["x-db-query-count"] == "0"
+
+
+def test_warns_above_threshold(make_app, caplog):
+    """Requests over the threshold are logged."""
+    client = make_app(threshold=2)
+
+    with caplog.at_level(logging.WARNING, logger="app.core.query_stats"):
+        client.get("/async/2")
+        assert not caplog.records
+        client.get("/async/3")
+
+    assert "GET /async/3 issued 3 SQL queries" in caplog.text
+
+
+def test_disabled_is_noop(make_app):
+    """Nothing is installed when instrumentation is off."""
+    client = make_app(enabled=False)
+
+    response = client.get("/async/2")
+
+    assert "x-db-query-count" not in response.headers
+    assert not event.contains(Engine, "before_cursor_execute", query_stats._before_cursor_execute)
@@ -0,0 +1,173 @@
+"""
+Tests for the SQLite repository adapters.
+
+Tests cover:
+1. Dataset DataFrame loading (CSV and Excel)
+2. Parsed-frame cache invalidation on file rewrite
+3. Column projection
+4. Exception listing, counting and clearing
+"""
+import os
+import sys
+from pathlib import Path
+
+# Add backend directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+import polars as pl
+from app.core.database import Base
+from app.models.source import Dataset, SourceFile
+from app.adapters.repositories_sqlite import SQLiteDatasetsRepo, SQLiteExceptionsRepo
+
+
+@pytest.fixture
+def db_session():
+    """Create a test database session."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+def _make_dataset(db_session, path: Path) -> Dataset:
+    source_file = SourceFile(
+        path=str(path),
+        mime_type="application/octet-stream",
+        original_filename=path.name,
+    )
+    db_session.add(source_file)
+    db_session.flush()
+
+    dataset = Dataset(name="Test Dataset", source_file_id=source_file.id)
+    db_session.add(dataset)
+    db_session.flush()
+    return dataset
+
+
+def test_get_dataframe_csv(db_session, tmp_path):
+    """CSV source files are loaded into a Polars DataFrame."""
+    csv_path = tmp_path / "customers.csv"
+    pl.DataFrame({"name": ["Acme", "Globex"], "city": ["Paris", "Oslo"]}).write_csv(csv_path)
+    dataset = _make_dataset(db_session, csv_path)
+
+    df = SQLiteDatasetsRepo(db_session).get_dataframe(dataset.id)
+
+    assert df.columns == ["name", "city"]
+    assert df["name"].to_list() == ["Acme", "Globex"]
+
+
+def test_get_dataframe_column_projection(db_session, tmp_path):
+    """Only the requested columns are returned, in the requested order."""
+    csv_path = tmp_path / "wide.csv"
+    pl.DataFrame({"a": [1], "b": [2], "c": [3]}).write_csv(csv_path)
+    dataset = _make_dataset(db_session, csv_path)
+    repo = SQLiteDatasetsRepo(db_session)
+
+    assert repo.get_dataframe(dataset.id, columns=["c", "a"]).columns == ["c", "a"]
+    assert repo.get_dataframe(dataset.id).columns == ["a", "b", "c"]
+
+
+def test_get_dataframe_excel_first_and_named_sheet(db_session, tmp_path):
+    """Excel files return the first sheet by default, or the requested sheet."""
+    pd = pytest.importorskip("pandas")
+    xlsx_path = tmp_path / "book.xlsx"
+    with pd.ExcelWriter(xlsx_path) as writer:
+        pd.DataFrame({"a": [1, 2]}).to_excel(writer, sheet_name="First", index=False)
+        pd.DataFrame({"b": ["x"]}).to_excel(writer, sheet_name="Second", index=False)
+    dataset = _make_dataset(db_session, xlsx_path)
+    repo = SQLiteDatasetsRepo(db_session)
+
+    first = repo.get_dataframe(dataset.id)
+    assert isinstance(first, pl.DataFrame)
+    assert first.columns == ["a"]
+
+    second = repo.get_dataframe(dataset.id, sheet_name="Second")
+    assert second["b"].to_list() == ["x"]
+
+
+def test_get_dataframe_corrupted_workbook(db_session, tmp_path):
+    """Unreadable workbooks surface the reader error instead of a silent fallback."""
+    fastexcel = pytest.importorskip("fastexcel")
+    xlsx_path = tmp_path / "broken.xlsx"
+    xlsx_path.write_bytes(b"not a workbook")
+    dataset = _make_dataset(db_session, xlsx_path)
+
+    with pytest.raises(fastexcel.FastExcelError):
+        SQLiteDatasetsRepo(db_session).get_dataframe(dataset.id)
+
+
+def test_get_dataframe_cache_invalidated_on_rewrite(db_session, tmp_path):
+    """A rewritten file is re-parsed; cached frames are not mutated by callers."""
+    csv_path = tmp_path / "cleaned.csv"
+    pl.DataFrame({"name": ["old"]}).write_csv(csv_path)
+    dataset = _make_dataset(db_session, csv_path)
+    repo = SQLiteDatasetsRepo(db_session)
+
+    first = repo.get_dataframe(dataset.id)
+    first.insert_column(1, pl.Series("extra", [1]))
+    assert repo.get_dataframe(dataset.id).columns == ["name"]
+
+    pl.DataFrame({"name": ["new"]}).write_csv(csv_path)
+    stat = csv_path.stat()
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert repo.get_dataframe(dataset.id)["name"].to_list() == ["new"]
+
+
+def test_get_dataframe_unknown_dataset(db_session):
+    """Missing datasets raise ValueError."""
+    with pytest.raises(ValueError):
+        SQLiteDatasetsRepo(db_session).get_dataframe(999)
+
+
+def test_get_dataframe_unsupported_extension(db_session, tmp_path):
+    """Unknown file types raise ValueError."""
+    path = tmp_path / "notes.txt"
+    path.write_text("hello")
+    dataset = _make_dataset(db_session, path)
+
+    with pytest.raises(ValueError, match="Unsupported file format"):
+        SQLiteDatasetsRepo(db_session).get_dataframe(dataset.id)
+
+
+@pytest.fixture
+def exceptions_repo(db_session, tmp_path):
+    """Exceptions repo seeded with three exceptions across two models."""
+    dataset = _make_dataset(db_session, tmp_path / "data.csv")
+    repo = SQLiteExceptionsRepo(db_session)
+    repo.add(dataset.id, "res.partner", "row_1", "REQ_MISSING", "Name required", {"name": None})
+    repo.add(dataset.id, "res.partner", "row_2", "ENUM_UNKNOWN", "Bad type", {"type": "x"})
+    repo.add(dataset.id, "crm.lead", "row_3", "FK_UNRESOLVED", "No partner", {"partner": "y"})
+    db_session.commit()
+    repo.dataset_id = dataset.id
+    return repo
+
+
+def test_exceptions_list(exceptions_repo):
+    """Listing returns plain dicts with ISO timestamps, filterable by model."""
+    exceptions = exceptions_repo.list(exceptions_repo.dataset_id)
+    assert len(exceptions) == 3
+    assert {e["row_ptr"] for e in exceptions} == {"row_1", "row_2", "row_3"}
+    assert isinstance(exceptions[0]["created_at"], str)
+
+    partner_only = exceptions_repo.list(exceptions_repo.dataset_id, model="res.partner")
+    assert [e["model"] for e in partner_only] == ["res.partner", "res.partner"]
+    offending = {e["row_ptr"]: e["offending"] for e in partner_only}
+    assert offending["row_1"] == {"name": None}
+
+
+def test_exceptions_count_and_clear(exceptions_repo):
+    """Count and clear respect the optional model filter."""
+    dataset_id = exceptions_repo.dataset_id
+    assert exceptions_repo.count(dataset_id) == 3
+    assert exceptions_repo.count(dataset_id, model="crm.lead") == 1
+
+    assert exceptions_repo.clear(dataset_id, model="res.partner") == 2
+    assert exceptions_repo.count(dataset_id) == 1
+    assert exceptions_repo.clear(dataset_id) == 1
+    assert exceptions_repo.list(dataset_id) == []
@@ -0,0 +1,83 @@
+"""
+Tests for the inline task runner.
+
+Tests cover:
+1. Inline execution
+2. Background execution of blocking callables and coroutine functions
+3. Failure propagation and shutdown
+"""
+import sys
+from pathlib import Path
+
+# Add backend directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import asyncio
+import time
+
+import pytest
+from app.adapters.tasks_inline import InlineTaskRunner
+from app.ports.tasks import TaskStatus
+
+
+def _double(x):
+    time.sleep(0.05)
+    return x * 2
+
+
+async def _increment(x):
+    await asyncio.sleep(0.05)
+    return x + 1
+
+
+def _fail():
+    raise ValueError("boom")
+
+
+def test_inline_mode_runs_immediately():
+    runner = InlineTaskRunner()
+    task_id = runner.submit(_double, 3, task_id="t1")
+
+    assert task_id == "t1"
+    assert runner.status(task_id) == TaskStatus.COMPLETED
+    assert runner.result(task_id) == 6
+
+
+def test_thread_mode_blocking_and_coroutine_tasks():
+    runner = InlineTaskRunner(mode="thread", max_workers=2)
+    try:
+        blocking = runner.submit(_double, 2)
+        coroutine = runner.submit(_increment, 2)
+
+        assert runner.result(blocking, timeout=5) == 4
+        assert runner.result(coroutine, timeout=5) == 3
+        assert runner.status(blocking) == TaskStatus.COMPLETED
+        assert runner.status(coroutine) == TaskStatus.COMPLETED
+    finally:
+        runner.shutdown()
+
+
+def test_thread_mode_failure():
+    runner = InlineTaskRunner(mode="thread")
+    try:
+        task_id = runner.submit(_fail)
+        with pytest.raises(RuntimeError, match="boom"):
+            runner.result(task_id, timeout=5)
+        assert runner.status(task_id) == TaskStatus.FAILED
+    finally:
+        runner.shutdown()
+
+
+def test_shutdown_waits_for_pending_tasks():
+    runner = InlineTaskRunner(mode="thread")
+    task_id = runner.submit(_double, 5)
+    runner.shutdown()
+
+    assert runner.status(task_id) == TaskStatus.COMPLETED
+    assert runner.result(task_id) == 10
+
+
+def test_unknown_task():
+    runner = InlineTaskRunner()
+    with pytest.raises(ValueError):
+        runner.status("missing")